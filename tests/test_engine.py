@@ -11,6 +11,7 @@ from ultralytics.cfg import get_cfg
 from ultralytics.engine.exporter import Exporter
 from ultralytics.models.yolo import classify, detect, segment
 from ultralytics.utils import ASSETS, DEFAULT_CFG, WEIGHTS_DIR
+from ultralytics.utils.patches import torch_load
 
 
 def test_func(*args, **kwargs):
@@ -67,6 +68,23 @@ def test_detect():
     raise Exception("Resume test failed!")
 
 
+def test_detect_val_async(tmp_path):
+    """Test background validation on EMA snapshots with a stratified val subset for intermediate epochs."""
+    overrides = {"data": "coco8.yaml", "model": "yolo11n.yaml", "imgsz": 32, "epochs": 3, "project": tmp_path}
+    trainer = detect.DetectionTrainer(overrides={**overrides, "val_async": True, "val_fraction": 0.5, "save_period": 1})
+    trainer.train()
+    subset = trainer.val_subset_loader.dataset
+    assert 0 < len(subset) < len(trainer.test_loader.dataset)
+    assert {int(c) for lb in subset.labels for c in lb["cls"]} == {
+        int(c) for lb in trainer.test_loader.dataset.labels for c in lb["cls"]
+    }  # every class is still represented
+    results = trainer.read_results_csv()
+    assert results["epoch"] == [1, 2, 3]  # rows are written in order once each validation finishes
+    assert trainer.best.exists()
+    ckpt = torch_load(trainer.wdir / "epoch0.pt")  # rewritten once its background validation was collected
+    assert ckpt["train_results"]["epoch"] == [1]  # saved with its own results.csv row
+
+
 def test_segment():
     """Test image segmentation training, validation, and prediction pipelines using YOLO models."""
     overrides = {
@@ -12,7 +12,7 @@ import pytest
 from tests import MODEL, SOURCE
 from ultralytics import YOLO
 from ultralytics.cfg import TASK2DATA, TASK2MODEL, TASKS
-from ultralytics.utils import ARM64, IS_RASPBERRYPI, LINUX, MACOS, WINDOWS, checks
+from ultralytics.utils import ARM64, IS_RASPBERRYPI, LINUX, MACOS, ROOT, WINDOWS, checks
 from ultralytics.utils.torch_utils import TORCH_1_10, TORCH_1_11, TORCH_1_13, TORCH_2_1, TORCH_2_8, TORCH_2_9
 
 
@@ -28,6 +28,38 @@ def test_export_onnx():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+def test_export_onnx_runtime_sessions():
+    """Test ONNX Runtime IO binding and pooled sessions in AutoBackend match default session inference."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = YOLO(MODEL).export(format="onnx", imgsz=32)
+    im = torch.rand(1, 3, 32, 32)
+    y = AutoBackend(file, runtime={"io_binding": False})(im)
+    model = AutoBackend(file, runtime={"threads": 1, "sessions": 2, "optimize": "extended"})
+    assert model.use_io_binding and model.session_pool.qsize() == 2
+    with ThreadPoolExecutor(2) as pool:
+        for yi in pool.map(model, [im] * 4):
+            assert torch.allclose(yi, y, atol=1e-4)
+
+
+@pytest.mark.parametrize("cfg", sorted((ROOT.parent / "configs").glob("yolo11_dual_*.yaml")))
+def test_export_onnx_dual_stream(cfg):
+    """Test dual-stream model export to a single static ONNX graph with 4-band input metadata."""
+    import numpy as np
+    import onnx
+
+    model = YOLO(cfg)
+    file = model.export(format="onnx", imgsz=64)
+    graph = onnx.load(file)
+    assert [d.dim_value for d in graph.graph.input[0].type.tensor_type.shape.dim] == [1, 4, 64, 64]
+    assert {p.key: p.value for p in graph.metadata_props}["channels"] == "4"
+    YOLO(file)(np.zeros((64, 64, 4), dtype=np.uint8), imgsz=64)  # exported model inference on stacked BGR+NDVI
+
+
 @pytest.mark.skipif(not TORCH_2_1, reason="OpenVINO requires torch>=2.1")
 def test_export_openvino():
     """Test YOLO export to OpenVINO format for model inference compatibility."""
@@ -17,6 +17,7 @@ from ultralytics import RTDETR, YOLO
 from ultralytics.cfg import TASK2DATA, TASKS
 from ultralytics.data.build import load_inference_source
 from ultralytics.data.utils import check_det_dataset
+from ultralytics.models.yolo.detect import DetectionPredictor
 from ultralytics.utils import (
     ARM64,
     ASSETS,
@@ -194,6 +195,30 @@ def test_track_stream(model, tmp_path):
         model.track(video_url, imgsz=160, tracker=custom_yaml)
 
 
+def test_trackers_multi_update():
+    """Test that batched Kalman updates and track boxes match the per-track implementations."""
+    from ultralytics.trackers.bot_sort import BOTrack
+    from ultralytics.trackers.byte_tracker import STrack
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH, KalmanFilterXYWH
+
+    for cls, kf in ((STrack, KalmanFilterXYAH()), (BOTrack, KalmanFilterXYWH())):
+        tracks = [cls([50 + 10 * i, 60, 20, 30 + i, i], 0.9, 0) for i in range(5)]
+        for t in tracks:
+            t.activate(kf, frame_id=1)
+        cls.multi_predict(tracks)
+        copies = [cls([50 + 10 * i, 60, 20, 30 + i, i], 0.9, 0) for i in range(5)]
+        for c, t in zip(copies, tracks):
+            c.kalman_filter, c.mean, c.covariance, c.state = kf, t.mean.copy(), t.covariance.copy(), t.state
+        dets = [cls([52 + 10 * i, 61, 21, 31 + i, i], 0.8, 1) for i in range(5)]
+        cls.multi_update(tracks, dets, frame_id=2)
+        for c, d in zip(copies, dets):
+            c.update(d, frame_id=2)
+        for c, t in zip(copies, tracks):
+            assert np.allclose(c.mean, t.mean) and np.allclose(c.covariance, t.covariance)
+            assert (c.tracklet_len, c.frame_id, c.cls) == (t.tracklet_len, t.frame_id, t.cls)
+        assert np.allclose(cls.multi_boxes(tracks + dets), [t.xyxy for t in tracks + dets])
+
+
 @pytest.mark.parametrize("task,weight,data", TASK_MODEL_DATA)
 def test_val(task: str, weight: str, data: str) -> None:
     """Test the validation mode of the YOLO model."""
@@ -277,6 +302,48 @@ def test_predict_callback_and_setup():
         print(boxes)
 
 
+def test_predict_pipeline():
+    """Test that pipelined prediction matches sequential prediction in order, results and callbacks."""
+    model = YOLO(MODEL)
+    batches = []
+    model.add_callback("on_predict_batch_end", lambda p: batches.append([str(r.path) for r in p.results]))
+    sequential = model.predict(ASSETS, batch=2, imgsz=64)
+    pipelined = model.predict(ASSETS, batch=2, imgsz=64, pipeline=True)
+    assert [r.path for r in pipelined] == [r.path for r in sequential]
+    assert all(torch.allclose(a.boxes.data, b.boxes.data) for a, b in zip(sequential, pipelined))
+    assert batches[: len(batches) // 2] == batches[len(batches) // 2 :]  # callbacks see the same batches in order
+
+
+@pytest.mark.parametrize("channels", [3, 4])
+def test_predict_letterbox_batch(channels):
+    """Test that the batched letterbox buffer matches per-image letterboxing, stacking and normalization."""
+    predictor = DetectionPredictor(overrides={"imgsz": 64})
+    predictor.setup_model(MODEL)
+    predictor.imgsz = [64, 64]
+    ims = [np.random.randint(0, 255, (h, 48, channels), dtype=np.uint8) for h in (32, 80)]
+    expected = np.stack(predictor.pre_transform(ims))
+    if channels == 3:
+        expected = expected[..., ::-1]  # BGR to RGB
+    expected = torch.from_numpy(np.ascontiguousarray(expected.transpose((0, 3, 1, 2)))).float() / 255
+    for _ in range(2):  # second pass reuses the buffer
+        assert torch.equal(predictor.preprocess(ims).cpu().float(), expected)
+    assert predictor.letterbox_batch(ims[:1]).data_ptr() == predictor._buffers.buf.data_ptr()
+
+
+def test_predict_tiles():
+    """Test sliced inference maps tile detections back to full-image coordinates and reuses the tile grid."""
+    model = YOLO(MODEL)
+    im = cv2.imread(str(ASSETS / "bus.jpg"))  # 1080x810
+    results = model.predict([im, im], imgsz=320, tile=320, tile_overlap=0.25)
+    grid = model.predictor.tile_grid(im.shape[:2])
+    assert len(model.predictor._tile_grids) == 1 and (grid[:, 2:] - grid[:, :2] == 320).all()
+    assert grid[:, 2].max() == im.shape[1] and grid[:, 3].max() == im.shape[0]  # tiles cover the whole image
+    for r in results:
+        assert r.orig_shape == im.shape[:2] and len(r.boxes)
+        assert (r.boxes.xyxy[:, 2] <= im.shape[1]).all() and (r.boxes.xyxy[:, 3] <= im.shape[0]).all()
+    assert torch.equal(results[0].boxes.data, results[1].boxes.data)
+
+
 @pytest.mark.parametrize("model", MODELS)
 def test_results(model: str, tmp_path):
     """Test YOLO model results processing and output in various formats."""
@@ -297,6 +364,27 @@ def test_results(model: str, tmp_path):
         print(r, len(r), r.path)  # print after methods
 
 
+def test_results_batch():
+    """Test columnar BatchResults against per-image Results from the same batch."""
+    from ultralytics.engine.results import BatchResults
+
+    im = cv2.imread(str(SOURCE))
+    model = YOLO(MODEL)
+    results = model([im, im[::2, ::2]], imgsz=160)
+    batch = model([im, im[::2, ::2]], imgsz=160, batch=2, batch_results=True, retain_imgs=False)
+    assert len(batch) == 1 and isinstance(batch[0], BatchResults)
+    batch = batch[0]
+    assert batch.orig_imgs is None and len(batch) == len(results) == 2
+    for r, v in zip(results, batch):
+        assert v.orig_img is None and v.orig_shape == r.orig_shape
+        assert torch.allclose(v.boxes.data, r.boxes.data, atol=1e-3)
+    columns = batch.numpy().columns(normalize=True)
+    assert len(columns["image"]) == sum(len(r) for r in results)
+    assert columns["name"].tolist() == [r.names[int(c)] for r in results for c in r.boxes.cls]
+    assert len(batch.summary()) == len(columns["image"])
+    batch.to_csv()
+
+
 def test_labels_and_crops():
     """Test output from prediction args for saving YOLO detection labels and crops."""
     imgs = [SOURCE, ASSETS / "zidane.jpg"]
@@ -453,6 +541,20 @@ def test_utils_benchmarks():
     ProfileModels(["yolo11n.yaml"], imgsz=32, min_time=1, num_timed_runs=3, num_warmup_runs=1).run()
 
 
+def test_utils_benchmarks_streams(tmp_path):
+    """Profile a dual-stream config stage by stage with 'ProfileStreams' and check the saved JSON results."""
+    import json
+
+    from ultralytics.utils.benchmarks import ProfileStreams
+
+    save = tmp_path / "streams.json"
+    cfg = str(ROOT.parent / "configs" / "yolo11_dual_rectify.yaml")
+    ProfileStreams([cfg], imgsz=64, batch_sizes=(1, 2), num_timed_runs=3, num_warmup_runs=1, save=save).run()
+    r = json.loads(save.read_text())["results"][0]
+    assert {"preprocess", "branch_rgb", "branch_ndvi", "fusion", "head", "nms"} <= set(r["stages"])
+    assert set(r["throughput(im/s)"]) == {"1", "2"} and r["memory/peak_rss_delta(MB)"] >= 0
+
+
 def test_utils_torchutils():
     """Test Torch utility functions including profiling and FLOP calculations."""
     from ultralytics.nn.modules.conv import Conv
@@ -466,6 +568,68 @@ def test_utils_torchutils():
     time_sync()
 
 
+def test_utils_model_ema():
+    """Test foreach ModelEMA updates against a per-tensor reference, with and without an update interval."""
+    from copy import deepcopy
+
+    from ultralytics.nn.modules.conv import Conv
+    from ultralytics.utils.torch_utils import ModelEMA
+
+    model = Conv(8, 8, k=3)
+    ref = deepcopy(model).eval()
+    ema, ema2 = ModelEMA(model, tau=2), ModelEMA(model, tau=2, interval=2)
+    for i in range(1, 5):
+        with torch.no_grad():
+            for p in model.parameters():
+                p.add_(torch.randn_like(p))
+            model.bn.running_mean.add_(1.0)
+        d = ema.decay(i)
+        msd = model.state_dict()
+        for k, v in ref.state_dict().items():
+            if v.dtype.is_floating_point:
+                v.mul_(d).add_(msd[k], alpha=1 - d)
+        ema.update(model)
+        ema2.update(model)
+        for k, v in ref.state_dict().items():
+            assert torch.allclose(ema.ema.state_dict()[k], v, atol=1e-5)
+        if i % 2 == 0:  # interval steps compound the decay of skipped updates and blend in the latest model only
+            assert ema2._pending == 1.0
+        else:
+            assert ema2._pending == pytest.approx(ema2.decay(i))
+    ema2.update(model)
+    ema2.update_attr(model)  # flushes the pending update
+    assert ema2._pending == 1.0 and ema2.updates == 5
+
+
+def test_utils_metrics_streaming():
+    """Test that binned streaming mAP accumulation matches exact metrics and merges across shards."""
+    from ultralytics.utils.metrics import DetMetrics
+
+    rng = np.random.default_rng(0)
+    names = {i: str(i) for i in range(3)}
+    batches = [
+        {
+            "tp": rng.random((50, 10)) < np.linspace(0.8, 0.2, 10),
+            "conf": rng.random(50),
+            "pred_cls": rng.integers(0, 3, 50).astype(float),
+            "target_cls": rng.integers(0, 3, 20).astype(float),
+            "target_img": np.arange(3).astype(float),
+        }
+        for _ in range(4)
+    ]
+    exact, binned = DetMetrics(names), DetMetrics(names, bins=10000)
+    shards = [DetMetrics(names, bins=10000) for _ in range(2)]
+    for i, batch in enumerate(batches):
+        for m in exact, binned, shards[i % 2]:
+            m.update_stats(batch)
+    shards[0].merge_stats([m.accumulator for m in shards])
+    for m in exact, binned, shards[0]:
+        m.process()
+    assert np.allclose(binned.mean_results(), exact.mean_results(), atol=1e-2)
+    assert np.allclose(shards[0].mean_results(), binned.mean_results())
+    assert (binned.nt_per_class == exact.nt_per_class).all()
+
+
 def test_utils_ops():
     """Test utility operations for coordinate transformations and normalizations."""
     from ultralytics.utils.ops import (
@@ -775,3 +939,388 @@ def test_grayscale(task: str, model: str, data: str, tmp_path) -> None:
 
     model = YOLO(export_model, task=task)
     model.predict(source=im, imgsz=32)
+
+
+def _make_rgb_ndvi_dataset(root: Path, n: int = 4, shape: tuple[int, int] = (96, 128)) -> Path:
+    """Create a tiny paired 'dataset_raw'/'dataset_ndvi' detection dataset and return the RGB train images dir."""
+    im_dir, lb_dir = root / "dataset_raw" / "images" / "train", root / "dataset_raw" / "labels" / "train"
+    ndvi_dir = root / "dataset_ndvi" / "images" / "train"
+    for d in im_dir, lb_dir, ndvi_dir:
+        d.mkdir(parents=True, exist_ok=True)
+    for i in range(n):
+        cv2.imwrite(str(im_dir / f"im{i}.jpg"), np.full((*shape, 3), 50 + i, dtype=np.uint8))
+        cv2.imwrite(str(ndvi_dir / f"im{i}.png"), np.full((shape[0] // 2, shape[1] // 2), 200, dtype=np.uint8))
+        (lb_dir / f"im{i}.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+    return im_dir
+
+
+def test_data_multispectral_load_image(tmp_path):
+    """Test that RGB + auxiliary band images are stacked, resized to imgsz and cached like regular images."""
+    from ultralytics.data.dataset import YOLODataset
+    from ultralytics.data.utils import load_dataset_cache_file
+
+    im_dir = _make_rgb_ndvi_dataset(tmp_path)
+    bands = [{"path": str(tmp_path / "dataset_ndvi"), "suffixes": [".tif", ".png"]}]
+    data = {"names": {0: "melon"}, "channels": 4, "path": str(tmp_path / "dataset_raw"), "bands": bands}
+    dataset = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=False, cache="ram")
+    im, hw0, hw = dataset.load_image(0)
+    assert im.shape == (48, 64, 4) and hw0 == (96, 128) and hw == (48, 64)
+    assert (im[..., 3] == 200).all()
+    assert dataset.ims[0] is not None  # cached in RAM after stacking
+
+    # Band files are resolved once and stored in labels.cache
+    cache = load_dataset_cache_file(tmp_path / "dataset_raw" / "labels" / "train.cache")
+    assert all(Path(lb["aux_files"][0]).suffix == ".png" for lb in cache["labels"])
+
+    # Changing the band suffixes invalidates labels.cache
+    for f in (tmp_path / "dataset_ndvi" / "images" / "train").glob("*.png"):
+        cv2.imwrite(str(f.with_suffix(".jpg")), np.full((48, 64), 100, dtype=np.uint8))
+    bands[0]["suffixes"] = [".jpg", ".png"]
+    dataset = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=False)
+    assert all(Path(f).suffix == ".jpg" for i in range(dataset.ni) for f in dataset.labels.aux_files_of(i))
+
+
+def test_data_label_store():
+    """Test that LabelStore round-trips label dicts and supports reordering, class filtering and dropping segments."""
+    from ultralytics.data.utils import LabelStore
+
+    def label(i, n, segments=True):
+        """Return a label dict for image i with n instances."""
+        return {
+            "im_file": f"images/im{i}_ü.jpg",
+            "shape": (100 + i, 200),
+            "cls": np.arange(n, dtype=np.float32).reshape(-1, 1),
+            "bboxes": np.full((n, 4), i / 10, dtype=np.float32),
+            "segments": [np.full((3 + j, 2), j, dtype=np.float32) for j in range(n)] if segments else [],
+            "keypoints": None,
+            "normalized": True,
+            "bbox_format": "xywh",
+            "aux_files": [f"ndvi/im{i}.png"],
+        }
+
+    labels = [label(0, 2), label(1, 0), label(2, 3, segments=False), label(3, 1)]
+    store = LabelStore(labels)
+    assert len(store) == 4 and store.im_files == [lb["im_file"] for lb in labels]
+    for a, b in zip(store, labels):
+        assert a["im_file"] == b["im_file"] and a["shape"] == b["shape"] and a["aux_files"] == b["aux_files"]
+        assert (a["cls"] == b["cls"]).all() and (a["bboxes"] == b["bboxes"]).all()
+        assert len(a["segments"]) == len(b["segments"])
+        assert all((x == y).all() for x, y in zip(a["segments"], b["segments"]))
+    assert store.aux_files_of(2) == ["ndvi/im2.png"]
+    store[0]["cls"][:] = 5  # returned arrays are copies
+    assert store[0]["cls"].max() == 1
+
+    reordered = store[[3, 0, 2]]
+    assert [lb["im_file"] for lb in reordered] == [labels[i]["im_file"] for i in (3, 0, 2)]
+    assert reordered[1]["segments"][1].shape == (4, 2) and reordered[2]["segments"] == []
+
+    filtered = store.filter(include_class=[1], single_cls=True)
+    assert [len(lb["cls"]) for lb in filtered] == [1, 0, 1, 0] and filtered.cls.max() == 0
+    assert filtered[0]["segments"][0].shape == (4, 2)  # segment of the kept instance
+
+    store.clear_segments()
+    assert all(lb["segments"] == [] for lb in store) and len(store.bboxes) == 6
+
+
+def test_data_batch_augment_canvas():
+    """Test that batched mosaic pixels and boxes are both cut off at the edge of the mosaic canvas."""
+    from ultralytics.data.augment import BatchAugment
+
+    img = torch.zeros(4, 3, 32, 32)
+    img[3] = 1.0  # bottom-right tile of the mosaic of image 0, reaching past the 64x64 canvas
+    mosaic, center = torch.ones(4, dtype=torch.bool), torch.full((4, 2), 48.0)
+    M = torch.eye(3).repeat(4, 1, 1)
+    M[:, :2, 2] = -48  # output pixel p samples canvas pixel p + 48
+    out = BatchAugment.warp(img, mosaic, center, M)
+    pad = torch.tensor(114 / 255)
+    assert (out[0, :, :16, :16] == 1).all()
+    assert torch.allclose(out[0, :, 16:], pad) and torch.allclose(out[0, :, :, 16:], pad)  # past the canvas edge
+
+    boxes = torch.tensor([[0.0, 0.0, 32.0, 32.0]])
+    idx, _, boxes = BatchAugment.warp_boxes(
+        torch.tensor([3]), torch.zeros(1, 1), boxes, mosaic, center, M, torch.ones(4), (32, 32)
+    )
+    assert torch.allclose(boxes[idx == 0], torch.tensor([[0.0, 0.0, 16.0, 16.0]]))
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not ONLINE, reason="environment is offline")
+def test_data_yolo_bbox2segment(tmp_path):
+    """Test that segments generated by SAM from box labels are written to the output label files."""
+    from ultralytics.data.converter import yolo_bbox2segment
+
+    (tmp_path / "images").mkdir()
+    (tmp_path / "labels").mkdir()
+    (tmp_path / "images" / "bus.jpg").write_bytes((ASSETS / "bus.jpg").read_bytes())
+    (tmp_path / "labels" / "bus.txt").write_text("5 0.5 0.45 0.9 0.55\n0 0.15 0.65 0.2 0.45\n")
+    yolo_bbox2segment(tmp_path / "images", save_dir=tmp_path / "segments", sam_model="mobile_sam.pt", device="cpu")
+    lines = (tmp_path / "segments" / "bus.txt").read_text().splitlines()
+    assert [line.split()[0] for line in lines] == ["5", "0"]
+    assert all(len(line.split()) >= 7 for line in lines)  # class and at least 3 polygon points
+
+
+def test_data_batch_augment():
+    """Test batched on-device augmentation is exact without random gains and keeps boxes valid with mosaic."""
+    from ultralytics.data.augment import BatchAugment
+    from ultralytics.utils import IterableSimpleNamespace
+
+    torch.manual_seed(0)
+    img = torch.rand(4, 4, 64, 64)
+    boxes = torch.tensor([[0.5, 0.5, 0.25, 0.25], [0.25, 0.75, 0.2, 0.1], [0.6, 0.4, 0.3, 0.3]])
+    cls, batch_idx = torch.tensor([[0.0], [1.0], [2.0]]), torch.tensor([0.0, 0.0, 2.0])
+    batch = {"img": img, "cls": cls, "bboxes": boxes, "batch_idx": batch_idx}
+    off = {k: 0.0 for k in ("mosaic", "mixup", "degrees", "translate", "scale", "shear", "perspective", "flipud")}
+    off.update(fliplr=0.0, hsv_h=0.0, hsv_s=0.0, hsv_v=0.0, band_gain=0.0, band_offset=0.0, band_gamma=0.0)
+    y = BatchAugment(64, IterableSimpleNamespace(**off))({k: v.clone() for k, v in batch.items()})
+    assert torch.allclose(y["img"], img, atol=1e-5) and torch.allclose(y["bboxes"], boxes, atol=1e-4)
+    assert y["batch_idx"].tolist() == [0, 0, 2] and y["cls"].flatten().tolist() == [0, 1, 2]
+
+    hyp = IterableSimpleNamespace(**{**off, "mosaic": 1.0, "mixup": 0.5, "degrees": 10.0, "scale": 0.5, "fliplr": 0.5})
+    hyp.hsv_h, hyp.hsv_s, hyp.hsv_v, hyp.band_gain = 0.015, 0.7, 0.4, 0.2
+    y = BatchAugment(64, hyp)({k: v.clone() for k, v in batch.items()})
+    assert y["img"].shape == img.shape and 0 <= y["img"].min() and y["img"].max() <= 1
+    assert len(y["bboxes"]) == len(y["cls"]) == len(y["batch_idx"])
+    assert ((y["bboxes"] >= 0) & (y["bboxes"] <= 1)).all() and (y["batch_idx"].diff() >= 0).all()
+
+
+def test_data_random_hsv_bands():
+    """Test that RandomHSV augments RGB and auxiliary bands of 4-channel images in one LUT pass."""
+    from ultralytics.data.augment import RandomHSV
+
+    np.random.seed(0)
+    im = np.random.randint(50, 150, (32, 32, 4), dtype=np.uint8)
+    y = RandomHSV(hgain=0.0, sgain=0.0, vgain=0.0, band_gain=0.5, band_offset=0.0, band_gamma=0.0)({"img": im.copy()})
+    assert y["img"].shape == im.shape and (y["img"][..., :3] == im[..., :3]).all()  # RGB untouched
+    ratio = y["img"][..., 3] / im[..., 3]
+    assert not (y["img"][..., 3] == im[..., 3]).all() and ratio.std() < 0.02  # single gain applied to the band
+
+    y = RandomHSV(hgain=0.5, sgain=0.5, vgain=0.5)({"img": im.copy()})  # no band jitter
+    assert (y["img"][..., 3] == im[..., 3]).all() and not (y["img"][..., :3] == im[..., :3]).all()
+
+
+def test_data_canvas_pool():
+    """Test that pooled mosaic canvases are only reused once released and are re-padded where no tile lands."""
+    from types import SimpleNamespace
+
+    from ultralytics.data.augment import CanvasPool, Mosaic
+    from ultralytics.utils.instance import Instances
+
+    pool = CanvasPool(maxsize=2)
+    canvas = pool.get((8, 8, 3))
+    other = pool.get((8, 8, 3))
+    assert other is not canvas  # leased, a second buffer is allocated
+    assert pool.get((8, 8, 3)) is not canvas and len(pool.buffers) == 2  # pool full, unpooled buffer handed out
+    assert not pool.release(np.zeros((8, 8, 3), dtype=np.uint8))  # foreign arrays are ignored
+    assert pool.release(canvas[2:6])  # a view releases its buffer
+    assert pool.get((8, 8, 3)) is canvas
+
+    def patch():
+        """Return labels for a uniform 24x32 image with one box."""
+        boxes = np.array([[0.5, 0.5, 0.2, 0.2]], dtype=np.float32)
+        return {
+            "img": np.full((24, 32, 3), 200, dtype=np.uint8),
+            "resized_shape": (24, 32),
+            "ori_shape": (24, 32),
+            "im_file": "im.jpg",
+            "cls": np.zeros((1, 1), dtype=np.float32),
+            "instances": Instances(boxes, np.zeros((0, 0, 2), dtype=np.float32)),
+        }
+
+    mosaic = Mosaic(SimpleNamespace(cache=None), imgsz=32, n=4)
+    for _ in range(3):
+        stale = mosaic.pool.get((64, 64, 3))
+        stale[:] = 0  # stale pixels from a previous sample
+        mosaic.pool.release(stale)
+        labels = patch()
+        labels["mix_labels"] = [patch() for _ in range(3)]
+        img = mosaic._mosaic4(labels)["img"]
+        assert img is stale  # released canvas is reused
+        assert set(np.unique(img).tolist()) == {114, 200}  # every pixel is either a tile or padding
+        CanvasPool.release_any(img)  # as RandomPerspective does after warping the canvas
+
+
+def test_data_band_tiff_depth(tmp_path):
+    """Test that 16-bit TIFF auxiliary bands are stacked as single 8-bit channels."""
+    from ultralytics.data.dataset import YOLODataset
+
+    im_dir = _make_rgb_ndvi_dataset(tmp_path, n=2)
+    for f in (tmp_path / "dataset_ndvi" / "images" / "train").glob("*.png"):
+        cv2.imwrite(str(f.with_suffix(".tif")), np.full((48, 64), 40000, dtype=np.uint16))
+        f.unlink()
+    bands = [{"path": str(tmp_path / "dataset_ndvi")}]
+    data = {"names": {0: "melon"}, "channels": 4, "path": str(tmp_path / "dataset_raw"), "bands": bands}
+    im, _, _ = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=False).load_image(0)
+    assert im.dtype == np.uint8 and im.shape[2] == 4
+    assert np.abs(im[..., 3].astype(int) - 40000 // 256).max() <= 1  # reduced to 8 bits like cv2.imread
+
+
+def test_data_canvas_pool_leases(tmp_path):
+    """Test that the full training transform chain returns every pooled canvas lease once an image is formatted."""
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data.augment import CanvasPool
+    from ultralytics.data.dataset import YOLODataset
+
+    im_dir = _make_rgb_ndvi_dataset(tmp_path, n=4)
+    bands = [{"path": str(tmp_path / "dataset_ndvi")}]
+    data = {"names": {0: "melon"}, "channels": 4, "path": str(tmp_path / "dataset_raw"), "bands": bands}
+    before = set(CanvasPool.pools)
+    hyp = get_cfg(overrides={"mosaic": 1.0, "fliplr": 1.0})
+    dataset = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=True, hyp=hyp)
+    pools = [p for p in CanvasPool.pools if p not in before]  # Mosaic, RandomPerspective and RandomFlip pools
+    for i in range(12):
+        assert dataset[i % len(dataset)]["img"].shape == (4, 64, 64)
+        assert not any(leased for p in pools for leased in p.leased)  # every canvas released down the chain
+    assert all(len(p.buffers) <= 2 for p in pools)  # buffers reused rather than exhausting the pool
+
+
+def test_data_load_image_bands(tmp_path):
+    """Test that LoadImageBands pairs RGB and NDVI files by stem and folder and yields stacked 4-channel batches."""
+    from ultralytics.data.build import load_inference_source
+
+    im_dir = _make_rgb_ndvi_dataset(tmp_path, n=5)
+    (tmp_path / "dataset_ndvi" / "images" / "train" / "im4.png").unlink()  # unpaired image
+    decoy = tmp_path / "dataset_ndvi" / "images" / "val"  # same stems in another split must not be paired
+    decoy.mkdir()
+    cv2.imwrite(str(decoy / "im0.png"), np.full((96, 128), 10, dtype=np.uint8))
+    source = {"images": str(im_dir), "bands": [str(tmp_path / "dataset_ndvi")]}
+    dataset = load_inference_source(source, batch=3, channels=4)
+    batches = list(dataset)
+    assert [len(b[1]) for b in batches] == [3, 1]  # im4 skipped
+    assert all(im.shape == (96, 128, 4) and (im[..., 3] == 200).all() for _, ims, _ in batches for im in ims)
+
+    manifest = tmp_path / "manifest.txt"  # explicit manifest in a YAML source
+    manifest.write_text(f"{im_dir / 'im0.jpg'},{tmp_path / 'dataset_ndvi' / 'images' / 'train' / 'im0.png'}\n")
+    YAML.save(tmp_path / "bands.yaml", {"files": manifest.name})
+    paths, ims, _ = next(iter(load_inference_source(str(tmp_path / "bands.yaml"), channels=4)))
+    assert paths == [str(im_dir / "im0.jpg")] and ims[0].shape[2] == 4
+
+
+@pytest.mark.parametrize("tiled", [False, True])
+def test_data_load_tiff_windows(tmp_path, tiled):
+    """Test windowed TIFF mosaic reading through a memory map or tiled zarr view, and mapping back to the mosaic."""
+    from ultralytics.data.build import load_inference_source
+    from ultralytics.engine.results import Results
+    from ultralytics.utils.checks import check_requirements
+
+    check_requirements("tifffile")
+    import tifffile
+
+    mosaic = np.random.randint(0, 65535, (300, 500, 4), dtype=np.uint16)  # RGB + NIR
+    f = tmp_path / "ortho.tif"
+    tifffile.imwrite(f, mosaic, photometric="rgb", extrasamples=[0], **({"tile": (64, 64)} if tiled else {}))
+    dataset = load_inference_source(str(f), batch=4, channels=4, window=128, overlap=0.25)
+    assert dataset.mmap != tiled and dataset.nf == 3 * 5 and len(dataset) == 4  # 3x5 windows in batches of 4
+    paths, ims, _ = next(iter(dataset))
+    x0, y0 = dataset.offsets[paths[1]]
+    expected = (mosaic[y0 : y0 + 128, x0 : x0 + 128] >> 8).astype(np.uint8)[..., [2, 1, 0, 3]]  # BGR + NIR
+    assert ims[1].dtype == np.uint8 and np.array_equal(ims[1], expected)
+
+    boxes = torch.tensor([[10.0, 20.0, 30.0, 40.0, 0.9, 0.0]])
+    results = [Results(im, path=p, names={0: "melon"}, boxes=boxes.clone()) for p, im in zip(paths[:2], ims[:2])]
+    merged = dataset.to_mosaic(results)  # second window's boxes are shifted by its global offset
+    expected = torch.tensor([[10.0, 20.0, 30.0, 40.0], [x0 + 10, y0 + 20, x0 + 30, y0 + 40]])
+    assert torch.equal(merged[merged[:, 0].argsort(), :4], expected)
+
+    dataset.close()  # releases the file handle and memory map
+    assert dataset.tif is None and dataset.data is None
+    assert next(iter(dataset))[0] == paths  # reopened for another pass
+    dataset.close()
+
+
+def test_data_mmap_shards(tmp_path):
+    """Test packing a split into memory-mapped shards and reading zero-copy views that match regular loading."""
+    from ultralytics.data.dataset import YOLODataset
+
+    im_dir = _make_rgb_ndvi_dataset(tmp_path, n=6)
+    bands = [{"path": str(tmp_path / "dataset_ndvi")}]
+    data = {"names": {0: "melon"}, "channels": 4, "path": str(tmp_path / "dataset_raw"), "bands": bands}
+    reference = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=False)
+    for _ in range(2):  # pack, then reuse the existing shards
+        dataset = YOLODataset(img_path=str(im_dir), data=data, imgsz=64, augment=False, cache="mmap")
+        assert dataset.shard_index is not None and len(dataset.shard_files) == 1
+        assert dataset.shard_files[0].parent == im_dir.parent / f"{im_dir.name}.shards"  # keyed on img_path
+        for i in range(dataset.ni):
+            im, hw0, hw = dataset.load_image(i)
+            assert isinstance(im.base, np.memmap) and not im.flags.writeable
+            ref = reference.load_image(i)
+            assert (im == ref[0]).all() and hw0 == ref[1] and hw == ref[2]
+
+
+@pytest.mark.parametrize("cfg", sorted((ROOT.parent / "configs").glob("yolo11_dual_*.yaml")), ids=lambda x: x.stem)
+def test_dual_stream_configs(cfg):
+    """Test that every dual-stream config routes its RGB and NIR streams from the YAML and runs a forward pass."""
+    from ultralytics.nn.tasks import DetectionModel, parse_streams
+
+    assert parse_streams([{12: 0}, 5]) == ([12, 5], [0, None])
+    model = DetectionModel(cfg, verbose=False).eval()  # input channels from the declared bands
+    assert model.yaml["channels"] == 4
+    assert {m.s for m in model.model if isinstance(m.s, int)} == {0, 1}  # both streams selected
+    im = torch.rand(1, 4, 64, 64)
+    rgb, nir = model.model[0](im)
+    assert rgb.data_ptr() == im.data_ptr() and nir.shape[1] == 1  # zero-copy stream views
+    with torch.inference_mode():
+        y = model(im)
+        assert y[0].shape[:2] == (1, 4 + model.yaml["nc"])
+        assert model.parallelize().branches  # independent RGB and NIR branches found
+        assert torch.allclose(model(im)[0], y[0], atol=1e-5)  # concurrent branches match the sequential pass
+
+
+def test_input_container_streams():
+    """Test that InputContainer gathers non-consecutive streams with a non-persistent index buffer."""
+    from ultralytics.nn.modules.block import InputContainer
+
+    m = InputContainer(4, [[2, 1, 0], [3]])
+    assert "index0" in dict(m.named_buffers()) and "index0" not in m.state_dict()  # moved by to(), not saved
+    x = torch.rand(1, 4, 8, 8)
+    bgr, nir = m(x)
+    assert torch.equal(bgr, x[:, [2, 1, 0]]) and nir.data_ptr() == x[:, 3:].data_ptr()
+    with pytest.raises(ValueError, match="empty"):
+        InputContainer(3)  # no auxiliary band left for the second stream
+
+
+@pytest.mark.parametrize(
+    "name", ["FusionAFF", "FusionRectify", "FusionDeformRectify", "FusionCrossCBAM", "FusionRectifyFeedback"]
+)
+def test_fusion_fuse(name):
+    """Test that fused Fusion* modules match their unfused outputs."""
+    import ultralytics.nn.modules.block as block
+
+    m = getattr(block, name)(32)
+    for bn in m.modules():
+        if isinstance(bn, torch.nn.BatchNorm2d):
+            torch.nn.init.uniform_(bn.running_mean, -0.5, 0.5)
+            torch.nn.init.uniform_(bn.running_var, 0.5, 1.5)
+            torch.nn.init.uniform_(bn.weight, 0.5, 1.5)
+    m.eval()
+    x = [torch.rand(2, 32, 16, 16), torch.rand(2, 32, 16, 16)]
+    with torch.inference_mode():
+        y = m(x)
+        m.fuse()
+        assert not any(isinstance(bn, torch.nn.BatchNorm2d) for bn in m.modules())
+        y_fused = m.forward_fuse(x)
+    for a, b in zip(y if isinstance(y, list) else [y], y_fused if isinstance(y_fused, list) else [y_fused]):
+        assert torch.allclose(a, b, atol=1e-5)
+
+
+def test_nn_load_checkpoint_mmap(tmp_path):
+    """Test memory-mapped inference loading and the fused checkpoint cache against a regular load."""
+    from ultralytics.nn.autobackend import AutoBackend
+    from ultralytics.nn.tasks import load_checkpoint
+
+    file = tmp_path / "model.pt"
+    YOLO(MODEL).save(file)
+    im = torch.rand(1, 3, 64, 64)
+    model, _ = load_checkpoint(file, fuse=True)
+    mapped, ckpt = load_checkpoint(file, fuse=True, mmap=True, cache=True)
+    assert "model" not in ckpt and "optimizer" not in ckpt  # inference payloads only
+    assert (tmp_path / "model.fused.pt").is_file()
+    cached, ckpt = load_checkpoint(file, fuse=True, cache=True)
+    assert ckpt["source"]["size"] == file.stat().st_size  # served from the fused cache
+    with torch.inference_mode():
+        y = model(im)[0]
+        assert torch.allclose(mapped(im)[0], y, atol=1e-5)
+        assert torch.allclose(cached(im)[0], y, atol=1e-5)
+
+    (tmp_path / "model.fused.pt").unlink()
+    AutoBackend(str(file), fuse_cache=True)  # predictor fuse_cache=True
+    assert (tmp_path / "model.fused.pt").is_file()
@@ -173,6 +173,9 @@ CFG_FRACTION_KEYS = frozenset(
         "hsv_h",
         "hsv_s",
         "hsv_v",
+        "band_gain",
+        "band_offset",
+        "band_gamma",
         "translate",
         "scale",
         "perspective",
@@ -186,6 +189,8 @@ CFG_FRACTION_KEYS = frozenset(
         "conf",
         "iou",
         "fraction",
+        "val_fraction",
+        "tile_overlap",
     }
 )
 CFG_INT_KEYS = frozenset(
@@ -195,8 +200,11 @@ CFG_INT_KEYS = frozenset(
         "workers",
         "seed",
         "close_mosaic",
+        "ema_interval",
         "mask_ratio",
         "max_det",
+        "ap_bins",
+        "tile",
         "vid_stride",
         "line_width",
         "nbs",
@@ -214,6 +222,7 @@ CFG_BOOL_KEYS = frozenset(
         "cos_lr",
         "overlap_mask",
         "val",
+        "val_async",
         "save_json",
         "half",
         "dnn",
@@ -227,6 +236,11 @@ CFG_BOOL_KEYS = frozenset(
         "show_conf",
         "visualize",
         "augment",
+        "branches",
+        "fuse_cache",
+        "pipeline",
+        "batch_results",
+        "retain_imgs",
         "agnostic_nms",
         "retina_masks",
         "show_boxes",
@@ -238,6 +252,7 @@ CFG_BOOL_KEYS = frozenset(
         "nms",
         "profile",
         "multi_scale",
+        "batch_augment",
     }
 )
 
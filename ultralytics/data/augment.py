@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 import random
+import weakref
 from copy import deepcopy
 from typing import Any
 
@@ -18,13 +19,118 @@ from ultralytics.utils import LOGGER, IterableSimpleNamespace, colorstr
 from ultralytics.utils.checks import check_version
 from ultralytics.utils.instance import Instances
 from ultralytics.utils.metrics import bbox_ioa
-from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxyxyxy2xywhr
+from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxy2xywh, xyxyxyxy2xywhr
 from ultralytics.utils.torch_utils import TORCHVISION_0_10, TORCHVISION_0_11, TORCHVISION_0_13
 
 DEFAULT_MEAN = (0.0, 0.0, 0.0)
 DEFAULT_STD = (1.0, 1.0, 1.0)
 
 
+class CanvasPool:
+    """Pool of reusable image canvases for the large per-sample buffers of the training augmentations.
+
+    Mosaic canvases and warp outputs are several tens of MB at large image sizes, and allocating and filling them for
+    every sample makes dataloader workers memory-bandwidth bound. Each transform instance owns a pool, so every
+    dataloader worker process reuses its own buffers. Buffers are leased explicitly: `get` hands a buffer out and it is
+    only handed out again after the transform that consumes the image gives it back with `release` (e.g.
+    RandomPerspective once it has warped the Mosaic canvas, Format once it has copied the final image into a tensor).
+    A buffer that is never released is simply never reused, so images still alive further down the pipeline are never
+    overwritten.
+
+    Attributes:
+        maxsize (int): Maximum number of buffers retained by the pool.
+        buffers (list[np.ndarray]): Retained buffers, most recently allocated last.
+        leased (list[bool]): Whether each retained buffer is currently handed out.
+
+    Methods:
+        get: Lease a free buffer of the requested shape and dtype, allocating it if needed.
+        release: Return a leased buffer, or an array viewing it, to the pool.
+        release_any: Return an array to whichever pool of the process leased it.
+
+    Examples:
+        >>> pool = CanvasPool()
+        >>> canvas = pool.get((1280, 1280, 3))
+        >>> canvas is pool.get((1280, 1280, 3))  # canvas still leased, a second buffer is returned
+        False
+        >>> pool.release(canvas)
+        True
+        >>> canvas is pool.get((1280, 1280, 3))
+        True
+    """
+
+    pools = weakref.WeakSet()  # live pools of this process, searched by release_any()
+
+    def __init__(self, maxsize: int = 8):
+        """Initialize an empty CanvasPool.
+
+        Args:
+            maxsize (int): Maximum number of buffers retained by the pool.
+        """
+        self.maxsize = maxsize
+        self.buffers = []
+        self.leased = []
+        CanvasPool.pools.add(self)
+
+    def get(self, shape: tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Lease an uninitialized buffer that is not handed out elsewhere.
+
+        Args:
+            shape (tuple[int, ...]): Buffer shape.
+            dtype (np.dtype): Buffer dtype.
+
+        Returns:
+            (np.ndarray): A reused or newly allocated buffer. Its contents are undefined.
+        """
+        shape = tuple(shape)
+        for i, buffer in enumerate(self.buffers):
+            if not self.leased[i] and buffer.shape == shape and buffer.dtype == dtype:
+                self.leased[i] = True
+                return buffer
+        buffer = np.empty(shape, dtype=dtype)
+        if len(self.buffers) >= self.maxsize:  # evict the oldest free buffer, e.g. one left over from another shape
+            free = [i for i, leased in enumerate(self.leased) if not leased]
+            if not free:
+                return buffer  # everything is leased, hand out an unpooled buffer
+            self.buffers.pop(free[0])
+            self.leased.pop(free[0])
+        self.buffers.append(buffer)
+        self.leased.append(True)
+        return buffer
+
+    def release(self, array: np.ndarray) -> bool:
+        """Return the buffer backing an array to the pool so that `get` can hand it out again.
+
+        Args:
+            array (np.ndarray): A leased buffer or a view of one. Arrays not owned by the pool are ignored.
+
+        Returns:
+            (bool): Whether the array was backed by a buffer of this pool.
+        """
+        while isinstance(array, np.ndarray) and array.base is not None:  # resolve views to the owning buffer
+            array = array.base
+        for i, buffer in enumerate(self.buffers):
+            if buffer is array:
+                self.leased[i] = False
+                return True
+        return False
+
+    @classmethod
+    def release_any(cls, array: np.ndarray) -> None:
+        """Return an array to whichever pool leased it, e.g. a Mosaic canvas released by RandomPerspective."""
+        for pool in list(cls.pools):
+            if pool.release(array):
+                return
+
+    def __getstate__(self):
+        """Drop retained buffers when pickling, e.g. when the dataset is sent to dataloader worker processes."""
+        return {"maxsize": self.maxsize, "buffers": [], "leased": []}
+
+    def __setstate__(self, state):
+        """Restore an empty pool and register it with the pools of the new process."""
+        self.__dict__.update(state)
+        CanvasPool.pools.add(self)
+
+
 class BaseTransform:
     """Base class for image transformations in the Ultralytics library.
 
@@ -467,6 +573,7 @@ class Mosaic(BaseMixTransform):
         p (float): Probability of applying the mosaic augmentation. Must be in the range 0-1.
         n (int): The grid size, either 4 (for 2x2) or 9 (for 3x3).
         border (tuple[int, int]): Border size for width and height.
+        pool (CanvasPool): Pool of reusable mosaic canvases.
 
     Methods:
         get_indexes: Return a list of random indexes from the dataset.
@@ -474,6 +581,7 @@ class Mosaic(BaseMixTransform):
         _mosaic3: Create a 1x3 image mosaic.
         _mosaic4: Create a 2x2 image mosaic.
         _mosaic9: Create a 3x3 image mosaic.
+        _fill_border: Fill the part of a canvas region not covered by an image tile.
         _update_labels: Update labels with padding.
         _cat_labels: Concatenate labels and clips mosaic border instances.
 
@@ -502,7 +610,8 @@ class Mosaic(BaseMixTransform):
         self.imgsz = imgsz
         self.border = (-imgsz // 2, -imgsz // 2)  # width, height
         self.n = n
-        self.buffer_enabled = self.dataset.cache != "ram"
+        self.buffer_enabled = self.dataset.cache not in {"ram", "mmap"}  # all images are readily available
+        self.pool = CanvasPool()
 
     def get_indexes(self):
         """Return a list of random indexes from the dataset for mosaic augmentation.
@@ -588,7 +697,8 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img3
             if i == 0:  # center
-                img3 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 3 tiles
+                img3 = self.pool.get((s * 3, s * 3, img.shape[2]))  # base image with 3 tiles
+                img3[-self.border[0] : self.border[0], -self.border[1] : self.border[1]] = 114  # only the kept window
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # right
@@ -645,7 +755,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img4
             if i == 0:  # top left
-                img4 = np.full((s * 2, s * 2, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img4 = self.pool.get((s * 2, s * 2, img.shape[2]))  # base image with 4 tiles, filled per quadrant
                 x1a, y1a, x2a, y2a = max(xc - w, 0), max(yc - h, 0), xc, yc  # xmin, ymin, xmax, ymax (large image)
                 x1b, y1b, x2b, y2b = w - (x2a - x1a), h - (y2a - y1a), w, h  # xmin, ymin, xmax, ymax (small image)
             elif i == 1:  # top right
@@ -659,6 +769,9 @@ class Mosaic(BaseMixTransform):
                 x1b, y1b, x2b, y2b = 0, 0, min(w, x2a - x1a), min(y2a - y1a, h)
 
             img4[y1a:y2a, x1a:x2a] = img[y1b:y2b, x1b:x2b]  # img4[ymin:ymax, xmin:xmax]
+            qx1, qx2 = (0, xc) if i % 2 == 0 else (xc, s * 2)  # quadrant bounds
+            qy1, qy2 = (0, yc) if i < 2 else (yc, s * 2)
+            self._fill_border(img4, (qx1, qy1, qx2, qy2), (x1a, y1a, x2a, y2a))
             padw = x1a - x1b
             padh = y1a - y1b
 
@@ -705,7 +818,8 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img9
             if i == 0:  # center
-                img9 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img9 = self.pool.get((s * 3, s * 3, img.shape[2]))  # base image with 9 tiles
+                img9[-self.border[0] : self.border[0], -self.border[1] : self.border[1]] = 114  # only the kept window
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # top
@@ -740,6 +854,26 @@ class Mosaic(BaseMixTransform):
         final_labels["img"] = img9[-self.border[0] : self.border[0], -self.border[1] : self.border[1]]
         return final_labels
 
+    @staticmethod
+    def _fill_border(canvas: np.ndarray, region: tuple[int, ...], tile: tuple[int, ...], value: int = 114) -> None:
+        """Fill the part of a canvas region that is not covered by an image tile.
+
+        Pooled mosaic canvases are not cleared between samples, so only the pixels no tile is written to are filled
+        with the padding value instead of the whole canvas.
+
+        Args:
+            canvas (np.ndarray): Mosaic canvas with shape (H, W, C).
+            region (tuple[int, ...]): Region (x1, y1, x2, y2) on the canvas, e.g. one mosaic quadrant.
+            tile (tuple[int, ...]): Area (x1, y1, x2, y2) inside the region that holds image pixels.
+            value (int): Padding value.
+        """
+        x1, y1, x2, y2 = region
+        tx1, ty1, tx2, ty2 = tile
+        canvas[y1:ty1, x1:x2] = value  # top strip
+        canvas[ty2:y2, x1:x2] = value  # bottom strip
+        canvas[ty1:ty2, x1:tx1] = value  # left strip
+        canvas[ty1:ty2, tx2:x2] = value  # right strip
+
     @staticmethod
     def _update_labels(labels, padw: int, padh: int) -> dict[str, Any]:
         """Update label coordinates with padding values.
@@ -869,7 +1003,11 @@ class MixUp(BaseMixTransform):
         """
         r = np.random.beta(32.0, 32.0)  # mixup ratio, alpha=beta=32.0
         labels2 = labels["mix_labels"][0]
-        labels["img"] = (labels["img"] * r + labels2["img"] * (1 - r)).astype(np.uint8)
+        img = labels["img"]
+        dst = img if img.flags.writeable and img.flags.c_contiguous and img.shape[-1] > 1 else None  # blend in place
+        mixed = cv2.addWeighted(img, r, labels2["img"], 1 - r, 0.0, dst=dst)
+        CanvasPool.release_any(labels2["img"])  # second image is consumed by the blend
+        labels["img"] = mixed if mixed.ndim == 3 else mixed[..., None]
         labels["instances"] = Instances.concatenate([labels["instances"], labels2["instances"]], axis=0)
         labels["cls"] = np.concatenate([labels["cls"], labels2["cls"]], 0)
         return labels
@@ -978,6 +1116,7 @@ class CutMix(BaseMixTransform):
         # Apply CutMix
         x1, y1, x2, y2 = area.astype(np.int32)
         labels["img"][y1:y2, x1:x2] = labels2["img"][y1:y2, x1:x2]
+        CanvasPool.release_any(labels2["img"])  # second image is consumed by the paste
 
         # Restrain instances2 to the random bounding border
         instances2.add_padding(-x1, -y1)
@@ -1004,6 +1143,7 @@ class RandomPerspective:
         perspective (float): Perspective distortion factor.
         border (tuple[int, int]): Mosaic border size as (x, y).
         pre_transform (Callable | None): Optional transform to apply before the random perspective.
+        pool (CanvasPool): Pool of reusable warp output buffers.
 
     Methods:
         affine_transform: Apply affine transformations to the input image.
@@ -1054,6 +1194,7 @@ class RandomPerspective:
         self.perspective = perspective
         self.border = border  # mosaic border
         self.pre_transform = pre_transform
+        self.pool = CanvasPool()
 
     def affine_transform(self, img: np.ndarray, border: tuple[int, int]) -> tuple[np.ndarray, np.ndarray, float]:
         """Apply a sequence of affine transformations centered around the image center.
@@ -1110,10 +1251,14 @@ class RandomPerspective:
         M = T @ S @ R @ P @ C  # order of operations (right to left) is IMPORTANT
         # Affine image
         if (border[0] != 0) or (border[1] != 0) or (M != np.eye(3)).any():  # image changed
+            c = img.shape[2] if img.ndim == 3 else 1
+            dst = self.pool.get((self.size[1], self.size[0], c) if c > 1 else self.size[::-1], img.dtype)
+            src = img
             if self.perspective:
-                img = cv2.warpPerspective(img, M, dsize=self.size, borderValue=(114, 114, 114))
+                img = cv2.warpPerspective(img, M, dsize=self.size, dst=dst, borderValue=(114, 114, 114))
             else:  # affine
-                img = cv2.warpAffine(img, M[:2], dsize=self.size, borderValue=(114, 114, 114))
+                img = cv2.warpAffine(img, M[:2], dsize=self.size, dst=dst, borderValue=(114, 114, 114))
+            CanvasPool.release_any(src)  # e.g. the Mosaic canvas, fully consumed by the warp
             if img.ndim == 2:
                 img = img[..., None]
         return img, M, s
@@ -1344,14 +1489,19 @@ class RandomPerspective:
 
 
 class RandomHSV:
-    """Randomly adjust the Hue, Saturation, and Value (HSV) channels of an image.
+    """Randomly adjust the Hue, Saturation, and Value (HSV) channels of an image and jitter its auxiliary bands.
 
-    This class applies random HSV augmentation to images within predefined limits set by hgain, sgain, and vgain.
+    This class applies random HSV augmentation to the first three (BGR) channels within predefined limits set by hgain,
+    sgain, and vgain. Any further channels, i.e. NIR or NDVI bands, get an independent random gain, offset and gamma.
+    All channels are remapped in a single multi-channel lookup table pass.
 
     Attributes:
         hgain (float): Maximum variation for hue. Range is typically [0, 1].
         sgain (float): Maximum variation for saturation. Range is typically [0, 1].
         vgain (float): Maximum variation for value. Range is typically [0, 1].
+        band_gain (float): Maximum relative gain variation for auxiliary bands. Range is typically [0, 1].
+        band_offset (float): Maximum offset for auxiliary bands as a fraction of the full range. Range is [0, 1].
+        band_gamma (float): Maximum gamma variation for auxiliary bands. Range is typically [0, 1).
 
     Methods:
         __call__: Apply random HSV augmentation to an image.
@@ -1359,15 +1509,23 @@ class RandomHSV:
     Examples:
         >>> import numpy as np
         >>> from ultralytics.data.augment import RandomHSV
-        >>> augmenter = RandomHSV(hgain=0.5, sgain=0.5, vgain=0.5)
-        >>> image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        >>> augmenter = RandomHSV(hgain=0.5, sgain=0.5, vgain=0.5, band_gain=0.2)
+        >>> image = np.random.randint(0, 255, (100, 100, 4), dtype=np.uint8)
         >>> labels = {"img": image}
         >>> augmenter(labels)
         >>> augmented_image = augmented_labels["img"]
     """
 
-    def __init__(self, hgain: float = 0.5, sgain: float = 0.5, vgain: float = 0.5) -> None:
-        """Initialize the RandomHSV object for random HSV (Hue, Saturation, Value) augmentation.
+    def __init__(
+        self,
+        hgain: float = 0.5,
+        sgain: float = 0.5,
+        vgain: float = 0.5,
+        band_gain: float = 0.0,
+        band_offset: float = 0.0,
+        band_gamma: float = 0.0,
+    ) -> None:
+        """Initialize the RandomHSV object for random HSV (Hue, Saturation, Value) and auxiliary band augmentation.
 
         This class applies random adjustments to the HSV channels of an image within specified limits.
 
@@ -1375,16 +1533,24 @@ class RandomHSV:
             hgain (float): Maximum variation for hue. Should be in the range [0, 1].
             sgain (float): Maximum variation for saturation. Should be in the range [0, 1].
             vgain (float): Maximum variation for value. Should be in the range [0, 1].
+            band_gain (float): Maximum relative gain variation for auxiliary bands. Should be in the range [0, 1].
+            band_offset (float): Maximum auxiliary band offset as a fraction of 255. Should be in the range [0, 1].
+            band_gamma (float): Maximum auxiliary band gamma variation. Should be in the range [0, 1).
         """
         self.hgain = hgain
         self.sgain = sgain
         self.vgain = vgain
+        self.band_gain = band_gain
+        self.band_offset = band_offset
+        self.band_gamma = band_gamma
 
     def __call__(self, labels: dict[str, Any]) -> dict[str, Any]:
         """Apply random HSV augmentation to an image within predefined limits.
 
         This method modifies the input image by randomly adjusting its Hue, Saturation, and Value (HSV) channels. The
-        adjustments are made within the limits set by hgain, sgain, and vgain during initialization.
+        adjustments are made within the limits set by hgain, sgain, and vgain during initialization. Channels beyond
+        the first three are remapped by x' = (x ** gamma) * gain + offset on the [0, 1] range, with per-band random
+        gain, offset and gamma, in the same lookup table pass.
 
         Args:
             labels (dict[str, Any]): A dictionary containing image data and metadata. Must include an 'img' key with the
@@ -1400,22 +1566,39 @@ class RandomHSV:
             >>> augmented_img = labels["img"]
         """
         img = labels["img"]
-        if img.shape[-1] != 3:  # only apply to RGB images
+        nb = img.shape[-1] - 3 if img.ndim == 3 else -1  # number of auxiliary bands
+        hsv = bool(self.hgain or self.sgain or self.vgain)
+        bands = nb > 0 and bool(self.band_gain or self.band_offset or self.band_gamma)
+        if nb < 0 or not (hsv or bands):  # grayscale or nothing to do
             return labels
-        if self.hgain or self.sgain or self.vgain:
-            dtype = img.dtype  # uint8
-
-            r = np.random.uniform(-1, 1, 3) * [self.hgain, self.sgain, self.vgain]  # random gains
-            x = np.arange(0, 256, dtype=r.dtype)
-            # lut_hue = ((x * (r[0] + 1)) % 180).astype(dtype)   # original hue implementation from ultralytics<=8.3.78
-            lut_hue = ((x + r[0] * 180) % 180).astype(dtype)
-            lut_sat = np.clip(x * (r[1] + 1), 0, 255).astype(dtype)
-            lut_val = np.clip(x * (r[2] + 1), 0, 255).astype(dtype)
-            lut_sat[0] = 0  # prevent pure white changing color, introduced in 8.3.79
-
-            hue, sat, val = cv2.split(cv2.cvtColor(img, cv2.COLOR_BGR2HSV))
-            im_hsv = cv2.merge((cv2.LUT(hue, lut_hue), cv2.LUT(sat, lut_sat), cv2.LUT(val, lut_val)))
-            cv2.cvtColor(im_hsv, cv2.COLOR_HSV2BGR, dst=img)  # no return needed
+        dtype = img.dtype  # uint8
+
+        r = np.random.uniform(-1, 1, 3) * [self.hgain, self.sgain, self.vgain]  # random gains
+        x = np.arange(0, 256, dtype=r.dtype)
+        # lut_hue = ((x * (r[0] + 1)) % 180).astype(dtype)   # original hue implementation from ultralytics<=8.3.78
+        lut_hue = (x + r[0] * 180) % 180
+        lut_sat = np.clip(x * (r[1] + 1), 0, 255)
+        lut_val = np.clip(x * (r[2] + 1), 0, 255)
+        lut_sat[0] = 0  # prevent pure white changing color, introduced in 8.3.79
+        luts = [lut_hue, lut_sat, lut_val] if hsv else [x, x, x]
+        if nb:
+            jitter = np.random.uniform(-1, 1, (3, nb)) * [[self.band_gain], [self.band_offset], [self.band_gamma]]
+            gain, offset, gamma = jitter + [[1], [0], [1]]  # per-band random gain, offset and gamma
+            luts.append(np.clip(((x[:, None] / 255) ** gamma * gain + offset) * 255, 0, 255))  # (256, nb)
+        lut = np.column_stack(luts).astype(dtype).reshape(256, 1, -1)  # one multi-channel LUT
+
+        if nb == 0:
+            im_hsv = cv2.LUT(cv2.cvtColor(img, cv2.COLOR_BGR2HSV), lut)
+            # write in place unless img is a read-only view, i.e. cache='mmap' shards
+            labels["img"] = cv2.cvtColor(im_hsv, cv2.COLOR_HSV2BGR, dst=img if img.flags.writeable else None)
+        else:
+            im = img if img.flags.writeable else img.copy()
+            if hsv:
+                im[..., :3] = cv2.cvtColor(np.ascontiguousarray(im[..., :3]), cv2.COLOR_BGR2HSV)
+            cv2.LUT(im, lut, dst=im)
+            if hsv:
+                im[..., :3] = cv2.cvtColor(np.ascontiguousarray(im[..., :3]), cv2.COLOR_HSV2BGR)
+            labels["img"] = im
         return labels
 
 
@@ -1429,6 +1612,7 @@ class RandomFlip:
         p (float): Probability of applying the flip. Must be between 0 and 1.
         direction (str): Direction of flip, either 'horizontal' or 'vertical'.
         flip_idx (array-like): Index mapping for flipping keypoints, if applicable.
+        pool (CanvasPool): Pool of reusable flip output buffers.
 
     Methods:
         __call__: Apply the random flip transformation to an image and its annotations.
@@ -1460,6 +1644,7 @@ class RandomFlip:
         self.p = p
         self.direction = direction
         self.flip_idx = flip_idx
+        self.pool = CanvasPool()
 
     def __call__(self, labels: dict[str, Any]) -> dict[str, Any]:
         """Apply random flip to an image and update any instances like bounding boxes or keypoints accordingly.
@@ -1501,6 +1686,11 @@ class RandomFlip:
             instances.fliplr(w)
             if self.flip_idx is not None and instances.keypoints is not None:
                 instances.keypoints = np.ascontiguousarray(instances.keypoints[:, self.flip_idx, :])
+        if img is not labels["img"]:  # flipped view, copy it into a pooled buffer and release the source
+            dst = self.pool.get(img.shape, img.dtype)
+            np.copyto(dst, img)
+            CanvasPool.release_any(labels["img"])  # e.g. the RandomPerspective warp output
+            img = dst
         labels["img"] = np.ascontiguousarray(img)
         labels["instances"] = instances
         return labels
@@ -1522,6 +1712,7 @@ class LetterBox:
 
     Methods:
         __call__: Resize and pad image, update labels and bounding boxes.
+        get_params: Compute the resized size, scale ratios and padding for an image shape.
 
     Examples:
         >>> transform = LetterBox(new_shape=(640, 640))
@@ -1565,7 +1756,9 @@ class LetterBox:
         self.padding_value = padding_value
         self.interpolation = interpolation
 
-    def __call__(self, labels: dict[str, Any] | None = None, image: np.ndarray = None) -> dict[str, Any] | np.ndarray:
+    def __call__(
+        self, labels: dict[str, Any] | None = None, image: np.ndarray = None, dst: np.ndarray | None = None
+    ) -> dict[str, Any] | np.ndarray:
         """Resize and pad an image for object detection, instance segmentation, or pose estimation tasks.
 
         This method applies letterboxing to the input image, which involves resizing the image while maintaining its
@@ -1575,6 +1768,8 @@ class LetterBox:
             labels (dict[str, Any] | None): A dictionary containing image data and associated labels, or empty dict if
                 None.
             image (np.ndarray | None): The input image as a numpy array. If None, the image is taken from 'labels'.
+            dst (np.ndarray | None): Optional preallocated (H, W, C) output array, e.g. a view into a batch buffer, that
+                the padded image is written into instead of allocating a new one. Any strides are supported.
 
         Returns:
             (dict[str, Any] | np.ndarray): If 'labels' is provided, returns an updated dictionary with the resized and
@@ -1594,36 +1789,20 @@ class LetterBox:
         new_shape = labels.pop("rect_shape", self.new_shape)
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
-
-        # Scale ratio (new / old)
-        r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
-        if not self.scaleup:  # only scale down, do not scale up (for better val mAP)
-            r = min(r, 1.0)
-
-        # Compute padding
-        ratio = r, r  # width, height ratios
-        new_unpad = round(shape[1] * r), round(shape[0] * r)
-        dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]  # wh padding
-        if self.auto:  # minimum rectangle
-            dw, dh = np.mod(dw, self.stride), np.mod(dh, self.stride)  # wh padding
-        elif self.scale_fill:  # stretch
-            dw, dh = 0.0, 0.0
-            new_unpad = (new_shape[1], new_shape[0])
-            ratio = new_shape[1] / shape[1], new_shape[0] / shape[0]  # width, height ratios
-
-        if self.center:
-            dw /= 2  # divide padding into 2 sides
-            dh /= 2
+        new_unpad, ratio, (top, bottom, left, right) = self.get_params(shape, new_shape)
 
         if shape[::-1] != new_unpad:  # resize
             img = cv2.resize(img, new_unpad, interpolation=self.interpolation)
             if img.ndim == 2:
                 img = img[..., None]
 
-        top, bottom = round(dh - 0.1) if self.center else 0, round(dh + 0.1)
-        left, right = round(dw - 0.1) if self.center else 0, round(dw + 0.1)
         h, w, c = img.shape
-        if c == 3:
+        if dst is not None:  # write into the preallocated output
+            dst[:top] = dst[top + h :] = self.padding_value
+            dst[top : top + h, :left] = dst[top : top + h, left + w :] = self.padding_value
+            dst[top : top + h, left : left + w] = img
+            img = dst
+        elif c == 3:
             img = cv2.copyMakeBorder(
                 img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(self.padding_value,) * 3
             )
@@ -1643,6 +1822,52 @@ class LetterBox:
         else:
             return img
 
+    def get_params(
+        self, shape: tuple[int, int], new_shape: int | tuple[int, int] | None = None
+    ) -> tuple[tuple[int, int], tuple[float, float], tuple[int, int, int, int]]:
+        """Compute the resized size, scale ratios and padding that letterbox an image of a given shape.
+
+        Args:
+            shape (tuple[int, int]): Input image shape (height, width).
+            new_shape (int | tuple[int, int] | None): Target shape (height, width), defaults to self.new_shape.
+
+        Returns:
+            new_unpad (tuple[int, int]): Resized image size (width, height) before padding.
+            ratio (tuple[float, float]): Width and height scale ratios.
+            pad (tuple[int, int, int, int]): Top, bottom, left and right padding in pixels.
+
+        Examples:
+            >>> LetterBox(new_shape=(640, 640)).get_params((480, 640))
+            ((640, 480), (1.0, 1.0), (80, 80, 0, 0))
+        """
+        new_shape = self.new_shape if new_shape is None else new_shape
+        if isinstance(new_shape, int):
+            new_shape = (new_shape, new_shape)
+
+        # Scale ratio (new / old)
+        r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
+        if not self.scaleup:  # only scale down, do not scale up (for better val mAP)
+            r = min(r, 1.0)
+
+        # Compute padding
+        ratio = r, r  # width, height ratios
+        new_unpad = round(shape[1] * r), round(shape[0] * r)
+        dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]  # wh padding
+        if self.auto:  # minimum rectangle
+            dw, dh = np.mod(dw, self.stride), np.mod(dh, self.stride)  # wh padding
+        elif self.scale_fill:  # stretch
+            dw, dh = 0.0, 0.0
+            new_unpad = (new_shape[1], new_shape[0])
+            ratio = new_shape[1] / shape[1], new_shape[0] / shape[0]  # width, height ratios
+
+        if self.center:
+            dw /= 2  # divide padding into 2 sides
+            dh /= 2
+
+        top, bottom = round(dh - 0.1) if self.center else 0, round(dh + 0.1)
+        left, right = round(dw - 0.1) if self.center else 0, round(dw + 0.1)
+        return new_unpad, ratio, (top, bottom, left, right)
+
     @staticmethod
     def _update_labels(labels: dict[str, Any], ratio: tuple[float, float], padw: float, padh: float) -> dict[str, Any]:
         """Update labels after applying letterboxing to an image.
@@ -1745,7 +1970,7 @@ class CopyPaste(BaseMixTransform):
         instances.convert_bbox(format="xyxy")
         instances.denormalize(w, h)
 
-        im_new = np.zeros(im.shape, np.uint8)
+        im_new = np.zeros((h, w), np.uint8)  # single-channel paste mask
         instances2 = labels2.pop("instances", None)
         if instances2 is None:
             instances2 = deepcopy(instances)
@@ -1758,13 +1983,15 @@ class CopyPaste(BaseMixTransform):
         for j in indexes[: round(self.p * n)]:
             cls = np.concatenate((cls, labels2.get("cls", cls)[[j]]), axis=0)
             instances = Instances.concatenate((instances, instances2[[j]]), axis=0)
-            cv2.drawContours(im_new, instances2.segments[[j]].astype(np.int32), -1, (1, 1, 1), cv2.FILLED)
+            cv2.drawContours(im_new, instances2.segments[[j]].astype(np.int32), -1, 1, cv2.FILLED)
 
-        result = labels2.get("img", cv2.flip(im, 1))  # augment segments
+        result = labels2["img"] if "img" in labels2 else cv2.flip(im, 1)  # augment segments
         if result.ndim == 2:  # cv2.flip would eliminate the last dimension for grayscale images
             result = result[..., None]
         i = im_new.astype(bool)
         im[i] = result[i]
+        if "img" in labels2:
+            CanvasPool.release_any(labels2["img"])  # pasted image is consumed
 
         labels1["img"] = im
         labels1["cls"] = cls
@@ -1951,6 +2178,8 @@ class Albumentations:
                 labels["instances"].update(bboxes=bboxes)
         else:
             labels["img"] = self.transform(image=labels["img"])["image"]  # transformed
+        if not np.may_share_memory(labels["img"], im):
+            CanvasPool.release_any(im)  # replaced by a new image, a pooled canvas can be reused
 
         return labels
 
@@ -2116,7 +2345,10 @@ class Format:
         if len(img.shape) < 3:
             img = img[..., None]
         img = img.transpose(2, 0, 1)
+        src = img
         img = np.ascontiguousarray(img[::-1] if random.uniform(0, 1) > self.bgr and img.shape[0] == 3 else img)
+        if not np.may_share_memory(img, src):
+            CanvasPool.release_any(src)  # copied into the tensor, a pooled canvas can be reused
         img = torch.from_numpy(img)
         return img
 
@@ -2369,6 +2601,273 @@ class RandomLoadText:
         return labels
 
 
+class BatchAugment:
+    """Apply mosaic, affine, mixup, flip and color augmentation to a whole collated training batch with torch ops.
+
+    With this stage enabled, dataloader workers only decode, resize and letterbox images to imgsz x imgsz. The batch is
+    augmented after collation on the training device, including the CPU with intra-op threads, so augmentation
+    throughput no longer depends on the number of dataloader workers. Mosaic places each image with the next three
+    images of the batch on a 2x2 canvas and MixUp blends it with the previous augmented image. The canvas is never
+    materialized: every output pixel is mapped back through the random perspective matrix and sampled from its mosaic
+    tile with `grid_sample`. Only box labels are supported.
+
+    Attributes:
+        imgsz (int): Image size.
+        mosaic (float): Mosaic probability.
+        mixup (float): MixUp probability.
+        degrees (float): Maximum absolute rotation in degrees.
+        translate (float): Maximum translation as a fraction of the image size.
+        scale (float): Scale gain range, e.g. 0.5 for 0.5-1.5.
+        shear (float): Maximum shear in degrees.
+        perspective (float): Perspective distortion factor.
+        flipud (float): Vertical flip probability.
+        fliplr (float): Horizontal flip probability.
+        hsv_h (float): Maximum hue variation.
+        hsv_s (float): Maximum saturation variation.
+        hsv_v (float): Maximum value variation.
+        band_gain (float): Maximum relative gain variation of auxiliary bands.
+        band_offset (float): Maximum offset of auxiliary bands as a fraction of the full range.
+        band_gamma (float): Maximum gamma variation of auxiliary bands.
+
+    Methods:
+        __call__: Augment a batch of images in [0, 1] and its box labels.
+        affine_matrices: Return random perspective matrices from mosaic canvas to output pixels.
+        warp: Sample the mosaic and affine warped images.
+        warp_boxes: Place boxes on the mosaic canvas and warp them with the matching matrices.
+        color: Apply HSV and auxiliary band jitter.
+
+    Examples:
+        >>> augment = BatchAugment(640, hyp)
+        >>> batch = augment({"img": img.float() / 255, "cls": cls, "bboxes": bboxes, "batch_idx": batch_idx})
+    """
+
+    def __init__(self, imgsz: int, hyp: IterableSimpleNamespace):
+        """Initialize the batched augmentation from training hyperparameters.
+
+        Args:
+            imgsz (int): Image size.
+            hyp (IterableSimpleNamespace): Hyperparameters with the mosaic, mixup, affine, flip, HSV and band keys.
+        """
+        self.imgsz = imgsz
+        self.mosaic, self.mixup = hyp.mosaic, hyp.mixup
+        self.degrees, self.translate, self.scale = hyp.degrees, hyp.translate, hyp.scale
+        self.shear, self.perspective = hyp.shear, hyp.perspective
+        self.flipud, self.fliplr = hyp.flipud, hyp.fliplr
+        self.hsv_h, self.hsv_s, self.hsv_v = hyp.hsv_h, hyp.hsv_s, hyp.hsv_v
+        self.band_gain, self.band_offset, self.band_gamma = hyp.band_gain, hyp.band_offset, hyp.band_gamma
+
+    def __call__(self, batch: dict[str, Any]) -> dict[str, Any]:
+        """Augment a batch of images in [0, 1] and its box labels.
+
+        Args:
+            batch (dict[str, Any]): Collated batch with 'img' (B, C, H, W) float tensor in [0, 1], and 'cls' (N, 1),
+                normalized xywh 'bboxes' (N, 4) and 'batch_idx' (N,) tensors on the same device.
+
+        Returns:
+            (dict[str, Any]): The batch with augmented 'img', 'cls', 'bboxes' and 'batch_idx'.
+        """
+        img = batch["img"]
+        b, _, h, w = img.shape
+        device = img.device
+        mosaic = torch.rand(b, device=device) < self.mosaic
+        wh = torch.tensor([w, h], device=device, dtype=torch.float32)
+        center = (torch.rand(b, 2, device=device) + 0.5) * wh  # mosaic center on the (2h, 2w) canvas
+        center[~mosaic] = 1.5 * wh  # non-mosaic images sit in the middle of the canvas
+        M, s = self.affine_matrices(b, h, w, device)
+
+        idx = batch["batch_idx"].long()
+        gain = wh.repeat(2)
+        boxes = xywh2xyxy(batch["bboxes"].float()) * gain
+        img = self.warp(img, mosaic, center, M)
+        idx, cls, boxes = self.warp_boxes(idx, batch["cls"], boxes, mosaic, center, M, s, (h, w))
+
+        if self.mixup:  # blend with the previous augmented image of the batch
+            mix = torch.rand(b, device=device) < self.mixup
+            r = torch.distributions.Beta(32.0, 32.0).sample((b,)).to(device).view(-1, 1, 1, 1)  # mixup ratio
+            img = torch.where(mix.view(-1, 1, 1, 1), img * r + img.roll(1, 0) * (1 - r), img)
+            j = mix[(idx + 1) % b]  # labels of images that are blended into the next image
+            idx, cls, boxes = torch.cat((idx, (idx[j] + 1) % b)), torch.cat((cls, cls[j])), torch.cat((boxes, boxes[j]))
+
+        for p, dim, xy in (self.fliplr, 3, (0, 2)), (self.flipud, 2, (1, 3)):
+            if p:
+                flip = torch.rand(b, device=device) < p
+                img = torch.where(flip.view(-1, 1, 1, 1), img.flip(dim), img)
+                j = flip[idx]
+                size = w if dim == 3 else h
+                boxes[j, xy[0]], boxes[j, xy[1]] = size - boxes[j, xy[1]], size - boxes[j, xy[0]]
+
+        i = (idx * len(idx) + torch.arange(len(idx), device=device)).argsort()  # group labels by image, stable
+        batch["img"] = self.color(img)
+        batch["cls"] = cls[i]
+        batch["bboxes"] = xyxy2xywh(boxes[i]) / gain
+        batch["batch_idx"] = idx[i].to(batch["batch_idx"].dtype)
+        return batch
+
+    def affine_matrices(self, b: int, h: int, w: int, device) -> tuple[torch.Tensor, torch.Tensor]:
+        """Return random perspective matrices mapping (2h, 2w) mosaic canvas pixels to (h, w) output pixels.
+
+        The matrices are composed like `RandomPerspective.affine_transform`, with one random draw per image.
+
+        Args:
+            b (int): Batch size.
+            h (int): Output height.
+            w (int): Output width.
+            device (torch.device): Device of the returned tensors.
+
+        Returns:
+            M (torch.Tensor): Perspective matrices with shape (B, 3, 3).
+            s (torch.Tensor): Scale gains with shape (B,).
+        """
+
+        def uniform(low, high):
+            """Return b uniform samples in [low, high)."""
+            return torch.rand(b, device=device) * (high - low) + low
+
+        eye = torch.eye(3, device=device).repeat(b, 1, 1)
+        C, P, R, S, T = (eye.clone() for _ in range(5))
+        C[:, 0, 2], C[:, 1, 2] = -w, -h  # canvas center
+        P[:, 2, 0] = uniform(-self.perspective, self.perspective)
+        P[:, 2, 1] = uniform(-self.perspective, self.perspective)
+        a = uniform(-self.degrees, self.degrees) * math.pi / 180
+        s = uniform(1 - self.scale, 1 + self.scale)
+        R[:, 0, 0], R[:, 0, 1] = s * a.cos(), s * a.sin()  # cv2.getRotationMatrix2D(angle=a, center=(0, 0), scale=s)
+        R[:, 1, 0], R[:, 1, 1] = -s * a.sin(), s * a.cos()
+        S[:, 0, 1] = (uniform(-self.shear, self.shear) * math.pi / 180).tan()
+        S[:, 1, 0] = (uniform(-self.shear, self.shear) * math.pi / 180).tan()
+        T[:, 0, 2] = uniform(0.5 - self.translate, 0.5 + self.translate) * w
+        T[:, 1, 2] = uniform(0.5 - self.translate, 0.5 + self.translate) * h
+        return T @ S @ R @ P @ C, s
+
+    @staticmethod
+    def warp(img: torch.Tensor, mosaic: torch.Tensor, center: torch.Tensor, M: torch.Tensor) -> torch.Tensor:
+        """Sample the mosaic and perspective warped images.
+
+        Every output pixel is mapped back onto the mosaic canvas with the inverse matrix. The quadrant it falls in
+        decides which image of the batch it is sampled from, and pixels outside all tiles or outside the (2H, 2W)
+        canvas get the padding value 114, matching `Mosaic` and the canvas clipping of `warp_boxes`.
+
+        Args:
+            img (torch.Tensor): Images with shape (B, C, H, W) in [0, 1].
+            mosaic (torch.Tensor): Whether each output image is a mosaic, with shape (B,).
+            center (torch.Tensor): Mosaic centers (x, y) on the (2H, 2W) canvas with shape (B, 2).
+            M (torch.Tensor): Perspective matrices from canvas to output pixels with shape (B, 3, 3).
+
+        Returns:
+            (torch.Tensor): Augmented images with shape (B, C, H, W).
+        """
+        b, c, h, w = img.shape
+        y, x = torch.meshgrid(torch.arange(h, device=img.device), torch.arange(w, device=img.device), indexing="ij")
+        p = torch.stack((x, y, torch.ones_like(x)), -1).view(1, -1, 3).to(M.dtype)  # output pixels
+        q = p @ torch.linalg.inv(M).transpose(1, 2)
+        q = (q[..., :2] / q[..., 2:]).view(b, h, w, 2)  # canvas pixels
+        right, bottom = q[..., 0] >= center[:, None, None, 0], q[..., 1] >= center[:, None, None, 1]
+        src = torch.cat((img, torch.ones_like(img[:, :1])), 1)  # extra channel measures tile coverage
+        size = torch.tensor([w, h], device=img.device, dtype=q.dtype)
+        inside = ((q >= 0) & (q < 2 * size)).all(-1)  # tiles reaching past the canvas are cut off at its edge
+        out, cover = torch.zeros_like(img), torch.zeros_like(img[:, 0])
+        for k in range(4 if mosaic.any() else 1):
+            origin = center - size * torch.tensor([k % 2 == 0, k < 2], device=img.device)  # tile top-left corner
+            grid = (2 * (q - origin[:, None, None]) + 1) / size - 1  # normalized coordinates, align_corners=False
+            if k:
+                m = (right == (k % 2 == 1)) & (bottom == (k >= 2)) & mosaic.view(-1, 1, 1)
+            else:  # non-mosaic images are sampled from their own tile only
+                m = (~right & ~bottom) | ~mosaic.view(-1, 1, 1)
+            sample = F.grid_sample(src.roll(-k, 0), grid, mode="bilinear", padding_mode="zeros", align_corners=False)
+            m = (m & inside).unsqueeze(1).to(img.dtype)
+            out += sample[:, :c] * m
+            cover += sample[:, c] * m[:, 0]
+        return out + (1 - cover.unsqueeze(1)) * (114 / 255)
+
+    @staticmethod
+    def warp_boxes(
+        idx: torch.Tensor,
+        cls: torch.Tensor,
+        boxes: torch.Tensor,
+        mosaic: torch.Tensor,
+        center: torch.Tensor,
+        M: torch.Tensor,
+        s: torch.Tensor,
+        shape: tuple[int, int],
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Place boxes on the mosaic canvas, warp them with the matching matrices and drop degenerate results.
+
+        Args:
+            idx (torch.Tensor): Image index of each box with shape (N,).
+            cls (torch.Tensor): Classes with shape (N, 1).
+            boxes (torch.Tensor): Boxes in xyxy image pixels with shape (N, 4).
+            mosaic (torch.Tensor): Whether each output image is a mosaic, with shape (B,).
+            center (torch.Tensor): Mosaic centers (x, y) on the canvas with shape (B, 2).
+            M (torch.Tensor): Perspective matrices from canvas to output pixels with shape (B, 3, 3).
+            s (torch.Tensor): Scale gain of each image with shape (B,).
+            shape (tuple[int, int]): Image (h, w).
+
+        Returns:
+            idx (torch.Tensor): Output image index of each kept box with shape (M,).
+            cls (torch.Tensor): Classes of the kept boxes with shape (M, 1).
+            boxes (torch.Tensor): Kept boxes in xyxy output pixels with shape (M, 4).
+        """
+        h, w = shape
+        b = len(mosaic)
+        size = torch.tensor([w, h], device=boxes.device, dtype=boxes.dtype)
+        parts = []
+        for k in range(4 if mosaic.any() else 1):
+            out = (idx - k) % b  # image k of the mosaic of image i is image i + k of the batch
+            j = mosaic[out] if k else torch.ones_like(out, dtype=torch.bool)
+            origin = center[out[j]] - size * torch.tensor([k % 2 == 0, k < 2], device=boxes.device)
+            parts.append((out[j], cls[j], boxes[j] + origin.repeat(1, 2)))
+        idx, cls, boxes = (torch.cat(x) for x in zip(*parts))
+        boxes = torch.min(boxes.clamp(min=0), (2 * size).repeat(2))  # clip to the canvas
+
+        xy = boxes[:, [0, 1, 2, 3, 0, 3, 2, 1]].view(-1, 4, 2)  # x1y1, x2y2, x1y2, x2y1
+        xy = torch.cat((xy, torch.ones_like(xy[..., :1])), -1) @ M[idx].transpose(1, 2)
+        xy = xy[..., :2] / xy[..., 2:]  # perspective rescale or affine
+        new = torch.cat((xy.amin(1), xy.amax(1)), 1)
+        new = torch.min(new.clamp(min=0), size.repeat(2))
+
+        # Filter candidates like RandomPerspective.box_candidates(area_thr=0.1)
+        w1, h1 = (boxes[:, 2] - boxes[:, 0]) * s[idx], (boxes[:, 3] - boxes[:, 1]) * s[idx]
+        w2, h2 = new[:, 2] - new[:, 0], new[:, 3] - new[:, 1]
+        ar = torch.maximum(w2 / (h2 + 1e-16), h2 / (w2 + 1e-16))
+        j = (w2 > 2) & (h2 > 2) & (w2 * h2 / (w1 * h1 + 1e-16) > 0.1) & (ar < 100)
+        return idx[j], cls[j], new[j]
+
+    def color(self, img: torch.Tensor) -> torch.Tensor:
+        """Apply HSV jitter to the first three channels and gain, offset and gamma jitter to auxiliary bands.
+
+        Value and saturation are scaled exactly as in HSV space, while hue is rotated about the gray axis.
+
+        Args:
+            img (torch.Tensor): Images with shape (B, C, H, W) in [0, 1].
+
+        Returns:
+            (torch.Tensor): Jittered images clipped to [0, 1].
+        """
+        b, c = img.shape[:2]
+        if c < 3:  # grayscale
+            return img.clamp_(0, 1)
+        device = img.device
+        if self.hsv_h or self.hsv_s or self.hsv_v:
+            r = torch.rand(b, 3, device=device) * 2 - 1
+            r *= torch.tensor([self.hsv_h, self.hsv_s, self.hsv_v], device=device)  # random gains
+            rgb = img[:, :3]
+            if self.hsv_h:
+                a = r[:, 0] * 2 * math.pi  # hue gain is a fraction of the full hue circle
+                cos, sin = a.cos().view(-1, 1, 1), a.sin().view(-1, 1, 1)
+                k = torch.tensor([[0, -1, 1], [1, 0, -1], [-1, 1, 0]], device=device, dtype=img.dtype)
+                rot = cos * torch.eye(3, device=device) + (1 - cos) / 3 + sin / math.sqrt(3) * k
+                rgb = torch.einsum("bij,bjhw->bihw", rot, rgb).clamp(0, 1)
+            v = rgb.amax(1, keepdim=True)
+            rgb = (v - (v - rgb) * (1 + r[:, 1].view(-1, 1, 1, 1))) * (1 + r[:, 2].view(-1, 1, 1, 1))
+            img = torch.cat((rgb, img[:, 3:]), 1)
+        if c > 3 and (self.band_gain or self.band_offset or self.band_gamma):
+            limits = torch.tensor([self.band_gain, self.band_offset, self.band_gamma], device=device)
+            jitter = (torch.rand(3, b, c - 3, 1, 1, device=device) * 2 - 1) * limits.view(-1, 1, 1, 1, 1)
+            gain, offset, gamma = jitter  # per-image and per-band random gain, offset and gamma
+            bands = img[:, 3:].clamp(0, 1) ** (1 + gamma) * (1 + gain) + offset
+            img = torch.cat((img[:, :3], bands), 1)
+        return img.clamp_(0, 1)
+
+
 def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bool = False):
     """Apply a series of image transformations for training.
 
@@ -2436,7 +2935,14 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
             MixUp(dataset, pre_transform=pre_transform, p=hyp.mixup),
             CutMix(dataset, pre_transform=pre_transform, p=hyp.cutmix),
             Albumentations(p=1.0, transforms=getattr(hyp, "augmentations", None)),
-            RandomHSV(hgain=hyp.hsv_h, sgain=hyp.hsv_s, vgain=hyp.hsv_v),
+            RandomHSV(
+                hgain=hyp.hsv_h,
+                sgain=hyp.hsv_s,
+                vgain=hyp.hsv_v,
+                band_gain=hyp.band_gain,
+                band_offset=hyp.band_offset,
+                band_gamma=hyp.band_gamma,
+            ),
             RandomFlip(direction="vertical", p=hyp.flipud, flip_idx=flip_idx),
             RandomFlip(direction="horizontal", p=hyp.fliplr, flip_idx=flip_idx),
         ]
@@ -6,7 +6,7 @@ import glob
 import math
 import os
 import random
-from copy import deepcopy
+from copy import copy, deepcopy
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Any
@@ -15,10 +15,22 @@ import cv2
 import numpy as np
 from torch.utils.data import Dataset
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, check_file_speeds
+from ultralytics.data.utils import (
+    FORMATS_HELP_MSG,
+    HELP_URL,
+    IMG_FORMATS,
+    LabelStore,
+    check_file_speeds,
+    get_hash,
+    load_dataset_cache_file,
+    save_dataset_cache_file,
+)
 from ultralytics.utils import DEFAULT_CFG, LOCAL_RANK, LOGGER, NUM_THREADS, TQDM
 from ultralytics.utils.patches import imread
 
+# Memory-mapped image shards *.cache index version
+SHARD_CACHE_VERSION = "1.0.0"
+
 
 class BaseDataset(Dataset):
     """Base dataset class for loading and processing image data.
@@ -37,7 +49,7 @@ class BaseDataset(Dataset):
             are in BGR channel order.
         cv2_flag (int): OpenCV flag for reading images.
         im_files (list[str]): List of image file paths.
-        labels (list[dict]): List of label data dictionaries.
+        labels (list[dict] | LabelStore): List of label data dictionaries, or a columnar store that yields them.
         ni (int): Number of images in the dataset.
         rect (bool): Whether to use rectangular training.
         batch_size (int): Size of batches.
@@ -49,7 +61,10 @@ class BaseDataset(Dataset):
         im_hw0 (list): List of original image dimensions (h, w).
         im_hw (list): List of resized image dimensions (h, w).
         npy_files (list[Path]): List of numpy file paths.
-        cache (str): Cache images to RAM or disk during training.
+        shard_files (list[Path]): Memory-mapped image shard files, used when cache='mmap'.
+        shard_index (np.ndarray | None): Per-image (shard, offset, h, w, c, h0, w0) rows into `shard_files`.
+        shards (list[np.memmap] | None): Lazily opened read-only memory maps of `shard_files`.
+        cache (str): Cache images to RAM, disk or memory-mapped shards during training.
         transforms (callable): Image transformation function.
         batch_shapes (np.ndarray): Batch shapes for rectangular training.
         batch (np.ndarray): Batch index of each image.
@@ -57,12 +72,15 @@ class BaseDataset(Dataset):
     Methods:
         get_img_files: Read image files from the specified path.
         update_labels: Update labels to include only specified classes.
+        read_image: Read the full-resolution, all-channel image for a dataset index from disk.
         load_image: Load an image from the dataset.
         cache_images: Cache images to memory or disk.
         cache_images_to_disk: Save an image as an *.npy file for faster loading.
+        cache_images_to_shards: Pack resized images into memory-mapped shard files.
         check_cache_disk: Check image caching requirements vs available disk space.
         check_cache_ram: Check image caching requirements vs available memory.
         set_rectangle: Set the shape of bounding boxes as rectangles.
+        subset: Return a copy of the dataset restricted to a fixed class-stratified fraction of its images.
         get_image_and_label: Get and return label information from the dataset.
         update_labels_info: Custom label format method to be implemented by subclasses.
         build_transforms: Build transformation pipeline to be implemented by subclasses.
@@ -91,7 +109,7 @@ class BaseDataset(Dataset):
         Args:
             img_path (str | list[str]): Path to the folder containing images or list of image paths.
             imgsz (int): Image size for resizing.
-            cache (bool | str): Cache images to RAM or disk during training.
+            cache (bool | str): Cache images to RAM, disk or memory-mapped shards ('mmap') during training.
             augment (bool): If True, data augmentation is applied.
             hyp (dict[str, Any]): Hyperparameters to apply data augmentation.
             prefix (str): Prefix to print in log messages.
@@ -130,9 +148,10 @@ class BaseDataset(Dataset):
         self.buffer = []  # buffer size = batch size
         self.max_buffer_length = min((self.ni, self.batch_size * 8, 1000)) if self.augment else 0
 
-        # Cache images (options are cache = True, False, None, "ram", "disk")
+        # Cache images (options are cache = True, False, None, "ram", "disk", "mmap")
         self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni
         self.npy_files = [Path(f).with_suffix(".npy") for f in self.im_files]
+        self.shard_files, self.shard_index, self.shards = [], None, None
         self.cache = cache.lower() if isinstance(cache, str) else "ram" if cache is True else None
         if self.cache == "ram" and self.check_cache_ram():
             if hyp.deterministic:
@@ -143,6 +162,8 @@ class BaseDataset(Dataset):
             self.cache_images()
         elif self.cache == "disk" and self.check_cache_disk():
             self.cache_images()
+        elif self.cache == "mmap":
+            self.cache_images_to_shards()
 
         # Transforms
         self.transforms = self.build_transforms(hyp=hyp)
@@ -190,6 +211,9 @@ class BaseDataset(Dataset):
         Args:
             include_class (list[int], optional): List of classes to include. If None, all classes are included.
         """
+        if isinstance(self.labels, LabelStore):
+            self.labels = self.labels.filter(include_class, self.single_cls)
+            return
         include_class_array = np.array(include_class).reshape(1, -1)
         for i in range(len(self.labels)):
             if include_class is not None:
@@ -207,6 +231,20 @@ class BaseDataset(Dataset):
             if self.single_cls:
                 self.labels[i]["cls"][:, 0] = 0
 
+    def read_image(self, i: int) -> np.ndarray | None:
+        """Read image 'i' from disk at its original resolution with all of its channels.
+
+        Subclasses reading multi-source (e.g. RGB + auxiliary band) images override this method so the stacked result
+        flows through the resize, RAM/disk cache and mosaic buffer logic in `load_image`.
+
+        Args:
+            i (int): Index of the image to read.
+
+        Returns:
+            (np.ndarray | None): Image as an HWC NumPy array (BGR for color images), or None if reading fails.
+        """
+        return imread(self.im_files[i], flags=self.cv2_flag)  # BGR
+
     def load_image(self, i: int, rect_mode: bool = True) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
         """Load an image from dataset index 'i'.
 
@@ -222,6 +260,12 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If the image file is not found.
         """
+        if self.shard_index is not None:  # zero-copy read-only view into memory-mapped shards
+            if self.shards is None:  # map lazily so each DataLoader worker shares the OS page cache
+                self.shards = [np.memmap(f, dtype=np.uint8, mode="r") for f in self.shard_files]
+            s, o, h, w, c, h0, w0 = self.shard_index[i].tolist()
+            return self.shards[s][o : o + h * w * c].reshape(h, w, c), (h0, w0), (h, w)
+
         im, f, fn = self.ims[i], self.im_files[i], self.npy_files[i]
         if im is None:  # not cached in RAM
             if fn.exists():  # load npy
@@ -230,9 +274,9 @@ class BaseDataset(Dataset):
                 except Exception as e:
                     LOGGER.warning(f"{self.prefix}Removing corrupt *.npy image file {fn} due to: {e}")
                     Path(fn).unlink(missing_ok=True)
-                    im = imread(f, flags=self.cv2_flag)  # BGR
+                    im = self.read_image(i)
             else:  # read image
-                im = imread(f, flags=self.cv2_flag)  # BGR
+                im = self.read_image(i)
             if im is None:
                 raise FileNotFoundError(f"Image Not Found {f}")
 
@@ -280,7 +324,68 @@ class BaseDataset(Dataset):
         """Save an image as an *.npy file for faster loading."""
         f = self.npy_files[i]
         if not f.exists():
-            np.save(f.as_posix(), imread(self.im_files[i]), allow_pickle=False)
+            np.save(f.as_posix(), self.read_image(i), allow_pickle=False)
+
+    def cache_images_to_shards(self, max_shard_bytes: int = 4 << 30) -> None:
+        """Pack all images, resized to `imgsz`, into a few large uint8 shard files read back with `np.memmap`.
+
+        Shards are written next to the dataset `img_path` together with an offset index and reused by later runs while
+        the image files, auxiliary bands, `imgsz` and channel count are unchanged. Under DDP only local rank 0 packs
+        them; datasets are built on rank 0 first, so the other ranks reuse its shards or read images directly.
+
+        Args:
+            max_shard_bytes (int): Maximum size of a single shard file in bytes.
+        """
+        if isinstance(self.img_path, list):  # several dirs or files, named after the first and keyed on all of them
+            p, key = Path(self.img_path[0]), get_hash([str(x) for x in self.img_path])[:8]
+            path = p.parent / f"{p.stem if p.is_file() else p.name}-{key}.shards"
+        else:
+            p = Path(self.img_path)
+            path = p.parent / f"{p.stem if p.is_file() else p.name}.shards"  # i.e. images/train.shards/, train.shards/
+        if isinstance(self.labels, LabelStore):
+            aux_files = [f for i in range(len(self.labels)) for f in self.labels.aux_files_of(i)]
+        else:
+            aux_files = [f for lb in self.labels for f in lb.get("aux_files", ())]
+        h = get_hash(self.im_files + aux_files + [f"imgsz={self.imgsz}", f"channels={self.channels}"])
+        try:
+            x = load_dataset_cache_file(path / "index.cache")
+            assert x["version"] == SHARD_CACHE_VERSION and x["hash"] == h  # matches current images and settings
+            assert all((path / f).is_file() for f in x["shards"])
+        except (FileNotFoundError, AssertionError, AttributeError, ModuleNotFoundError):
+            if LOCAL_RANK > 0:  # shards are packed by local rank 0 only
+                LOGGER.warning(f"{self.prefix}Memory-mapped shards not found in {path}, reading images directly")
+                self.cache = None
+                return
+            if not self.check_cache_disk():
+                self.cache = None
+                return
+            path.mkdir(parents=True, exist_ok=True)
+            x = {"hash": h, "shards": [], "index": np.zeros((self.ni, 7), dtype=np.int64)}  # shard, offset, hwc, hw0
+            b, gb, file, offset = 0, 1 << 30, None, 0
+            with ThreadPool(NUM_THREADS) as pool:
+                results = pool.imap(self.load_image, range(self.ni))
+                pbar = TQDM(enumerate(results), total=self.ni, disable=LOCAL_RANK > 0)
+                for i, (im, hw0, hw) in pbar:
+                    if im.dtype != np.uint8:
+                        raise TypeError(
+                            f"{self.prefix}cache='mmap' requires uint8 images, {self.im_files[i]} is {im.dtype}"
+                        )
+                    if file is None or offset + im.nbytes > max_shard_bytes:  # start a new shard
+                        if file:
+                            file.close()
+                        x["shards"].append(f"shard{len(x['shards'])}.bin")
+                        file, offset = open(path / x["shards"][-1], "wb"), 0
+                    file.write(np.ascontiguousarray(im).data)
+                    x["index"][i] = len(x["shards"]) - 1, offset, *im.shape, *hw0
+                    offset += im.nbytes
+                    b += im.nbytes
+                    pbar.desc = f"{self.prefix}Caching images ({b / gb:.1f}GB memory-mapped shards)"
+                pbar.close()
+            file.close()
+            self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni  # free buffer
+            self.buffer.clear()
+            save_dataset_cache_file(self.prefix, path / "index.cache", x, SHARD_CACHE_VERSION)  # written last
+        self.shard_files, self.shard_index = [path / f for f in x["shards"]], x["index"]
 
     def check_cache_disk(self, safety_margin: float = 0.5) -> bool:
         """Check if there's enough disk space for caching images.
@@ -296,8 +401,8 @@ class BaseDataset(Dataset):
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
         n = min(self.ni, 30)  # extrapolate from 30 random images
         for _ in range(n):
-            im_file = random.choice(self.im_files)
-            im = imread(im_file)
+            j = random.randrange(self.ni)
+            im_file, im = self.im_files[j], self.read_image(j)
             if im is None:
                 continue
             b += im.nbytes
@@ -329,7 +434,7 @@ class BaseDataset(Dataset):
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
         n = min(self.ni, 30)  # extrapolate from 30 random images
         for _ in range(n):
-            im = imread(random.choice(self.im_files))  # sample image
+            im = self.read_image(random.randrange(self.ni))  # sample image
             if im is None:
                 continue
             ratio = self.imgsz / max(im.shape[0], im.shape[1])  # max(h, w)  # ratio
@@ -351,11 +456,12 @@ class BaseDataset(Dataset):
         bi = np.floor(np.arange(self.ni) / self.batch_size).astype(int)  # batch index
         nb = bi[-1] + 1  # number of batches
 
-        s = np.array([x.pop("shape") for x in self.labels])  # hw
+        store = isinstance(self.labels, LabelStore)
+        s = self.labels.shapes if store else np.array([x["shape"] for x in self.labels])  # hw
         ar = s[:, 0] / s[:, 1]  # aspect ratio
-        irect = ar.argsort()
+        irect = ar.argsort(kind="stable")  # stable so already sorted subsets keep their order
         self.im_files = [self.im_files[i] for i in irect]
-        self.labels = [self.labels[i] for i in irect]
+        self.labels = self.labels[irect] if store else [self.labels[i] for i in irect]
         ar = ar[irect]
 
         # Set training image shapes
@@ -371,6 +477,56 @@ class BaseDataset(Dataset):
         self.batch_shapes = np.ceil(np.array(shapes) * self.imgsz / self.stride + self.pad).astype(int) * self.stride
         self.batch = bi  # batch index of image
 
+    def subset(self, fraction: float, seed: int = 0) -> BaseDataset:
+        """Return a copy of the dataset restricted to a fixed class-stratified fraction of its images.
+
+        Classes are visited from rarest to most common and images containing each class are drawn with a fixed seed
+        until every class keeps at least `fraction` of its images, so rare classes stay represented. Background images
+        are sampled at the same fraction. Cached images and memory-mapped shards are shared with this dataset.
+
+        Args:
+            fraction (float): Fraction of images to keep, between 0 and 1.
+            seed (int): Random seed for a reproducible selection.
+
+        Returns:
+            (BaseDataset): Shallow copy of the dataset over the selected images, in their original order.
+        """
+        rng = np.random.default_rng(seed)
+        if isinstance(self.labels, LabelStore):
+            cls = np.split(self.labels.cls.reshape(-1).astype(int), self.labels.offsets[1:-1])
+        else:
+            cls = [lb["cls"].reshape(-1).astype(int) for lb in self.labels]
+        n = np.bincount(np.concatenate(cls), minlength=1) if cls else np.zeros(1, int)
+        images = [[] for _ in range(len(n))]  # image indices containing each class
+        for i, c in enumerate(cls):
+            for j in np.unique(c):
+                images[j].append(i)
+        selected, counts = np.zeros(self.ni, dtype=bool), np.zeros(len(n), dtype=int)
+        for j in np.argsort(n, kind="stable"):
+            for i in rng.permutation(images[j]):
+                if counts[j] >= math.ceil(n[j] * fraction):
+                    break
+                if not selected[i]:
+                    selected[i] = True
+                    counts[np.unique(cls[i])] += 1
+        background = [i for i, c in enumerate(cls) if not len(c)]
+        selected[rng.permutation(background)[: math.ceil(len(background) * fraction)]] = True
+        index = np.flatnonzero(selected)
+
+        dataset = copy(self)
+        dataset.im_files = [self.im_files[i] for i in index]
+        dataset.labels = self.labels[index] if isinstance(self.labels, LabelStore) else [self.labels[i] for i in index]
+        dataset.ims = [self.ims[i] for i in index]
+        dataset.im_hw0 = [self.im_hw0[i] for i in index]
+        dataset.im_hw = [self.im_hw[i] for i in index]
+        dataset.npy_files = [self.npy_files[i] for i in index]
+        if self.shard_index is not None:
+            dataset.shard_index = self.shard_index[index]
+        dataset.ni = len(index)
+        if self.rect:
+            dataset.set_rectangle()
+        return dataset
+
     def __getitem__(self, index: int) -> dict[str, Any]:
         """Return transformed label information for given index."""
         return self.transforms(self.get_image_and_label(index))
@@ -384,8 +540,11 @@ class BaseDataset(Dataset):
         Returns:
             (dict[str, Any]): Label dictionary with image and metadata.
         """
-        label = deepcopy(self.labels[index])  # requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
+        # Transforms modify labels in place, requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
+        store = isinstance(self.labels, LabelStore)
+        label = self.labels[index] if store else deepcopy(self.labels[index])  # LabelStore returns fresh arrays
         label.pop("shape", None)  # shape is for rect, remove it
+        label.pop("aux_files", None)  # auxiliary band files are consumed by read_image
         label["img"], label["ori_shape"], label["resized_shape"] = self.load_image(index)
         label["ratio_pad"] = (
             label["resized_shape"][0] / label["ori_shape"][0],
@@ -416,9 +575,11 @@ class BaseDataset(Dataset):
         """
         raise NotImplementedError
 
-    def get_labels(self) -> list[dict[str, Any]]:
+    def get_labels(self) -> list[dict[str, Any]] | LabelStore:
         """Users can customize their own format here.
 
+        A list of dictionaries can be wrapped in a `LabelStore` to keep worker memory flat on large datasets.
+
         Examples:
             Ensure output is a dictionary with the following keys:
             >>> dict(
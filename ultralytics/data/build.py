@@ -20,11 +20,13 @@ from ultralytics.cfg import IterableSimpleNamespace
 from ultralytics.data.dataset import GroundingDataset, YOLODataset, YOLOMultiModalDataset
 from ultralytics.data.loaders import (
     LOADERS,
+    LoadImageBands,
     LoadImagesAndVideos,
     LoadPilAndNumpy,
     LoadScreenshots,
     LoadStreams,
     LoadTensor,
+    LoadTiffWindows,
     SourceTypes,
     autocast_list,
 )
@@ -382,6 +384,8 @@ def check_source(
         from_img = True
     elif isinstance(source, torch.Tensor):
         tensor = True
+    elif isinstance(source, dict):  # multispectral band manifest
+        pass
     else:
         raise TypeError("Unsupported image type. For supported types see https://docs.ultralytics.com/modes/predict")
 
@@ -394,15 +398,20 @@ def load_inference_source(
     vid_stride: int = 1,
     buffer: bool = False,
     channels: int = 3,
+    window: int = 0,
+    overlap: float = 0.0,
 ):
     """Load an inference source for object detection and apply necessary transformations.
 
     Args:
-        source (str | Path | list | tuple | torch.Tensor | PIL.Image | np.ndarray): The input source for inference.
+        source (str | Path | list | tuple | dict | torch.Tensor | PIL.Image | np.ndarray): The input source for
+            inference, a dict or YAML file pairing images with auxiliary band files.
         batch (int, optional): Batch size for dataloaders.
         vid_stride (int, optional): The frame interval for video sources.
         buffer (bool, optional): Whether stream frames will be buffered.
         channels (int, optional): The number of input channels for the model.
+        window (int, optional): Window size for reading a single TIFF file window by window, 0 reads it whole.
+        overlap (float, optional): Fractional overlap between TIFF windows.
 
     Returns:
         (Dataset): A dataset object for the specified input source with attached source_type attribute.
@@ -428,6 +437,10 @@ def load_inference_source(
         dataset = LoadScreenshots(source, channels=channels)
     elif from_img:
         dataset = LoadPilAndNumpy(source, channels=channels)
+    elif isinstance(source, dict) or source.lower().endswith((".yaml", ".yml")):
+        dataset = LoadImageBands(source, batch=batch, channels=channels)
+    elif window and source.lower().endswith((".tif", ".tiff")) and Path(source).is_file():  # large orthomosaics
+        dataset = LoadTiffWindows(source, window=window, overlap=overlap, batch=batch, channels=channels)
     else:
         dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride, channels=channels)
 
@@ -9,7 +9,6 @@ from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Any
 
-import os
 import cv2
 import numpy as np
 import torch
@@ -22,6 +21,7 @@ from ultralytics.utils.ops import resample_segments, segments2boxes
 from ultralytics.utils.torch_utils import TORCHVISION_0_18
 
 from .augment import (
+    BatchAugment,
     Compose,
     Format,
     LetterBox,
@@ -34,17 +34,20 @@ from .base import BaseDataset
 from .converter import merge_multi_segment
 from .utils import (
     HELP_URL,
+    LabelStore,
     check_file_speeds,
     get_hash,
     img2label_paths,
     load_dataset_cache_file,
+    read_band,
     save_dataset_cache_file,
     verify_image,
+    verify_image_bands,
     verify_image_label,
 )
 
 # Ultralytics dataset *.cache version, >= 1.0.0 for Ultralytics YOLO models
-DATASET_CACHE_VERSION = "1.0.3"
+DATASET_CACHE_VERSION = "1.0.4"
 
 
 class YOLODataset(BaseDataset):
@@ -58,8 +61,13 @@ class YOLODataset(BaseDataset):
         use_keypoints (bool): Indicates if keypoints should be used for pose estimation.
         use_obb (bool): Indicates if oriented bounding boxes should be used.
         data (dict): Dataset configuration dictionary.
+        bands (list[dict]): Auxiliary band declarations from the data YAML, each with a root 'path' and optional
+            'suffixes'.
+        batch_transforms (BatchAugment | None): Batched augmentation the trainer applies after collation when
+            'batch_augment' is enabled.
 
     Methods:
+        read_image: Read an image and stack auxiliary bands up to the dataset channel count.
         cache_labels: Cache dataset labels, check images and read shapes.
         get_labels: Return dictionary of labels for YOLO training.
         build_transforms: Build and append transforms to the list.
@@ -85,56 +93,40 @@ class YOLODataset(BaseDataset):
         self.use_keypoints = task == "pose"
         self.use_obb = task == "obb"
         self.data = data
+        self.bands = data.get("bands") or []  # auxiliary single-band images stacked after the image channels
         assert not (self.use_segments and self.use_keypoints), "Can not use both segments and keypoints."
         super().__init__(*args, channels=self.data.get("channels", 3), **kwargs)
 
-    def load_image(self, i):
-        """
-        Custom Loader: Ghép ảnh từ 'dataset_raw' và 'dataset_ndvi'.
-        Tự động dò tìm đuôi file (jpg, png, tif) của ảnh NDVI.
-        """
+    def read_image(self, i: int) -> np.ndarray | None:
+        """Read image 'i' and stack its auxiliary bands (e.g. NDVI) declared under 'bands' in the data YAML.
+
+        Band files are resolved once by `cache_labels` and stored in `labels.cache`, so no filesystem probing happens
+        here. Bands are resized to the primary image if sizes differ, and resizing to `imgsz` and RAM/disk caching are
+        then handled once for the stacked image by `BaseDataset.load_image`.
+
+        Args:
+            i (int): Index of the image to read.
+
+        Returns:
+            (np.ndarray | None): Stacked HWC image, or None if the primary image cannot be read.
 
-        # 1. Lấy đường dẫn ảnh gốc (từ dataset_raw)
-        f_base = self.im_files[i]
-        im_base = cv2.imread(f_base)  # (H, W, 3)
-
-        if im_base is None:
-             raise FileNotFoundError(f'[Lỗi] Không tìm thấy ảnh gốc: {f_base}')
-
-        # 2. Tạo đường dẫn cơ sở sang folder NDVI
-        # Thay thế folder cha 'dataset_raw' bằng 'dataset_ndvi'
-        f_ndvi_base = f_base.replace('/dataset_raw/', '/dataset_ndvi/')
-        
-        f_ndvi_no_ext = os.path.splitext(f_ndvi_base)[0]
-
-        # 3. Dò tìm file NDVI 
-        im_ndvi = None
-        # Danh sách đuôi ưu tiên: png (phổ biến cho mask/ndvi), tif, jpg
-        valid_extensions = ['.png', '.tif', '.tiff', '.jpg', '.jpeg']
-        
-        found_path = ""
-        for ext in valid_extensions:
-            path_check = f_ndvi_no_ext + ext
-            if os.path.exists(path_check):
-                found_path = path_check
-                # Load ảnh (flag=-1 để giữ nguyên depth nếu là tif, hoặc 0 cho gray)
-                im_ndvi = cv2.imread(path_check, cv2.IMREAD_GRAYSCALE)
-                break
-        
-        if im_ndvi is None:
-            debug_path = f_ndvi_no_ext + ".[png|tif|jpg]"
-            raise FileNotFoundError(f'[Lỗi] Không tìm thấy file NDVI (đã thử png, tif, jpg).\nĐường dẫn gốc: {debug_path}')
-
-        # 4. Kiểm tra kích thước (Resize NDVI nếu lệch)
-        if im_ndvi.shape != im_base.shape[:2]:
-            im_ndvi = cv2.resize(im_ndvi, (im_base.shape[1], im_base.shape[0]))
-
-        # 5. GHÉP KÊNH (Stacking) -> (H,W,4)
-        im_final = np.concatenate((im_base, im_ndvi[:, :, None]), axis=2)
-
-        # 6. Trả về kết quả
-        h0, w0 = im_final.shape[:2]
-        return im_final, (h0, w0), im_final.shape[:2]
+        Raises:
+            FileNotFoundError: If an auxiliary band file cannot be read.
+        """
+        im = super().read_image(i)
+        if im is None or not self.bands:
+            return im
+        h, w = im.shape[:2]
+        ims = [im]
+        for f in self.labels.aux_files_of(i):
+            aux = read_band(f)  # single-channel uint8, also for 16-bit, float or multi-page TIFFs
+            if aux is None:
+                raise FileNotFoundError(f"{self.prefix}Auxiliary band not found {f}")
+            if aux.shape[:2] != (h, w):
+                aux = cv2.resize(aux, (w, h), interpolation=cv2.INTER_LINEAR)[..., None]
+            assert aux.shape[2] == 1, f"{self.prefix}Auxiliary band {f} is not single-channel"
+            ims.append(aux)
+        return np.concatenate(ims, axis=2)
 
     def cache_labels(self, path: Path = Path("./labels.cache")) -> dict:
         """Cache dataset labels, check images and read shapes.
@@ -193,30 +185,54 @@ class YOLODataset(BaseDataset):
                 pbar.desc = f"{desc} {nf} images, {nm + ne} backgrounds, {nc} corrupt"
             pbar.close()
 
+            if self.bands:  # resolve auxiliary band files once so later epochs and runs do no filesystem probing
+                results = pool.imap(
+                    func=verify_image_bands,
+                    iterable=zip(
+                        [lb["im_file"] for lb in x["labels"]],
+                        [lb["shape"] for lb in x["labels"]],
+                        repeat(str(self.data.get("path", ""))),
+                        repeat(self.bands),
+                        repeat(self.prefix),
+                    ),
+                )
+                labels = []
+                for lb, (aux_files, msg) in zip(x["labels"], results):
+                    if msg:
+                        msgs.append(msg)
+                    if aux_files is None:
+                        nc += 1
+                        continue
+                    lb["aux_files"] = aux_files
+                    labels.append(lb)
+                x["labels"] = labels
+        x["labels"] = LabelStore(x["labels"])  # columnar store, shared copy-on-write by dataloader workers
+
         if msgs:
             LOGGER.info("\n".join(msgs))
         if nf == 0:
             LOGGER.warning(f"{self.prefix}No labels found in {path}. {HELP_URL}")
-        x["hash"] = get_hash(self.label_files + self.im_files)
+        x["hash"] = get_hash(self.label_files + self.im_files + [str(b) for b in self.bands])
         x["results"] = nf, nm, ne, nc, len(self.im_files)
         x["msgs"] = msgs  # warnings
         save_dataset_cache_file(self.prefix, path, x, DATASET_CACHE_VERSION)
         return x
 
-    def get_labels(self) -> list[dict]:
+    def get_labels(self) -> LabelStore:
         """Return dictionary of labels for YOLO training.
 
         This method loads labels from disk or cache, verifies their integrity, and prepares them for training.
 
         Returns:
-            (list[dict]): List of label dictionaries, each containing information about an image and its annotations.
+            (LabelStore): Columnar label store that yields a label dictionary per image, containing information about
+                the image and its annotations.
         """
         self.label_files = img2label_paths(self.im_files)
         cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
         try:
             cache, exists = load_dataset_cache_file(cache_path), True  # attempt to load a *.cache file
             assert cache["version"] == DATASET_CACHE_VERSION  # matches current version
-            assert cache["hash"] == get_hash(self.label_files + self.im_files)  # identical hash
+            assert cache["hash"] == get_hash(self.label_files + self.im_files + [str(b) for b in self.bands])
         except (FileNotFoundError, AssertionError, AttributeError, ModuleNotFoundError):
             cache, exists = self.cache_labels(cache_path), False  # run cache ops
 
@@ -235,19 +251,18 @@ class YOLODataset(BaseDataset):
             raise RuntimeError(
                 f"No valid images found in {cache_path}. Images with incorrectly formatted labels are ignored. {HELP_URL}"
             )
-        self.im_files = [lb["im_file"] for lb in labels]  # update im_files
+        self.im_files = labels.im_files  # update im_files
 
         # Check if the dataset is all boxes or all segments
-        lengths = ((len(lb["cls"]), len(lb["bboxes"]), len(lb["segments"])) for lb in labels)
-        len_cls, len_boxes, len_segments = (sum(x) for x in zip(*lengths))
+        len_cls, len_boxes = len(labels.cls), len(labels.bboxes)
+        len_segments = int(np.diff(labels.offsets)[labels.has_segments].sum())
         if len_segments and len_boxes != len_segments:
             LOGGER.warning(
                 f"Box and segment counts should be equal, but got len(segments) = {len_segments}, "
                 f"len(boxes) = {len_boxes}. To resolve this only boxes will be used and all segments will be removed. "
                 "To avoid this please supply either a detect or segment dataset, not a detect-segment mixed dataset."
             )
-            for lb in labels:
-                lb["segments"] = []
+            labels.clear_segments()
         if len_cls == 0:
             LOGGER.warning(f"Labels are missing or empty in {cache_path}, training may not work correctly. {HELP_URL}")
         return labels
@@ -261,11 +276,20 @@ class YOLODataset(BaseDataset):
         Returns:
             (Compose): Composed transforms.
         """
+        self.batch_transforms = None
         if self.augment:
             hyp.mosaic = hyp.mosaic if self.augment and not self.rect else 0.0
             hyp.mixup = hyp.mixup if self.augment and not self.rect else 0.0
             hyp.cutmix = hyp.cutmix if self.augment and not self.rect else 0.0
-            transforms = v8_transforms(self, self.imgsz, hyp)
+            batch_augment = getattr(hyp, "batch_augment", False)
+            if batch_augment and (self.use_segments or self.use_keypoints or self.use_obb):
+                LOGGER.warning(f"{self.prefix}'batch_augment' supports box labels only, using per-image augmentation.")
+                batch_augment = False
+            if batch_augment:  # workers only letterbox, the trainer augments whole batches on its device
+                self.batch_transforms = BatchAugment(self.imgsz, hyp)
+                transforms = Compose([LetterBox(new_shape=(self.imgsz, self.imgsz))])
+            else:
+                transforms = v8_transforms(self, self.imgsz, hyp)
         else:
             transforms = Compose([LetterBox(new_shape=(self.imgsz, self.imgsz), scaleup=False)])
         transforms.append(
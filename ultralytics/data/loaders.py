@@ -7,6 +7,8 @@ import math
 import os
 import time
 import urllib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Thread
@@ -17,8 +19,8 @@ import numpy as np
 import torch
 from PIL import Image
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, IMG_FORMATS, VID_FORMATS
-from ultralytics.utils import IS_COLAB, IS_KAGGLE, LOGGER, ops
+from ultralytics.data.utils import AUX_FORMATS, FORMATS_HELP_MSG, IMG_FORMATS, VID_FORMATS, read_band
+from ultralytics.utils import IS_COLAB, IS_KAGGLE, LOGGER, NUM_THREADS, YAML, ops
 from ultralytics.utils.checks import check_requirements
 from ultralytics.utils.patches import imread
 
@@ -482,6 +484,345 @@ class LoadImagesAndVideos:
         return math.ceil(self.nf / self.bs)  # number of batches
 
 
+class LoadImageBands:
+    """A class for loading multispectral images that pair each primary image with its auxiliary band files.
+
+    Image and band files are paired once up front, either from band directories indexed by file stem and folder or
+    from an explicit manifest. Images are then decoded and stacked into N-channel HWC arrays ahead of time by background
+    threads, so disk I/O and decoding overlap with inference.
+
+    Attributes:
+        files (list[list[str]]): Primary image followed by its band files, for each image.
+        nf (int): Number of images.
+        bs (int): Batch size.
+        mode (str): Source mode, always 'image'.
+        count (int): Number of images returned so far, reset by __iter__().
+        workers (int): Number of background decode threads.
+        prefetch (int): Maximum number of images decoded ahead of the consumer.
+
+    Methods:
+        __init__: Pair image and band files and start the decode thread pool.
+        __iter__: Reset the iterator and start prefetching images.
+        __next__: Return the next batch of stacked images with their paths and metadata.
+        close: Cancel pending decodes and stop the thread pool.
+        read: Read and stack the band files of one image.
+        __len__: Return the number of batches.
+
+    Examples:
+        >>> source = {"images": "dataset_raw/images/test", "bands": ["dataset_ndvi/images/test"]}
+        >>> for paths, imgs, info in LoadImageBands(source, batch=8):
+        ...     pass  # imgs is a list of (H, W, 4) uint8 BGR + NDVI arrays
+
+    Notes:
+        The source is a dict or a YAML file with either:
+        - 'images', a directory, glob or *.txt list as accepted by LoadImagesAndVideos, and 'bands', a list of band
+          directories or {'path': ..., 'suffixes': [...]} dicts as in the data YAML. Bands are matched by file stem;
+          if several band files share a stem, the one whose directories match the image path the most is used, so
+          `images/val/x.jpg` pairs with `<band path>/images/val/x.png` rather than `<band path>/images/train/x.png`.
+        - 'files', a manifest given as a list of [image, band, ...] rows or a text file with one comma-separated row
+          per image.
+        Relative paths in a YAML file are resolved against the YAML file directory.
+    """
+
+    def __init__(self, source: str | Path | dict, batch: int = 1, channels: int = 3, workers: int = NUM_THREADS):
+        """Initialize the multispectral image loader.
+
+        Args:
+            source (str | Path | dict): Band manifest dict or YAML file, see the class notes for the format.
+            batch (int): Batch size for processing.
+            channels (int): Number of model input channels, used to check the number of stacked bands.
+            workers (int): Number of background decode threads.
+        """
+        cfg = source if isinstance(source, dict) else YAML.load(source)
+        root = Path() if isinstance(source, dict) else Path(source).parent
+        if "files" in cfg:  # manifest
+            rows = cfg["files"]
+            if isinstance(rows, (str, Path)):
+                rows = [x.split(",") for x in (root / rows).read_text().splitlines() if x.strip()]
+            files = [[str(root / f.strip()) for f in row] for row in rows]
+        else:  # band directories indexed by stem once, instead of searched per image
+
+            def shared_dirs(a: tuple[str, ...], b: tuple[str, ...]) -> int:
+                """Return the number of trailing directory names two parent paths have in common."""
+                n = 0
+                while n < min(len(a), len(b)) and a[-1 - n] == b[-1 - n]:
+                    n += 1
+                return n
+
+            images = LoadImagesAndVideos(str(root / cfg["images"]))
+            files = [[f] for f in images.files[: images.ni]]
+            for band in cfg.get("bands") or []:
+                band = band if isinstance(band, dict) else {"path": band}
+                rank = {"." + x.lstrip(".").lower(): k for k, x in enumerate(band.get("suffixes", AUX_FORMATS))}
+                index = {}  # stem -> [(parent dirs, suffix rank, file)]
+                for f in (root / band["path"]).rglob("*"):
+                    k = rank.get(f.suffix.lower())
+                    if k is not None:
+                        index.setdefault(f.stem, []).append((f.parent.parts, k, str(f)))
+                for row in files:
+                    p = Path(row[0])
+                    best = max(  # same stem in several folders, i.e. splits: prefer the one mirroring the image path
+                        index.get(p.stem, ()), key=lambda x: (shared_dirs(x[0], p.parent.parts), -x[1]), default=None
+                    )
+                    row.append(best and best[2])
+            n = len(files)
+            files = [row for row in files if None not in row]
+            if n > len(files):
+                LOGGER.warning(f"Skipping {n - len(files)}/{n} images with missing band files")
+        if not files:
+            raise FileNotFoundError(f"No images with band files found in {source}. {FORMATS_HELP_MSG}")
+        if channels != 2 + len(files[0]):
+            LOGGER.warning(f"Stacked images have {2 + len(files[0])} channels but the model expects {channels}")
+
+        self.files = files
+        self.nf = len(files)
+        self.bs = batch
+        self.mode = "image"
+        self.count = 0
+        self.workers = min(workers, self.nf)
+        self.prefetch = max(2 * batch, self.workers)
+        self.pool, self.queue = None, deque()
+
+    def __iter__(self):
+        """Reset the iterator and start decoding the first images in the background."""
+        self.close()
+        self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="LoadImageBands")
+        self.count = 0
+        self.queue = deque(self.pool.submit(self.read, f) for f in self.files[: self.prefetch])
+        return self
+
+    def __next__(self) -> tuple[list[str], list[np.ndarray], list[str]]:
+        """Return the next batch of stacked images with their paths and metadata."""
+        paths, imgs, info = [], [], []
+        while len(imgs) < self.bs and self.count < self.nf:
+            im0 = self.queue.popleft().result()
+            if self.count + self.prefetch < self.nf:  # keep the prefetch window full
+                self.queue.append(self.pool.submit(self.read, self.files[self.count + self.prefetch]))
+            path = self.files[self.count][0]
+            self.count += 1
+            if im0 is None:
+                LOGGER.warning(f"Image Read Error {path}")
+            else:
+                paths.append(path)
+                imgs.append(im0)
+                info.append(f"image {self.count}/{self.nf} {path}: ")
+        if not imgs:
+            self.close()
+            raise StopIteration
+        return paths, imgs, info
+
+    def close(self):
+        """Cancel pending decodes and stop the thread pool."""
+        for f in self.queue:
+            f.cancel()
+        self.queue.clear()
+        if self.pool:
+            self.pool.shutdown(wait=False)
+
+    @staticmethod
+    def read(files: list[str]) -> np.ndarray | None:
+        """Read a BGR image and stack its grayscale band files as extra channels, resized to the image size.
+
+        Args:
+            files (list[str]): Primary image file followed by its band files.
+
+        Returns:
+            (np.ndarray | None): Stacked HWC image, or None if any file cannot be read.
+        """
+        im = imread(files[0], flags=cv2.IMREAD_COLOR)
+        bands = [read_band(f) for f in files[1:]]  # single-channel uint8, also for 16-bit or float TIFFs
+        if im is None or any(b is None for b in bands):
+            return None
+        h, w = im.shape[:2]
+        return np.dstack([im] + [b if b.shape[:2] == (h, w) else cv2.resize(b, (w, h)) for b in bands])
+
+    def __len__(self) -> int:
+        """Return the number of batches."""
+        return math.ceil(self.nf / self.bs)
+
+
+class LoadTiffWindows:
+    """A class for reading large multiband TIFF orthomosaics window by window.
+
+    The mosaic is never decoded as a whole. Uncompressed, contiguous TIFFs are memory-mapped and windows are sliced
+    directly from the file. Tiled or striped (optionally compressed) TIFFs are read through a zarr view that decodes
+    only the TIFF tiles or strips a window overlaps. Windows are read ahead by a background thread, so peak memory
+    depends on the window size and batch size, not on the mosaic size.
+
+    Each window is predicted as a separate image, so its results are in window pixel coordinates and windows overlap.
+    Calling `to_mosaic()` on the window results is a required step to get detections in mosaic pixel coordinates with
+    the duplicates from overlapping windows merged.
+
+    Attributes:
+        path (str): Path to the TIFF file.
+        shape (tuple[int, int]): Mosaic shape (height, width).
+        grid (np.ndarray): Window boxes of shape (N, 4) as (x0, y0, x1, y1) mosaic pixel coordinates.
+        offsets (dict[str, tuple[int, int]]): Global (x0, y0) offset of each window, keyed by window path.
+        nf (int): Number of windows.
+        bs (int): Batch size.
+        mode (str): Source mode, always 'image'.
+        count (int): Number of windows returned so far, reset by __iter__().
+        mmap (bool): Whether windows are sliced from a memory map rather than decoded through zarr.
+
+    Methods:
+        __iter__: Reset the iterator and start prefetching windows.
+        __next__: Return the next batch of windows with their paths and metadata.
+        read: Read one window as an HWC uint8 array.
+        to_mosaic: Map window detections to mosaic coordinates and merge overlapping duplicates.
+        open: Open the TIFF file and its memory map or zarr view.
+        close: Cancel pending reads, stop the prefetch thread and close the TIFF file.
+        __len__: Return the number of batches.
+
+    Examples:
+        >>> dataset = LoadTiffWindows("orthomosaic.tif", window=1280, overlap=0.2, batch=8)
+        >>> results = [r for r in model.predict(dataset, stream=True)]  # window pixel coordinates
+        >>> boxes = dataset.to_mosaic(results)  # (N, 6) xyxy, conf, cls in mosaic pixels
+        >>> results = model.predict("orthomosaic.tif", tile=1280)  # read window by window by the predictor
+        >>> boxes = model.predictor.dataset.to_mosaic(results)
+
+    Notes:
+        Windows are named '<stem>_<x0>_<y0><suffix>' next to the mosaic, so saved predictions identify their window.
+        Band order follows cv2.imread: the first three bands are returned as BGR, extra bands keep their order. uint16
+        bands are reduced to 8 bits like cv2 does.
+    """
+
+    def __init__(self, path: str | Path, window: int = 1280, overlap: float = 0.2, batch: int = 1, channels: int = 3):
+        """Open a TIFF mosaic and compute its window grid.
+
+        Args:
+            path (str | Path): Path to a (Geo)TIFF file.
+            window (int): Window side length in pixels.
+            overlap (float): Fractional overlap between neighboring windows.
+            batch (int): Batch size for processing.
+            channels (int): Number of model input channels, used to check the number of bands.
+        """
+        check_requirements("tifffile")
+
+        self.path = str(path)
+        self.open()
+        series = self.tif.series[0]
+        if self.data.dtype not in {np.uint8, np.uint16}:
+            self.tif.close()
+            raise TypeError(f"Unsupported TIFF dtype {self.data.dtype} in {self.path}, expected uint8 or uint16")
+        c = series.shape[self.axes.index("C")] if "C" in self.axes else 1
+        if channels != c:
+            LOGGER.warning(f"Mosaic has {c} bands but the model expects {channels}")
+
+        self.shape = tuple(series.shape[self.axes.index(a)] for a in "YX")
+        self.grid = ops.tile_grid(self.shape, window, overlap)
+        p = Path(self.path)
+        self.files = [str(p.with_name(f"{p.stem}_{x0}_{y0}{p.suffix}")) for x0, y0, _, _ in self.grid]
+        self.offsets = {f: (int(x0), int(y0)) for f, (x0, y0, _, _) in zip(self.files, self.grid)}
+        self.nf = len(self.grid)
+        self.bs = batch
+        self.mode = "image"
+        self.count = 0
+        self.prefetch = 2 * batch
+        self.pool, self.queue = None, deque()
+        self.source_type = SourceTypes()  # allows passing the loader itself as a predict source
+
+    def open(self):
+        """Open the TIFF file and a memory map or zarr view of its first series, e.g. again after close()."""
+        import tifffile
+
+        self.tif = tifffile.TiffFile(self.path)
+        series = self.tif.series[0]
+        self.axes = series.axes.replace("S", "C")
+        if len(self.axes) not in {2, 3} or not {"Y", "X"} <= set(self.axes):
+            self.tif.close()
+            raise ValueError(f"Unsupported TIFF layout '{series.axes}' in {self.path}, expected 'YX', 'YXS' or 'CYX'")
+        try:  # zero-copy windows for uncompressed, contiguous layouts
+            self.data, self.mmap = tifffile.memmap(self.path, mode="r"), True
+        except ValueError:  # tiled, striped or compressed layouts decode only the segments each window overlaps
+            check_requirements("zarr")
+            import zarr
+
+            self.data, self.mmap = zarr.open(self.tif.aszarr(series=0, level=0), mode="r"), False
+
+    def __iter__(self):
+        """Reset the iterator, reopen the TIFF file and start reading the first windows in the background."""
+        self.close()
+        self.open()
+        self.pool = ThreadPoolExecutor(1, thread_name_prefix="LoadTiffWindows")
+        self.count = 0
+        self.queue = deque(self.pool.submit(self.read, *w) for w in self.grid[: self.prefetch])
+        return self
+
+    def __next__(self) -> tuple[list[str], list[np.ndarray], list[str]]:
+        """Return the next batch of windows with their paths and metadata."""
+        if self.count >= self.nf:
+            self.close()
+            raise StopIteration
+        paths, imgs, info = [], [], []
+        while len(imgs) < self.bs and self.count < self.nf:
+            imgs.append(self.queue.popleft().result())
+            if self.count + self.prefetch < self.nf:  # keep the prefetch window full
+                self.queue.append(self.pool.submit(self.read, *self.grid[self.count + self.prefetch]))
+            x0, y0 = self.offsets[self.files[self.count]]
+            paths.append(self.files[self.count])
+            self.count += 1
+            info.append(f"window {self.count}/{self.nf} ({x0}, {y0}) {self.path}: ")
+        return paths, imgs, info
+
+    def read(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """Read one window of the mosaic as an HWC uint8 array with cv2 band order.
+
+        Args:
+            x0 (int): Left window edge in mosaic pixels.
+            y0 (int): Top window edge in mosaic pixels.
+            x1 (int): Right window edge in mosaic pixels.
+            y1 (int): Bottom window edge in mosaic pixels.
+
+        Returns:
+            (np.ndarray): Window image of shape (y1 - y0, x1 - x0, C).
+        """
+        index = tuple(slice(y0, y1) if a == "Y" else slice(x0, x1) if a == "X" else slice(None) for a in self.axes)
+        im = np.asarray(self.data[index])
+        if "C" in self.axes:
+            im = np.moveaxis(im, self.axes.index("C"), -1)
+        else:
+            im = im[..., None]
+        if im.shape[2] >= 3:
+            im = im[..., [2, 1, 0, *range(3, im.shape[2])]]  # RGB(+bands) to BGR(+bands), copies only the window
+        return (im >> 8).astype(np.uint8) if im.dtype == np.uint16 else np.ascontiguousarray(im)
+
+    def to_mosaic(self, results: list, iou: float = 0.7) -> torch.Tensor:
+        """Map window detections to mosaic pixel coordinates and merge duplicates from overlapping windows.
+
+        Args:
+            results (list[Results]): Detection results for windows of this mosaic.
+            iou (float): IoU threshold of the class-aware NMS across windows.
+
+        Returns:
+            (torch.Tensor): Merged detections of shape (N, 6) as xyxy, conf, cls in mosaic pixel coordinates.
+        """
+        from ultralytics.utils.nms import TorchNMS
+
+        preds = []
+        for r in results:
+            x0, y0 = self.offsets[r.path]
+            d = r.boxes.data
+            preds.append(torch.cat((d[:, :4] + d.new_tensor([x0, y0, x0, y0]), d[:, -2:]), 1))
+        pred = torch.cat(preds) if preds else torch.zeros((0, 6))
+        return pred[TorchNMS.batched_nms(pred[:, :4], pred[:, 4], pred[:, 5], iou)]
+
+    def close(self):
+        """Cancel pending reads, stop the prefetch thread and close the TIFF file and its memory map."""
+        for f in self.queue:
+            f.cancel()
+        self.queue.clear()
+        if self.pool:
+            self.pool.shutdown(wait=True)  # a running read still uses the file
+            self.pool = None
+        if self.tif is not None:
+            self.tif.close()
+            self.tif = self.data = None  # windows already read keep their own reference to the memory map
+
+    def __len__(self) -> int:
+        """Return the number of batches."""
+        return math.ceil(self.nf / self.bs)
+
+
 class LoadPilAndNumpy:
     """Load images from PIL and Numpy arrays for batch processing.
 
@@ -701,4 +1042,4 @@ def get_best_youtube_url(url: str, method: str = "pytube") -> str | None:
 
 
 # Define constants
-LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadScreenshots)
+LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadScreenshots, LoadImageBands, LoadTiffWindows)
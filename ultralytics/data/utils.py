@@ -8,6 +8,7 @@ import random
 import subprocess
 import time
 import zipfile
+from copy import copy
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from tarfile import is_tarfile
@@ -40,6 +41,7 @@ HELP_URL = "See https://docs.ultralytics.com/datasets for dataset formatting gui
 IMG_FORMATS = {"bmp", "dng", "jpeg", "jpg", "mpo", "png", "tif", "tiff", "webp", "pfm", "heic"}  # image suffixes
 VID_FORMATS = {"asf", "avi", "gif", "m4v", "mkv", "mov", "mp4", "mpeg", "mpg", "ts", "wmv", "webm"}  # video suffixes
 FORMATS_HELP_MSG = f"Supported formats are:\nimages: {IMG_FORMATS}\nvideos: {VID_FORMATS}"
+AUX_FORMATS = (".png", ".tif", ".tiff", ".jpg", ".jpeg")  # auxiliary band suffixes, in search order
 
 
 def img2label_paths(img_paths: list[str]) -> list[str]:
@@ -177,6 +179,55 @@ def verify_image(args: tuple) -> tuple:
     return (im_file, cls), nf, nc, msg
 
 
+def verify_image_bands(args: tuple) -> tuple[list[str] | None, str]:
+    """Resolve and verify the auxiliary band files of one image.
+
+    Each band declares a root directory mirroring the dataset root layout and an ordered list of suffixes to search,
+    i.e. '{root}/images/train/im.jpg' pairs with '{band_root}/images/train/im.png'.
+
+    Args:
+        args (tuple): Image file, image (h, w) shape, dataset root, band dicts with 'path' and optional 'suffixes', and
+            log prefix.
+
+    Returns:
+        aux_files (list[str] | None): Band files in declaration order, or None if any band is missing or unreadable.
+        msg (str): Warning message, empty if all bands were found with the image shape.
+    """
+    im_file, shape, root, bands, prefix = args
+    stem = os.path.relpath(im_file, root).rsplit(".", 1)[0]
+    aux_files, msg = [], ""
+    try:
+        for band in bands:
+            f = os.path.join(band["path"], stem)
+            suffixes = ("." + x.lstrip(".") for x in band.get("suffixes", AUX_FORMATS))
+            f = next((f + x for x in suffixes if os.path.isfile(f + x)), None)
+            assert f, f"auxiliary band not found in {band['path']}"
+            hw = exif_size(Image.open(f))[::-1]
+            if hw != tuple(shape):
+                msg = f"{prefix}{im_file}: auxiliary band {f} size {hw} != image size {tuple(shape)}, resizing"
+            aux_files.append(f)
+        return aux_files, msg
+    except Exception as e:
+        return None, f"{prefix}{im_file}: ignoring corrupt image/label: {e}"
+
+
+def read_band(filename: str) -> np.ndarray | None:
+    """Read an auxiliary band file, e.g. NDVI, as a single-channel uint8 image.
+
+    `patches.imread` decodes TIFFs unchanged, so a 16-bit or float TIFF band would change the dtype of the stacked
+    image and a multi-page or RGB TIFF would add several channels. Bands are instead always decoded with
+    cv2.IMREAD_GRAYSCALE, which reduces any depth and color layout to 8-bit grayscale as cv2.imread does.
+
+    Args:
+        filename (str): Path to the band file.
+
+    Returns:
+        (np.ndarray | None): Band image of shape (H, W, 1) and dtype uint8, or None if it cannot be decoded.
+    """
+    im = cv2.imdecode(np.fromfile(filename, np.uint8), cv2.IMREAD_GRAYSCALE)
+    return None if im is None else im[..., None]
+
+
 def verify_image_label(args: tuple) -> list:
     """Verify one image-label pair."""
     im_file, lb_file, prefix, keypoint, num_cls, nkpt, ndim, single_cls = args
@@ -428,7 +479,7 @@ def check_det_dataset(dataset: str, autodownload: bool = True) -> dict[str, Any]
         data["nc"] = len(data["names"])
 
     data["names"] = check_class_names(data["names"])
-    data["channels"] = data.get("channels", 3)  # get image channels, default to 3
+    data["channels"] = data.get("channels", 3 + len(data.get("bands") or ()))  # image channels, default to 3 + bands
 
     # Resolve paths
     path = Path(extract_dir or data.get("path") or Path(data.get("yaml_file", "")).parent)  # dataset root
@@ -446,6 +497,8 @@ def check_det_dataset(dataset: str, autodownload: bool = True) -> dict[str, Any]
                 data[k] = str(x)
             else:
                 data[k] = [str((path / x).resolve()) for x in data[k]]
+    for band in data.get("bands") or ():  # auxiliary band roots, i.e. 'path: ../dataset_ndvi'
+        band["path"] = str((path / band["path"]).resolve())
 
     # Parse YAML
     val, s = (data.get(x) for x in ("val", "download"))
@@ -775,6 +828,209 @@ def compress_one_image(f: str, f_new: str | None = None, max_dim: int = 1920, qu
         cv2.imwrite(str(f_new or f), im)
 
 
+def _offsets(counts) -> np.ndarray:
+    """Return the (N + 1,) start offsets of N consecutive ranges with the given lengths."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    return offsets
+
+
+def _gather_ranges(offsets: np.ndarray, index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the element indices of the ranges `offsets[i]:offsets[i + 1]` for i in index and their new offsets."""
+    starts = offsets[index]
+    counts = offsets[index + 1] - starts
+    new = _offsets(counts)
+    return np.repeat(starts - new[:-1], counts) + np.arange(new[-1]), new
+
+
+def _pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into one UTF-8 byte array and (N + 1,) offsets."""
+    encoded = [s.encode() for s in strings]
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(), _offsets([len(s) for s in encoded])
+
+
+class LabelStore:
+    """Columnar store of per-image YOLO labels backed by a few contiguous numpy arrays.
+
+    A list of per-image label dicts holds millions of small Python objects. Dataloader workers update their reference
+    counts whenever a label is read, which un-shares the copy-on-write pages inherited from the main process, so every
+    worker ends up with its own copy of the labels. This store instead concatenates the instances of all images into
+    `cls`, `bboxes`, `keypoints` and segment point arrays indexed by per-image offsets, and builds the label dict of an
+    image on demand. It is also what `labels.cache` holds, so loading the cache unpickles a handful of arrays.
+
+    The store behaves like the list of label dicts it replaces: it supports `len()`, iteration, integer indexing, which
+    returns a dict with freshly copied arrays, and indexing with an index array, which returns a new store.
+
+    Attributes:
+        shapes (np.ndarray): Image shapes (h, w) with shape (N, 2).
+        offsets (np.ndarray): Offsets of each image's instances with shape (N + 1,).
+        cls (np.ndarray): Classes of all instances with shape (M, 1).
+        bboxes (np.ndarray): Boxes of all instances with shape (M, 4).
+        keypoints (np.ndarray | None): Keypoints of all instances with shape (M, K, D), or None without keypoints.
+        has_segments (np.ndarray): Whether each image has one segment per instance, with shape (N,).
+        points (np.ndarray): Segment points of all instances with shape (P, 2).
+        point_offsets (np.ndarray): Offsets of each instance's segment points with shape (M + 1,).
+        normalized (bool): Whether coordinates are normalized.
+        bbox_format (str): Box format.
+
+    Methods:
+        aux_files_of: Return the auxiliary band files of one image without building its label dict.
+        select: Return a store over the given images, in the given order.
+        filter: Keep only instances of the given classes and optionally merge all classes into one.
+        clear_segments: Remove all segments, keeping boxes only.
+
+    Examples:
+        >>> store = LabelStore(labels)  # list of label dicts from verify_image_label
+        >>> store[0]["bboxes"].shape
+        (2, 4)
+        >>> store = store[store.shapes[:, 0].argsort()]  # reorder images
+    """
+
+    def __init__(self, labels: list[dict[str, Any]]):
+        """Build the store from a list of per-image label dicts.
+
+        Args:
+            labels (list[dict[str, Any]]): Label dicts with 'im_file', 'shape', 'cls', 'bboxes', 'segments',
+                'keypoints', 'normalized' and 'bbox_format' keys, and optionally 'aux_files'.
+        """
+
+        def cat(arrays, shape):
+            """Concatenate per-image arrays into one float32 array, also for an empty list."""
+            arrays = [np.asarray(x, dtype=np.float32).reshape(shape) for x in arrays]
+            return np.concatenate(arrays or [np.zeros((0, *shape[1:]), dtype=np.float32)])
+
+        self.offsets = _offsets([len(lb["cls"]) for lb in labels])
+        self.shapes = np.array([lb["shape"] for lb in labels], dtype=np.int64).reshape(-1, 2)
+        self.cls = cat([lb["cls"] for lb in labels], (-1, 1))
+        self.bboxes = cat([lb["bboxes"] for lb in labels], (-1, 4))
+        self.keypoints = None
+        if len(labels) and labels[0]["keypoints"] is not None:
+            self.keypoints = cat([lb["keypoints"] for lb in labels], (-1, *labels[0]["keypoints"].shape[1:]))
+        self.has_segments = np.array([len(lb["segments"]) > 0 for lb in labels], dtype=bool)
+        segments = []  # one segment per instance, empty for images without segments
+        for lb, has_segments in zip(labels, self.has_segments):
+            segments.extend(lb["segments"] if has_segments else [()] * len(lb["cls"]))
+        self.point_offsets = _offsets([len(s) for s in segments])
+        self.points = cat(segments, (-1, 2))
+        self.normalized = labels[0]["normalized"] if len(labels) else True
+        self.bbox_format = labels[0]["bbox_format"] if len(labels) else "xywh"
+        self.files, self.file_offsets = _pack_strings([lb["im_file"] for lb in labels])
+        self.aux_index = None  # offsets of each image's auxiliary band files, if any
+        if len(labels) and "aux_files" in labels[0]:
+            self.aux_index = _offsets([len(lb["aux_files"]) for lb in labels])
+            self.aux_files, self.aux_offsets = _pack_strings([f for lb in labels for f in lb["aux_files"]])
+
+    def __len__(self) -> int:
+        """Return the number of images."""
+        return len(self.shapes)
+
+    def __iter__(self):
+        """Yield the label dict of each image."""
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, index):
+        """Return the label dict of one image, or a new store for an index array or slice."""
+        if not isinstance(index, (int, np.integer)):
+            return self.select(np.arange(len(self))[index])  # slice, boolean mask or index array
+        a, b = self.offsets[index], self.offsets[index + 1]
+        po, segments = self.point_offsets, self.has_segments[index]
+        label = {
+            "im_file": self._string(self.files, self.file_offsets, index),
+            "shape": tuple(self.shapes[index].tolist()),
+            "cls": self.cls[a:b].copy(),
+            "bboxes": self.bboxes[a:b].copy(),
+            "segments": [self.points[po[j] : po[j + 1]].copy() for j in range(a, b)] if segments else [],
+            "keypoints": None if self.keypoints is None else self.keypoints[a:b].copy(),
+            "normalized": self.normalized,
+            "bbox_format": self.bbox_format,
+        }
+        if self.aux_index is not None:
+            label["aux_files"] = self.aux_files_of(index)
+        return label
+
+    def aux_files_of(self, index: int) -> list[str]:
+        """Return the auxiliary band files of one image without building its label dict.
+
+        Args:
+            index (int): Image index.
+
+        Returns:
+            (list[str]): Band files in declaration order, empty if the labels have no auxiliary bands.
+        """
+        if self.aux_index is None:
+            return []
+        return [
+            self._string(self.aux_files, self.aux_offsets, j)
+            for j in range(self.aux_index[index], self.aux_index[index + 1])
+        ]
+
+    @staticmethod
+    def _string(data: np.ndarray, offsets: np.ndarray, i: int) -> str:
+        """Decode packed string i."""
+        return data[offsets[i] : offsets[i + 1]].tobytes().decode()
+
+    @property
+    def im_files(self) -> list[str]:
+        """Return the image file of each image."""
+        return [self._string(self.files, self.file_offsets, i) for i in range(len(self))]
+
+    def select(self, index) -> LabelStore:
+        """Return a store over the given images, in the given order.
+
+        Args:
+            index (np.ndarray | list[int]): Image indices.
+
+        Returns:
+            (LabelStore): New store sharing no arrays with this one.
+        """
+        index = np.asarray(index, dtype=np.int64).reshape(-1)
+        store = copy(self)
+        ids, store.offsets = _gather_ranges(self.offsets, index)
+        store.shapes, store.has_segments = self.shapes[index], self.has_segments[index]
+        store.cls, store.bboxes = self.cls[ids], self.bboxes[ids]
+        store.keypoints = None if self.keypoints is None else self.keypoints[ids]
+        points, store.point_offsets = _gather_ranges(self.point_offsets, ids)
+        store.points = self.points[points]
+        chars, store.file_offsets = _gather_ranges(self.file_offsets, index)
+        store.files = self.files[chars]
+        if self.aux_index is not None:
+            files, store.aux_index = _gather_ranges(self.aux_index, index)
+            chars, store.aux_offsets = _gather_ranges(self.aux_offsets, files)
+            store.aux_files = self.aux_files[chars]
+        return store
+
+    def filter(self, include_class: list[int] | None = None, single_cls: bool = False) -> LabelStore:
+        """Keep only instances of the given classes and optionally merge all classes into one.
+
+        Args:
+            include_class (list[int], optional): Classes to keep. If None, all instances are kept.
+            single_cls (bool): Whether to set every class to 0.
+
+        Returns:
+            (LabelStore): Filtered store, or this store if nothing changes.
+        """
+        if include_class is None and not single_cls:
+            return self
+        store = copy(self)
+        if include_class is not None:
+            keep = np.isin(self.cls[:, 0], include_class)
+            store.offsets = _offsets(keep)[self.offsets]  # kept instances before each image offset
+            ids = np.flatnonzero(keep)
+            store.cls, store.bboxes = self.cls[ids], self.bboxes[ids]
+            store.keypoints = None if self.keypoints is None else self.keypoints[ids]
+            points, store.point_offsets = _gather_ranges(self.point_offsets, ids)
+            store.points = self.points[points]
+        if single_cls:
+            store.cls = np.zeros_like(store.cls)
+        return store
+
+    def clear_segments(self) -> None:
+        """Remove all segments in place, keeping boxes only."""
+        self.has_segments = np.zeros_like(self.has_segments)
+        self.points = np.zeros((0, 2), dtype=np.float32)
+        self.point_offsets = np.zeros(len(self.cls) + 1, dtype=np.int64)
+
+
 def load_dataset_cache_file(path: Path) -> dict:
     """Load an Ultralytics *.cache dictionary from path."""
     import gc
@@ -487,6 +487,8 @@ class Exporter:
         model.eval()
         model.float()
         model = model.fuse()
+        if getattr(model, "branches", None):
+            model.parallelize(False)  # branches running in worker threads are not recorded by tracing exporters
 
         if imx:
             from ultralytics.utils.export.imx import FXModel
@@ -545,6 +547,8 @@ class Exporter:
             "args": {k: v for k, v in self.args if k in fmt_keys},
             "channels": model.yaml.get("channels", 3),
         }  # model metadata
+        if model.yaml.get("bands"):
+            self.metadata["bands"] = model.yaml["bands"]  # multispectral input band order, i.e. [B, G, R, NDVI]
         if dla is not None:
             self.metadata["dla"] = dla  # make sure `AutoBackend` uses correct dla device if it has one
         if model.task == "pose":
@@ -624,6 +628,12 @@ class Exporter:
         """Build and return a dataloader for calibration of INT8 models."""
         LOGGER.info(f"{prefix} collecting INT8 calibration images from 'data={self.args.data}'")
         data = (check_cls_dataset if self.model.task == "classify" else check_det_dataset)(self.args.data)
+        ch = self.model.yaml.get("channels", 3)
+        if data.get("channels", 3) != ch:
+            raise ValueError(
+                f"The calibration dataset 'data={self.args.data}' has {data.get('channels', 3)} channels but the model "
+                f"expects {ch} input channels, i.e. declare the auxiliary 'bands' of multispectral datasets."
+            )
         dataset = YOLODataset(
             data[self.args.split or "val"],
             data=data,
@@ -757,7 +767,8 @@ class Exporter:
         def serialize(ov_model, file):
             """Set RT info, serialize, and save metadata YAML."""
             ov_model.set_rt_info("YOLO", ["model_info", "model_type"])
-            ov_model.set_rt_info(True, ["model_info", "reverse_input_channels"])
+            if self.im.shape[1] == 3:  # BGR to RGB, multispectral inputs keep the dataset band order
+                ov_model.set_rt_info(True, ["model_info", "reverse_input_channels"])
             ov_model.set_rt_info(114, ["model_info", "pad_value"])
             ov_model.set_rt_info([255.0], ["model_info", "scale_values"])
             ov_model.set_rt_info(self.args.iou, ["model_info", "iou_threshold"])
@@ -792,13 +803,15 @@ class Exporter:
                     types=["Sigmoid"],
                 )
 
+            dataset = self.get_int8_calibration_dataloader(prefix)
             quantized_ov_model = nncf.quantize(
                 model=ov_model,
-                calibration_dataset=nncf.Dataset(self.get_int8_calibration_dataloader(prefix), self._transform_fn),
+                calibration_dataset=nncf.Dataset(dataset, self._transform_fn),
                 preset=nncf.QuantizationPreset.MIXED,
                 ignored_scope=ignored_scope,
             )
             serialize(quantized_ov_model, fq_ov)
+            YAML.save(Path(fq) / "int8_report.yaml", self._int8_report(ov_model, quantized_ov_model, dataset, prefix))
             return fq
 
         f = str(self.file).replace(self.file.suffix, f"_openvino_model{os.sep}")
@@ -1433,6 +1446,64 @@ class Exporter:
         LOGGER.info(f"{prefix} pipeline success")
         return model
 
+    def _int8_report(self, ov_model, quantized_ov_model, dataset, prefix="", max_batches=8, runs=10) -> dict:
+        """Compare an INT8 OpenVINO model against its FP32 source on calibration batches.
+
+        Accuracy is reported per output branch, i.e. the box regression, class score and task-specific rows of
+        detection outputs, as the mean absolute error and cosine similarity of INT8 to FP32 outputs. Latency is the
+        median CPU inference time of each model on one calibration batch.
+
+        Args:
+            ov_model (openvino.Model): FP32 model.
+            quantized_ov_model (openvino.Model): INT8 model quantized from `ov_model`.
+            dataset (torch.utils.data.DataLoader): Calibration dataloader.
+            prefix (str): Logging prefix.
+            max_batches (int): Maximum number of calibration batches to compare outputs on.
+            runs (int): Number of timed runs per model.
+
+        Returns:
+            (dict): Report with the compared batch count, per-model latency and per-branch errors.
+        """
+        import openvino as ov
+
+        core = ov.Core()
+        models = {k: core.compile_model(m, "CPU") for k, m in (("fp32", ov_model), ("int8", quantized_ov_model))}
+        shape = self.output_shape[0] if isinstance(self.output_shape[0], tuple) else self.output_shape  # output0
+        nc, rows = len(self.model.names), shape[1]
+        if self.model.task == "classify" or getattr(self.model, "end2end", False) or self.args.nms:
+            branches = {"output": slice(None)}
+        else:  # Detect-family output rows are xywh, class scores, then masks, keypoints or angles
+            branches = {"box": slice(0, 4), "cls": slice(4, 4 + nc), self.model.task: slice(4 + nc, rows)}
+            branches = {k: s for k, s in branches.items() if s.stop > s.start}
+        errors, n, im = {k: np.zeros(2) for k in branches}, 0, None
+        for batch in dataset:
+            im = self._transform_fn(batch)
+            y32, y8 = (np.asarray(m(im)[0], dtype=np.float32) for m in models.values())  # first output
+            for k, s in branches.items():
+                a, b = y32[:, s].reshape(len(im), -1), y8[:, s].reshape(len(im), -1)
+                cos = (a * b).sum(1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1) + 1e-12)
+                errors[k] += (np.abs(a - b).mean(), cos.mean())
+            n += 1
+            if n == max_batches:
+                break
+
+        latency = {}
+        for k, m in models.items():
+            m(im)  # warmup
+            t = []
+            for _ in range(runs):
+                t0 = time.perf_counter()
+                m(im)
+                t.append(time.perf_counter() - t0)
+            latency[k] = round(float(np.median(t)) * 1000, 3)
+        errors = {k: {"mae": round(float(e[0]) / n, 6), "cosine": round(float(e[1]) / n, 6)} for k, e in errors.items()}
+        report = {"batches": n, "latency(ms)": latency, "branches": errors}
+        LOGGER.info(
+            f"{prefix} INT8 latency {latency['int8']}ms vs FP32 {latency['fp32']}ms on batch {len(im)}, "
+            + ", ".join(f"{k} cosine {v['cosine']:.4f} mae {v['mae']:.4g}" for k, v in report["branches"].items())
+        )
+        return report
+
     @staticmethod
     def _transform_fn(data_item) -> np.ndarray:
         """The transformation function for Axelera/OpenVINO quantization preprocessing."""
@@ -36,8 +36,10 @@ Usage - formats:
 from __future__ import annotations
 
 import platform
+import queue
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -48,8 +50,10 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox
+from ultralytics.data.loaders import LoadTiffWindows
+from ultralytics.engine.results import BatchResults
 from ultralytics.nn.autobackend import AutoBackend
-from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
+from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, NUM_THREADS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
 from ultralytics.utils.torch_utils import attempt_compile, select_device, smart_inference_mode
@@ -87,14 +91,18 @@ class BasePredictor:
         seen (int): Number of images processed.
         windows (list[str]): List of window names for visualization.
         batch (tuple): Current batch data.
+        frame (int | None): Source frame counter of the current batch in pipelined mode, read ahead by the reader.
         results (list[Any]): Current batch results.
         transforms (callable): Image transforms for classification.
         callbacks (dict[str, list[callable]]): Callback functions for different events.
         txt_path (Path): Path to save text results.
         _lock (threading.Lock): Lock for thread-safe inference.
+        _letterbox (LetterBox): Cached LetterBox transform, rebuilt only when its shape or auto setting changes.
+        _buffers (threading.local): Per-thread reusable uint8 (N, H, W, C) batch buffers for letterboxing.
 
     Methods:
         preprocess: Prepare input image before inference.
+        letterbox_batch: Letterbox a list of images into a reusable uint8 batch buffer.
         inference: Run inference on a given image.
         postprocess: Process raw predictions into structured results.
         predict_cli: Run prediction for command line interface.
@@ -141,11 +149,14 @@ class BasePredictor:
         self.seen = 0
         self.windows = []
         self.batch = None
+        self.frame = None
         self.results = None
         self.transforms = None
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
         self._lock = threading.Lock()  # for automatic thread-safe inference
+        self._letterbox = None
+        self._buffers = threading.local()  # reusable batch buffers, one per preprocessing thread
         callbacks.add_integration_callbacks(self)
 
     def preprocess(self, im: torch.Tensor | list[np.ndarray]) -> torch.Tensor:
@@ -157,20 +168,56 @@ class BasePredictor:
         Returns:
             (torch.Tensor): Preprocessed image tensor of shape (N, 3, H, W).
         """
-        not_tensor = not isinstance(im, torch.Tensor)
-        if not_tensor:
-            im = np.stack(self.pre_transform(im))
-            if im.shape[-1] == 3:
-                im = im[..., ::-1]  # BGR to RGB
-            im = im.transpose((0, 3, 1, 2))  # BHWC to BCHW, (n, 3, h, w)
-            im = np.ascontiguousarray(im)  # contiguous
-            im = torch.from_numpy(im)
-
-        im = im.to(self.device)
-        im = im.half() if self.model.fp16 else im.float()  # uint8 to fp16/32
-        if not_tensor:
-            im /= 255  # 0 - 255 to 0.0 - 1.0
-        return im
+        dtype = torch.half if self.model.fp16 else torch.float
+        if isinstance(im, torch.Tensor):
+            return im.to(self.device).to(dtype)
+
+        buf = self.letterbox_batch(im)
+        im = buf.to(self.device, non_blocking=True).permute(0, 3, 1, 2)  # BHWC to BCHW, (n, c, h, w)
+        if self._buffers.event is not None:
+            self._buffers.event.record()  # buffer may be reused once the host-to-device copy has finished
+        # uint8 to fp16/32 and 0 - 255 to 0.0 - 1.0 in a single pass
+        return torch.mul(im, 1 / 255, out=torch.empty(im.shape, dtype=dtype, device=im.device))
+
+    def letterbox_batch(self, im: list[np.ndarray]) -> torch.Tensor:
+        """Letterbox a list of images into a reusable uint8 batch buffer.
+
+        Images are written straight into a per-thread (N, H, W, C) buffer that is only reallocated when the batch grows
+        or the output shape changes, and is pinned on CUDA devices for asynchronous host-to-device copies. 3-channel
+        images are converted from BGR to RGB while being written, so no intermediate arrays are created.
+
+        Args:
+            im (list[np.ndarray]): List of images with shape [(H, W, C) x N].
+
+        Returns:
+            (torch.Tensor): Letterboxed uint8 images of shape (N, H, W, C).
+        """
+        custom = type(self).pre_transform is not BasePredictor.pre_transform
+        if custom:  # subclass transforms, copy their outputs into the buffer
+            im = self.pre_transform(im)
+            letterbox, shape = None, im[0].shape[:2]
+        else:
+            letterbox = self.get_letterbox(im)
+            new_unpad, _, (top, bottom, left, right) = letterbox.get_params(im[0].shape[:2])
+            shape = (new_unpad[1] + top + bottom, new_unpad[0] + left + right)
+        n, c = len(im), im[0].shape[2] if im[0].ndim == 3 else 1
+
+        state, pin = self._buffers, self.device.type == "cuda"
+        buf = getattr(state, "buf", None)
+        if buf is None or buf.shape[0] < n or buf.shape[1:] != (*shape, c):
+            buf = state.buf = torch.empty((n, *shape, c), dtype=torch.uint8, pin_memory=pin)
+            state.event = torch.cuda.Event() if pin else None
+        elif state.event is not None:
+            state.event.synchronize()  # wait for the previous copy out of this buffer
+        out = buf[:n].numpy()
+        if c == 3:
+            out = out[..., ::-1]  # BGR to RGB on write
+        for x, dst in zip(im, out):
+            if custom:
+                dst[:] = x.reshape(dst.shape)
+            else:
+                letterbox(image=x, dst=dst)
+        return buf[:n]
 
     def inference(self, im: torch.Tensor, *args, **kwargs):
         """Run inference on a given image using the specified model and arguments."""
@@ -190,15 +237,28 @@ class BasePredictor:
         Returns:
             (list[np.ndarray]): List of transformed images.
         """
+        letterbox = self.get_letterbox(im)
+        return [letterbox(image=x) for x in im]
+
+    def get_letterbox(self, im: list[np.ndarray]) -> LetterBox:
+        """Return the cached LetterBox transform for a batch, rebuilding it only when its settings change.
+
+        Args:
+            im (list[np.ndarray]): List of images with shape [(H, W, C) x N].
+
+        Returns:
+            (LetterBox): Letterbox transform for the batch.
+        """
         same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(
-            self.imgsz,
-            auto=same_shapes
+        auto = bool(
+            same_shapes
             and self.args.rect
-            and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)),
-            stride=self.model.stride,
+            and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx))
         )
-        return [letterbox(image=x) for x in im]
+        letterbox = self._letterbox
+        if letterbox is None or letterbox.new_shape != self.imgsz or letterbox.auto != auto:
+            letterbox = self._letterbox = LetterBox(self.imgsz, auto=auto, stride=self.model.stride)
+        return letterbox
 
     def postprocess(self, preds, img, orig_imgs):
         """Post-process predictions for an image and return them."""
@@ -216,7 +276,8 @@ class BasePredictor:
             **kwargs (Any): Additional keyword arguments for the inference method.
 
         Returns:
-            (list[ultralytics.engine.results.Results] | generator): Results objects or generator of Results objects.
+            (list[ultralytics.engine.results.Results] | generator): Results objects or generator of Results objects,
+                or of BatchResults objects, one per batch, when `batch_results` is set.
         """
         self.stream = stream
         if stream:
@@ -259,8 +320,15 @@ class BasePredictor:
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
             channels=getattr(self.model, "ch", 3),
+            window=self.args.tile,
+            overlap=self.args.tile_overlap,
         )
         self.source_type = self.dataset.source_type
+        if isinstance(self.dataset, LoadTiffWindows):
+            LOGGER.info(
+                "Window results are in window pixel coordinates, merge them into mosaic detections with "
+                "'predictor.dataset.to_mosaic(results)'"
+            )
         if (
             self.source_type.stream
             or self.source_type.screenshot
@@ -285,7 +353,8 @@ class BasePredictor:
             **kwargs (Any): Additional keyword arguments for the inference method.
 
         Yields:
-            (ultralytics.engine.results.Results): Results objects.
+            (ultralytics.engine.results.Results | ultralytics.engine.results.BatchResults): Results objects, or one
+                BatchResults per batch when `batch_results` is set.
         """
         if self.args.verbose:
             LOGGER.info("")
@@ -309,55 +378,43 @@ class BasePredictor:
                 )
                 self.done_warmup = True
 
-            self.seen, self.windows, self.batch = 0, [], None
+            self.seen, self.windows, self.batch, self.frame = 0, [], None, None
             profilers = (
                 ops.Profile(device=self.device),
                 ops.Profile(device=self.device),
                 ops.Profile(device=self.device),
             )
             self.run_callbacks("on_predict_start")
-            for batch in self.dataset:
-                self.batch = batch
-                self.run_callbacks("on_predict_batch_start")
-                paths, im0s, s = self.batch
-
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
-
-                # Postprocess
-                with profilers[2]:
-                    self.results = self.postprocess(preds, im, im0s)
-                self.run_callbacks("on_predict_postprocess_end")
-
-                # Visualize, save, write results
-                n = len(im0s)
-                try:
-                    for i in range(n):
-                        self.seen += 1
-                        self.results[i].speed = {
-                            "preprocess": profilers[0].dt * 1e3 / n,
-                            "inference": profilers[1].dt * 1e3 / n,
-                            "postprocess": profilers[2].dt * 1e3 / n,
-                        }
-                        if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
-                            s[i] += self.write_results(i, Path(paths[i]), im, s)
-                except StopIteration:
-                    break
-
-                # Print batch results
-                if self.args.verbose:
-                    LOGGER.info("\n".join(s))
-
-                self.run_callbacks("on_predict_batch_end")
-                yield from self.results
+            if self.args.pipeline and not (self.args.embed or self.args.visualize or self.args.show):
+                im = yield from self.pipeline_inference(profilers, *args, **kwargs)
+            else:
+                for batch in self.dataset:
+                    self.batch = batch
+                    self.run_callbacks("on_predict_batch_start")
+                    paths, im0s, s = self.batch
+
+                    # Preprocess
+                    with profilers[0]:
+                        im = self.preprocess(im0s)
+
+                    # Inference
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                        if self.args.embed:
+                            yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                            continue
+
+                    # Postprocess
+                    with profilers[2]:
+                        self.results = self.postprocess(preds, im, im0s)
+                    self.run_callbacks("on_predict_postprocess_end")
+
+                    # Visualize, save, write results
+                    if not self.write_batch(im, [x.dt for x in profilers]):
+                        break
+
+                    self.run_callbacks("on_predict_batch_end")
+                    yield from self.batch_outputs()
 
         # Release assets
         for v in self.vid_writer.values():
@@ -380,6 +437,137 @@ class BasePredictor:
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    def pipeline_inference(self, profilers: tuple, *args, **kwargs):
+        """Run inference with source reading, preprocessing and result writing overlapped with the model.
+
+        A reader thread iterates the source and preprocesses batches on a thread pool ahead of the model through a
+        bounded queue, and results are written by a background thread while the next batch runs through the model.
+        Batches are postprocessed, passed to callbacks and yielded in source order, each one batch behind inference,
+        and 'on_predict_batch_start' runs once a batch has already been preprocessed.
+
+        Args:
+            profilers (tuple[ops.Profile, ops.Profile, ops.Profile]): Preprocess, inference and postprocess profilers.
+            *args (Any): Additional arguments for the inference method.
+            **kwargs (Any): Additional keyword arguments for the inference method.
+
+        Yields:
+            (ultralytics.engine.results.Results | ultralytics.engine.results.BatchResults): Results objects, or one
+                BatchResults per batch when `batch_results` is set.
+
+        Returns:
+            (torch.Tensor | None): The last preprocessed batch.
+        """
+
+        def preprocess(im0s):
+            """Preprocess a batch on a worker thread and return it with the elapsed time."""
+            with ops.Profile(device=self.device) as dt:
+                im = self.preprocess(im0s)
+            return im, dt.dt
+
+        def read():
+            """Queue batches with their frame counters and preprocessing jobs, then None when exhausted."""
+            try:
+                for batch in self.dataset:
+                    if stop.is_set():
+                        break
+                    frame = getattr(self.dataset, "count", None)  # moves on while earlier batches are written
+                    batches.put((batch, frame, pool.submit(preprocess, batch[1])))
+            except Exception as e:
+                batches.put(e)  # re-raised in the consumer
+            finally:
+                batches.put(None)
+
+        workers = min(4, NUM_THREADS)
+        batches, stop = queue.Queue(maxsize=2 * workers), threading.Event()
+        pool = ThreadPoolExecutor(workers, thread_name_prefix="predict_preprocess")
+        writer = ThreadPoolExecutor(1, thread_name_prefix="predict_write")  # single thread keeps writes in order
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        im, written = None, None
+        try:
+            while (item := batches.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                batch, frame, job = item
+                im, profilers[0].dt = job.result()
+                profilers[0].t += profilers[0].dt
+
+                with profilers[1]:
+                    preds = self.inference(im, *args, **kwargs)  # overlaps with writing the previous batch
+
+                if written:  # finish the previous batch before self.batch and self.results move on
+                    if not written.result():
+                        break
+                    self.run_callbacks("on_predict_batch_end")
+                    yield from self.batch_outputs()
+
+                self.batch, self.frame = batch, frame
+                self.run_callbacks("on_predict_batch_start")
+                with profilers[2]:
+                    self.results = self.postprocess(preds, im, batch[1])
+                self.run_callbacks("on_predict_postprocess_end")
+                written = writer.submit(self.write_batch, im, [x.dt for x in profilers])
+
+            if written and written.result():
+                self.run_callbacks("on_predict_batch_end")
+                yield from self.batch_outputs()
+        finally:
+            stop.set()
+            while reader.is_alive():  # unblock the reader if the queue is full
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            pool.shutdown(wait=False)
+            writer.shutdown(wait=True)
+        return im
+
+    def write_batch(self, im: torch.Tensor, dt: list[float]) -> bool:
+        """Set the speed of each result in the current batch, then visualize, save and log the results.
+
+        Args:
+            im (torch.Tensor): Preprocessed image tensor.
+            dt (list[float]): Preprocess, inference and postprocess times of the batch in seconds.
+
+        Returns:
+            (bool): False if the user stopped the prediction from the display window, True otherwise.
+        """
+        paths, im0s, s = self.batch
+        n = len(im0s)
+        speed = {"preprocess": dt[0] * 1e3 / n, "inference": dt[1] * 1e3 / n, "postprocess": dt[2] * 1e3 / n}
+        batched = isinstance(self.results, BatchResults)
+        if batched:
+            self.results.speed.update(speed)  # shared by the per-image views, so none are built here
+        try:
+            for i in range(n):
+                self.seen += 1
+                if not batched:
+                    self.results[i].speed = dict(speed)
+                if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
+                    s[i] += self.write_results(i, Path(paths[i]), im, s)
+        except StopIteration:
+            return False
+
+        # Print batch results
+        if self.args.verbose:
+            LOGGER.info("\n".join(s))
+        return True
+
+    def batch_outputs(self) -> list:
+        """Return the items to yield for the written batch, dropping the original images unless `retain_imgs` is set.
+
+        Returns:
+            (list): Results objects of the batch, or the BatchResults of the batch as a single item.
+        """
+        batched = isinstance(self.results, BatchResults)
+        if not self.args.retain_imgs:
+            if batched:
+                self.results.release_images()
+            else:
+                for r in self.results:
+                    r.orig_img = None
+        return [self.results] if batched else self.results
+
     def setup_model(self, model, verbose: bool = True):
         """Initialize YOLO model with given parameters and set it to evaluation mode.
 
@@ -395,10 +583,14 @@ class BasePredictor:
             fp16=self.args.half,
             fuse=True,
             verbose=verbose,
+            runtime=self.args.runtime,
+            fuse_cache=self.args.fuse_cache,
         )
 
         self.device = self.model.device  # update device
         self.args.half = self.model.fp16  # update half
+        if self.args.branches and self.model.pt and hasattr(self.model.model, "parallelize"):
+            self.model.model.parallelize()  # run independent branches, i.e. RGB and NIR backbones, concurrently
         if hasattr(self.model, "imgsz") and not getattr(self.model, "dynamic", False):
             self.args.imgsz = self.model.imgsz  # reuse imgsz from export metadata
         self.model.eval()
@@ -421,7 +613,7 @@ class BasePredictor:
             im = im[None]  # expand for batch dim
         if self.source_type.stream or self.source_type.from_img or self.source_type.tensor:  # batch_size >= 1
             string += f"{i}: "
-            frame = self.dataset.count
+            frame = self.dataset.count if self.frame is None else self.frame
         else:
             match = re.search(r"frame (\d+)/", s[i])
             frame = int(match[1]) if match else None  # 0 if frame undetermined
@@ -181,7 +181,7 @@ class Results(SimpleClass, DataExportMixin):
     various coordinate transformations.
 
     Attributes:
-        orig_img (np.ndarray): The original image as a numpy array.
+        orig_img (np.ndarray | None): The original image as a numpy array, None if it was not retained.
         orig_shape (tuple[int, int]): Original image shape in (height, width) format.
         boxes (Boxes | None): Detected bounding boxes.
         masks (Masks | None): Segmentation masks.
@@ -222,7 +222,7 @@ class Results(SimpleClass, DataExportMixin):
 
     def __init__(
         self,
-        orig_img: np.ndarray,
+        orig_img: np.ndarray | None,
         path: str,
         names: dict[int, str],
         boxes: torch.Tensor | None = None,
@@ -231,11 +231,12 @@ class Results(SimpleClass, DataExportMixin):
         keypoints: torch.Tensor | None = None,
         obb: torch.Tensor | None = None,
         speed: dict[str, float] | None = None,
+        orig_shape: tuple[int, int] | None = None,
     ) -> None:
         """Initialize the Results class for storing and manipulating inference results.
 
         Args:
-            orig_img (np.ndarray): The original image as a numpy array.
+            orig_img (np.ndarray | None): The original image as a numpy array, None to not retain it.
             path (str): The path to the image file.
             names (dict): A dictionary of class names.
             boxes (torch.Tensor | None): A 2D tensor of bounding box coordinates for each detection.
@@ -244,6 +245,7 @@ class Results(SimpleClass, DataExportMixin):
             keypoints (torch.Tensor | None): A 2D tensor of keypoint coordinates for each detection.
             obb (torch.Tensor | None): A 2D tensor of oriented bounding box coordinates for each detection.
             speed (dict | None): A dictionary containing preprocess, inference, and postprocess speeds (ms/image).
+            orig_shape (tuple[int, int] | None): Original image shape (height, width), required without `orig_img`.
 
         Notes:
             For the default pose model, keypoint indices for human body pose estimation are:
@@ -253,7 +255,7 @@ class Results(SimpleClass, DataExportMixin):
             13: Left Knee, 14: Right Knee, 15: Left Ankle, 16: Right Ankle
         """
         self.orig_img = orig_img
-        self.orig_shape = orig_img.shape[:2]
+        self.orig_shape = orig_img.shape[:2] if orig_img is not None else tuple(orig_shape)
         self.boxes = Boxes(boxes, self.orig_shape) if boxes is not None else None  # native size boxes
         self.masks = Masks(masks, self.orig_shape) if masks is not None else None  # native size or imgsz masks
         self.probs = Probs(probs) if probs is not None else None
@@ -437,7 +439,9 @@ class Results(SimpleClass, DataExportMixin):
             >>> results = model("path/to/image.jpg")
             >>> new_result = results[0].new()
         """
-        return Results(orig_img=self.orig_img, path=self.path, names=self.names, speed=self.speed)
+        return Results(
+            orig_img=self.orig_img, path=self.path, names=self.names, speed=self.speed, orig_shape=self.orig_shape
+        )
 
     def plot(
         self,
@@ -812,6 +816,259 @@ class Results(SimpleClass, DataExportMixin):
         return results
 
 
+class BatchResults(SimpleClass, DataExportMixin):
+    """A columnar container for the detection results of a batch of images.
+
+    Detections of all images are stored as one concatenated tensor with per-image offsets, and a Results view of an
+    image is only built when it is accessed. Device transfers and exports therefore run once per batch instead of once
+    per image, and original images are only held when passed in.
+
+    Attributes:
+        data (torch.Tensor | np.ndarray): Detections of all images with shape (N, 6) as (x1, y1, x2, y2, conf, cls),
+            or (N, 7) with track IDs before conf.
+        offsets (list[int]): Start index of each image in `data`, followed by the total number of detections.
+        orig_shapes (list[tuple[int, int]]): Original image shapes in (height, width) format.
+        paths (list[str]): Paths to the input images.
+        names (dict): Dictionary mapping class indices to class names.
+        orig_imgs (list[np.ndarray] | None): Original images, None if they are not retained.
+        speed (dict): Inference speed information in ms per image, shared by all views.
+
+    Methods:
+        cpu: Return a copy of the BatchResults with the detections moved to CPU memory.
+        numpy: Return a copy of the BatchResults with the detections converted to a numpy array.
+        cuda: Return a copy of the BatchResults with the detections moved to GPU memory.
+        to: Return a copy of the BatchResults with the detections moved to the specified device and dtype.
+        release_images: Drop the original images from the batch and its views.
+        columns: Return all detections as a dictionary of flat numpy columns.
+        summary: Convert the detections to a list of per-detection dictionaries.
+        to_df: Convert the detections to a Polars DataFrame.
+        to_arrow: Convert the detections to a PyArrow Table.
+
+    Examples:
+        >>> results = model.predict("path/to/dir", batch=64, batch_results=True, retain_imgs=False, stream=True)
+        >>> for batch in results:
+        ...     table = batch.to_arrow()  # all detections of the batch in one call
+        ...     first = batch[0]  # Results view of the first image
+    """
+
+    def __init__(
+        self,
+        data: torch.Tensor | np.ndarray,
+        offsets: list[int],
+        orig_shapes: list[tuple[int, int]],
+        paths: list[str],
+        names: dict[int, str],
+        orig_imgs: list[np.ndarray] | None = None,
+        speed: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the BatchResults from concatenated detections and per-image offsets.
+
+        Args:
+            data (torch.Tensor | np.ndarray): Detections of all images with shape (N, 6) or (N, 7).
+            offsets (list[int]): Start index of each image in `data` followed by N, so image i owns
+                `data[offsets[i]:offsets[i + 1]]`.
+            orig_shapes (list[tuple[int, int]]): Original image shapes in (height, width) format.
+            paths (list[str]): Paths to the input images.
+            names (dict): A dictionary of class names.
+            orig_imgs (list[np.ndarray] | None): Original images to retain for plotting and cropping.
+            speed (dict | None): A dictionary containing preprocess, inference, and postprocess speeds (ms/image).
+        """
+        self.data = data
+        self.offsets = list(offsets)
+        self.orig_shapes = [tuple(x) for x in orig_shapes]
+        self.paths = list(paths)
+        self.names = names
+        self.orig_imgs = orig_imgs
+        self.speed = speed if speed is not None else {"preprocess": None, "inference": None, "postprocess": None}
+        self._views = {}  # {image index: Results} built on access
+
+    @classmethod
+    def from_list(
+        cls,
+        preds: list[torch.Tensor],
+        orig_imgs: list[np.ndarray],
+        paths: list[str],
+        names: dict[int, str],
+        retain_imgs: bool = True,
+    ) -> BatchResults:
+        """Create a BatchResults from per-image detections.
+
+        Args:
+            preds (list[torch.Tensor]): Per-image detections of shape (N, 6) in original image coordinates.
+            orig_imgs (list[np.ndarray]): Original images.
+            paths (list[str]): Paths to the input images.
+            names (dict): A dictionary of class names.
+            retain_imgs (bool): Whether to keep references to the original images.
+
+        Returns:
+            (BatchResults): Columnar results of the batch.
+        """
+        offsets = [0]
+        for pred in preds:
+            offsets.append(offsets[-1] + len(pred))
+        return cls(
+            torch.cat(preds) if len(preds) > 1 else preds[0],
+            offsets,
+            [x.shape[:2] for x in orig_imgs],
+            paths,
+            names,
+            orig_imgs=list(orig_imgs) if retain_imgs else None,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of images in the batch."""
+        return len(self.paths)
+
+    def __getitem__(self, idx: int) -> Results:
+        """Return the Results view of one image, building it on first access.
+
+        Args:
+            idx (int): Image index in the batch.
+
+        Returns:
+            (Results): Results of the image, whose boxes are a view into the batch detections.
+        """
+        n = len(self)
+        if not -n <= idx < n:
+            raise IndexError(f"image index {idx} out of range for a batch of {n} images")
+        idx %= n
+        r = self._views.get(idx)
+        if r is None:
+            r = self._views[idx] = Results(
+                self.orig_imgs[idx] if self.orig_imgs is not None else None,
+                path=self.paths[idx],
+                names=self.names,
+                boxes=self.data[self.offsets[idx] : self.offsets[idx + 1]],
+                speed=self.speed,
+                orig_shape=self.orig_shapes[idx],
+            )
+        return r
+
+    def __iter__(self):
+        """Iterate over the Results views of all images."""
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def image_index(self) -> torch.Tensor | np.ndarray:
+        """Return the batch image index of each detection, with shape (N,)."""
+        counts = [b - a for a, b in zip(self.offsets[:-1], self.offsets[1:])]
+        if isinstance(self.data, torch.Tensor):
+            return torch.repeat_interleave(torch.tensor(counts, device=self.data.device))
+        return np.repeat(np.arange(len(counts)), counts)
+
+    def _apply(self, fn: str, *args, **kwargs) -> BatchResults:
+        """Apply a tensor function to the detections once and return a new BatchResults without cached views."""
+        return BatchResults(
+            getattr(self.data, fn)(*args, **kwargs),
+            self.offsets,
+            self.orig_shapes,
+            self.paths,
+            self.names,
+            orig_imgs=self.orig_imgs,
+            speed=self.speed,
+        )
+
+    def cpu(self) -> BatchResults:
+        """Return a copy of the BatchResults with the detections moved to CPU memory in one transfer."""
+        return self._apply("cpu")
+
+    def numpy(self) -> BatchResults:
+        """Return a copy of the BatchResults with the detections converted to a numpy array in one transfer."""
+        return self if isinstance(self.data, np.ndarray) else self._apply("cpu")._apply("numpy")
+
+    def cuda(self) -> BatchResults:
+        """Return a copy of the BatchResults with the detections moved to GPU memory."""
+        return self._apply("cuda")
+
+    def to(self, *args, **kwargs) -> BatchResults:
+        """Return a copy of the BatchResults with the detections moved to the specified device and dtype."""
+        return self._apply("to", *args, **kwargs)
+
+    def release_images(self):
+        """Drop the original images from the batch and from any views built so far."""
+        self.orig_imgs = None
+        for r in self._views.values():
+            r.orig_img = None
+
+    def columns(self, normalize: bool = False, decimals: int = 5) -> dict[str, np.ndarray]:
+        """Return all detections of the batch as flat numpy columns, converted in one call.
+
+        Args:
+            normalize (bool): Whether to normalize box coordinates by image dimensions.
+            decimals (int): Number of decimal places to round the confidences and box coordinates to.
+
+        Returns:
+            (dict[str, np.ndarray]): Columns 'image', 'path', 'name', 'class', 'confidence', 'x1', 'y1', 'x2', 'y2'
+                and 'track_id' for tracked detections, each of length N.
+        """
+        data = self.numpy().data
+        image = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        boxes = data[:, :4].astype(np.float64)
+        if normalize:
+            h, w = np.asarray(self.orig_shapes, dtype=np.float64).reshape(-1, 2)[image].T
+            boxes /= np.stack([w, h, w, h], axis=1)
+        cls = data[:, -1].astype(int)
+        unique, inverse = np.unique(cls, return_inverse=True)  # look up each class name once
+        columns = {
+            "image": image,
+            "path": np.array(self.paths, dtype=object)[image],
+            "name": np.array([self.names[k] for k in unique.tolist()], dtype=object)[inverse.reshape(-1)],
+            "class": cls,
+            "confidence": data[:, -2].astype(np.float64).round(decimals),
+        }
+        for j, k in enumerate(("x1", "y1", "x2", "y2")):
+            columns[k] = boxes[:, j].round(decimals)
+        if data.shape[1] == 7:
+            columns["track_id"] = data[:, 4].astype(int)
+        return columns
+
+    def summary(self, normalize: bool = False, decimals: int = 5) -> list[dict[str, Any]]:
+        """Convert the detections of the batch to a list of dictionaries, one per detection.
+
+        Args:
+            normalize (bool): Whether to normalize box coordinates by image dimensions.
+            decimals (int): Number of decimal places to round the output values to.
+
+        Returns:
+            (list[dict[str, Any]]): One dictionary per detection, with the keys of `columns`.
+        """
+        columns = {k: v.tolist() for k, v in self.columns(normalize, decimals).items()}
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def to_df(self, normalize: bool = False, decimals: int = 5):
+        """Create a Polars DataFrame directly from the detection columns.
+
+        Args:
+            normalize (bool, optional): Normalize box coordinates by image dimensions.
+            decimals (int, optional): Decimal places to round floats.
+
+        Returns:
+            (polars.DataFrame): One row per detection.
+        """
+        import polars as pl  # scope for faster 'import ultralytics'
+
+        columns = self.columns(normalize, decimals)
+        return pl.DataFrame({k: v.tolist() if v.dtype == object else v for k, v in columns.items()})
+
+    def to_arrow(self, normalize: bool = False, decimals: int = 5):
+        """Create a PyArrow Table from the detection columns.
+
+        Args:
+            normalize (bool, optional): Normalize box coordinates by image dimensions.
+            decimals (int, optional): Decimal places to round floats.
+
+        Returns:
+            (pyarrow.Table): One row per detection.
+        """
+        from ultralytics.utils.checks import check_requirements
+
+        check_requirements("pyarrow")
+        import pyarrow as pa
+
+        columns = self.columns(normalize, decimals)
+        return pa.table({k: pa.array(v.tolist() if v.dtype == object else v) for k, v in columns.items()})
+
+
 class Boxes(BaseTensor):
     """A class for managing and manipulating detection boxes.
 
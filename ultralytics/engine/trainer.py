@@ -8,15 +8,18 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import gc
 import math
 import os
 import subprocess
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import torch
@@ -25,6 +28,7 @@ from torch import nn, optim
 
 from ultralytics import __version__
 from ultralytics.cfg import get_cfg, get_save_dir
+from ultralytics.data.build import build_dataloader
 from ultralytics.data.utils import check_cls_dataset, check_det_dataset
 from ultralytics.nn.tasks import load_checkpoint
 from ultralytics.utils import (
@@ -44,6 +48,7 @@ from ultralytics.utils.autobatch import check_train_batch_size
 from ultralytics.utils.checks import check_amp, check_file, check_imgsz, check_model_file_from_stem, print_args
 from ultralytics.utils.dist import ddp_cleanup, generate_ddp_command
 from ultralytics.utils.files import get_latest_run
+from ultralytics.utils.patches import torch_load
 from ultralytics.utils.plotting import plot_results
 from ultralytics.utils.torch_utils import (
     TORCH_2_4,
@@ -71,6 +76,7 @@ class BaseTrainer:
     Attributes:
         args (SimpleNamespace): Configuration for the trainer.
         validator (BaseValidator): Validator instance.
+        val_subset_loader (DataLoader | None): Stratified validation subset used for intermediate epochs.
         model (nn.Module): Model instance.
         callbacks (defaultdict): Dictionary of callbacks.
         save_dir (Path): Directory to save results.
@@ -101,6 +107,8 @@ class BaseTrainer:
     Methods:
         train: Execute the training process.
         validate: Run validation on the test set.
+        validate_async: Validate an EMA snapshot in a background thread.
+        collect_validation: Wait for a pending background validation and apply its results.
         save_model: Save model training checkpoints.
         get_dataset: Get train and validation datasets.
         setup_model: Load, create, or download model.
@@ -127,6 +135,8 @@ class BaseTrainer:
         # Update "-1" devices so post-training val does not repeat search
         self.args.device = os.getenv("CUDA_VISIBLE_DEVICES") if "cuda" in str(self.device) else str(self.device)
         self.validator = None
+        self.val_subset_loader = None
+        self._val_pool, self._val_pending = None, None  # background validation thread and in-flight epoch
         self.metrics = None
         self.plots = {}
         init_seeds(self.args.seed + 1 + RANK, deterministic=self.args.deterministic)
@@ -330,7 +340,18 @@ class BaseTrainer:
             mode="val",
         )
         self.validator = self.get_validator()
-        self.ema = ModelEMA(self.model)
+        if self.args.val_fraction < 1.0 and hasattr(self.test_loader.dataset, "subset"):
+            self.val_subset_loader = build_dataloader(
+                self.test_loader.dataset.subset(self.args.val_fraction, seed=self.args.seed),
+                self.test_loader.batch_size,
+                self.test_loader.num_workers,
+                shuffle=False,
+                rank=LOCAL_RANK,
+            )
+        if self.args.val_async and self.world_size > 1:
+            LOGGER.warning("val_async=True is not supported for multi-GPU training, setting val_async=False.")
+            self.args.val_async = False
+        self.ema = ModelEMA(self.model, interval=self.args.ema_interval)
         if RANK in {-1, 0}:
             metric_keys = self.validator.metrics.keys + self.label_loss_items(prefix="val")
             self.metrics = dict(zip(metric_keys, [0] * len(metric_keys)))
@@ -472,9 +493,16 @@ class BaseTrainer:
 
             # Validation
             final_epoch = epoch + 1 >= self.epochs
-            if self.args.val or final_epoch or self.stopper.possible_stop or self.stop:
+            full_val = final_epoch or self.stopper.possible_stop or self.stop
+            if self.args.val or full_val:
                 self._clear_memory(threshold=0.5)  # prevent VRAM spike
-                self.metrics, self.fitness = self.validate()
+                if self.args.val_async and not full_val:
+                    self.validate_async()
+                else:
+                    self.collect_validation()
+                    self.metrics, self.fitness = self.validate(full=full_val)
+                    if full_val and self.val_subset_loader is not None:  # score on the subset like other epochs
+                        self.fitness = self.validate(full=False)[1]
 
             # NaN recovery
             if self._handle_nan_recovery(epoch):
@@ -482,8 +510,11 @@ class BaseTrainer:
 
             self.nan_recovery_attempts = 0
             if RANK in {-1, 0}:
-                self.save_metrics(metrics={**self.label_loss_items(self.tloss), **self.metrics, **self.lr})
-                self.stop |= self.stopper(epoch + 1, self.fitness) or final_epoch
+                if self._val_pending and self._val_pending["epoch"] == epoch:  # row is written when metrics arrive
+                    self._val_pending["row"] = {**self.label_loss_items(self.tloss), **self.lr}
+                else:
+                    self.save_metrics(metrics={**self.label_loss_items(self.tloss), **self.metrics, **self.lr})
+                    self.stop |= self.stopper(epoch + 1, self.fitness) or final_epoch
                 if self.args.time:
                     self.stop |= (time.time() - self.train_time_start) > (self.args.time * 3600)
 
@@ -514,6 +545,9 @@ class BaseTrainer:
                 break  # must break all DDP ranks
             epoch += 1
 
+        self.collect_validation()
+        if self._val_pool:
+            self._val_pool.shutdown()
         seconds = time.time() - self.train_time_start
         LOGGER.info(f"\n{epoch - self.start_epoch + 1} epochs completed in {seconds / 3600:.3f} hours.")
         # Do final val with best.pt
@@ -616,7 +650,9 @@ class BaseTrainer:
         # Save checkpoints
         self.wdir.mkdir(parents=True, exist_ok=True)  # ensure weights directory exists
         self.last.write_bytes(serialized_ckpt)  # save last.pt
-        if self.best_fitness == self.fitness:
+        if self._val_pending and self._val_pending["epoch"] == self.epoch:
+            self._val_pending["ckpt"] = serialized_ckpt  # best.pt is decided when its validation finishes
+        elif self.best_fitness == self.fitness:
             self.best.write_bytes(serialized_ckpt)  # save best.pt
         if (self.save_period > 0) and (self.epoch % self.save_period == 0):
             (self.wdir / f"epoch{self.epoch}.pt").write_bytes(serialized_ckpt)  # save epoch, i.e. 'epoch3.pt'
@@ -693,9 +729,16 @@ class BaseTrainer:
         """Allow custom preprocessing model inputs and ground truths depending on task type."""
         return batch
 
-    def validate(self):
+    def validate(self, full=True, model=None):
         """Run validation on val set using self.validator.
 
+        Subset and full-set fitness are not comparable, so with `val_fraction < 1` `best_fitness`, and with it best.pt
+        selection, only tracks subset validations.
+
+        Args:
+            full (bool): Validate on the full val set, otherwise on `val_subset_loader` when `val_fraction < 1`.
+            model (nn.Module, optional): Model to validate instead of the current EMA, e.g. a frozen snapshot.
+
         Returns:
             metrics (dict): Dictionary of validation metrics.
             fitness (float): Fitness score for the validation.
@@ -704,14 +747,94 @@ class BaseTrainer:
             # Sync EMA buffers from rank 0 to all ranks
             for buffer in self.ema.ema.buffers():
                 dist.broadcast(buffer, src=0)
-        metrics = self.validator(self)
+        subset = not full and self.val_subset_loader is not None
+        self.validator.dataloader = self.val_subset_loader if subset else self.test_loader
+        metrics = self.validator(self, model=model)
         if metrics is None:
             return None, None
         fitness = metrics.pop("fitness", -self.loss.detach().cpu().numpy())  # use loss as fitness measure if not found
-        if not self.best_fitness or self.best_fitness < fitness:
-            self.best_fitness = fitness
+        if model is None and (subset or self.val_subset_loader is None):
+            if not self.best_fitness or self.best_fitness < fitness:
+                self.best_fitness = fitness
         return metrics, fitness
 
+    def validate_async(self):
+        """Validate a frozen EMA snapshot of the current epoch in a background thread while training continues.
+
+        At most one validation is in flight: the previous one is collected first. Its metrics, results.csv row, early
+        stopping update and best.pt selection are applied by `collect_validation()` once it finishes. The results.csv
+        row is written under the validated epoch, but `self.metrics` lags by one epoch, so `on_fit_epoch_end`
+        callbacks of an epoch see the metrics of the previous one. The worker uses its own validator and a frozen copy
+        of the trainer state it reads, so the training loop can keep updating the trainer.
+        """
+        self.collect_validation()
+        if self._val_pool is None:
+            self._val_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="val")
+        snapshot = deepcopy(unwrap_model(self.ema.ema)).eval()
+        stream = None
+        if self.device.type == "cuda":
+            stream = torch.cuda.Stream(self.device)
+            stream.wait_stream(torch.cuda.current_stream(self.device))  # snapshot copies are queued on this stream
+        validator = self.get_validator()  # the training thread keeps using self.validator
+        validator.dataloader = self.test_loader if self.val_subset_loader is None else self.val_subset_loader
+        trainer = SimpleNamespace(  # trainer state read by BaseValidator, frozen at this epoch
+            device=self.device,
+            data=self.data,
+            amp=self.amp,
+            args=copy(self.args),
+            ema=SimpleNamespace(ema=snapshot),
+            model=snapshot,
+            loss_items=self.loss_items.detach().clone(),
+            stopper=SimpleNamespace(possible_stop=False),
+            epoch=self.epoch,
+            epochs=self.epochs,
+            world_size=self.world_size,
+            label_loss_items=self.label_loss_items,
+        )
+        loss = -self.loss.detach().cpu().numpy()  # fitness if the validator reports none
+
+        def run():
+            """Validate the snapshot on a side CUDA stream so it overlaps with training kernels."""
+            with torch.cuda.stream(stream) if stream else contextlib.nullcontext():
+                metrics = validator(trainer, model=snapshot)
+            if stream:
+                stream.synchronize()  # snapshot memory is only released once its kernels are done
+            return metrics, metrics.pop("fitness", loss)
+
+        self._val_pending = {"epoch": self.epoch, "future": self._val_pool.submit(run), "row": None, "ckpt": None}
+
+    def collect_validation(self):
+        """Wait for a pending background validation and apply its metrics, results.csv row and best.pt selection.
+
+        The checkpoints of the validated epoch were saved before its metrics were known, so last.pt, and the periodic
+        checkpoint if one was written, are rewritten with the collected metrics, best fitness and results.
+        """
+        pending, self._val_pending = self._val_pending, None
+        if pending is None:
+            return
+        self.metrics, self.fitness = pending["future"].result()
+        best = not self.best_fitness or self.best_fitness < self.fitness
+        if best:
+            self.best_fitness = self.fitness
+        if pending["row"] is not None:
+            self.save_metrics(metrics={**pending["row"], **self.metrics}, epoch=pending["epoch"])
+            self.stop |= self.stopper(pending["epoch"] + 1, self.fitness)
+        if pending["ckpt"]:
+            import io
+
+            ckpt = torch_load(io.BytesIO(pending["ckpt"]), map_location="cpu")
+            ckpt["best_fitness"] = self.best_fitness
+            ckpt["train_metrics"] = {**self.metrics, **{"fitness": self.fitness}}
+            ckpt["train_results"] = self.read_results_csv()
+            buffer = io.BytesIO()
+            torch.save(ckpt, buffer)
+            serialized_ckpt = buffer.getvalue()
+            self.last.write_bytes(serialized_ckpt)  # no later epoch has been saved yet
+            if best:
+                self.best.write_bytes(serialized_ckpt)  # save best.pt from the validated epoch
+            if (self.save_period > 0) and (pending["epoch"] % self.save_period == 0):
+                (self.wdir / f"epoch{pending['epoch']}.pt").write_bytes(serialized_ckpt)
+
     def get_model(self, cfg=None, weights=None, verbose=True):
         """Get model and raise NotImplementedError for loading cfg files."""
         raise NotImplementedError("This task trainer doesn't support loading cfg files")
@@ -757,15 +880,16 @@ class BaseTrainer:
         """Plot training labels for YOLO model."""
         pass
 
-    def save_metrics(self, metrics):
-        """Save training metrics to a CSV file."""
+    def save_metrics(self, metrics, epoch=None):
+        """Save training metrics to a CSV file, for the current epoch unless `epoch` is given."""
         keys, vals = list(metrics.keys()), list(metrics.values())
         n = len(metrics) + 2  # number of cols
         t = time.time() - self.train_time_start
+        epoch = self.epoch if epoch is None else epoch
         self.csv.parent.mkdir(parents=True, exist_ok=True)  # ensure parent directory exists
         s = "" if self.csv.exists() else ("%s," * n % ("epoch", "time", *keys)).rstrip(",") + "\n"
         with open(self.csv, "a", encoding="utf-8") as f:
-            f.write(s + ("%.6g," * n % (self.epoch + 1, t, *vals)).rstrip(",") + "\n")
+            f.write(s + ("%.6g," * n % (epoch + 1, t, *vals)).rstrip(",") + "\n")
 
     def plot_metrics(self):
         """Plot metrics from a CSV file."""
@@ -789,6 +913,7 @@ class BaseTrainer:
             LOGGER.info(f"\nValidating {model}...")
             self.validator.args.plots = self.args.plots
             self.validator.args.compile = False  # disable final val compile as too slow
+            self.validator.dataloader = self.test_loader  # full val set, an async epoch may have left the subset
             self.metrics = self.validator(model=model)
             self.metrics.pop("fitness", None)
             self.run_callbacks("on_fit_epoch_end")
@@ -851,7 +976,8 @@ class BaseTrainer:
         if ckpt.get("scaler") is not None:
             self.scaler.load_state_dict(ckpt["scaler"])
         if self.ema and ckpt.get("ema"):
-            self.ema = ModelEMA(self.model)  # validation with EMA creates inference tensors that can't be updated
+            # validation with EMA creates inference tensors that can't be updated
+            self.ema = ModelEMA(self.model, interval=self.args.ema_interval)
             self.ema.ema.load_state_dict(ckpt["ema"].float().state_dict())
             self.ema.updates = ckpt["updates"]
         self.best_fitness = ckpt.get("best_fitness", 0.0)
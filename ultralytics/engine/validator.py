@@ -133,7 +133,8 @@ class BaseValidator:
 
         Args:
             trainer (object, optional): Trainer object that contains the model to validate.
-            model (nn.Module, optional): Model to validate if not using a trainer.
+            model (nn.Module, optional): Model to validate if not using a trainer, or a frozen EMA snapshot to validate
+                instead of the trainer's current EMA.
 
         Returns:
             (dict): Dictionary containing validation statistics.
@@ -145,7 +146,7 @@ class BaseValidator:
             self.data = trainer.data
             # Force FP16 val during training
             self.args.half = self.device.type != "cpu" and trainer.amp
-            model = trainer.ema.ema or trainer.model
+            model = model or trainer.ema.ema or trainer.model
             if trainer.args.compile and hasattr(model, "_orig_mod"):
                 model = model._orig_mod  # validate non-compiled original model to avoid issues
             model = model.half() if self.args.half else model.float()
@@ -162,6 +163,7 @@ class BaseValidator:
                 dnn=self.args.dnn,
                 data=self.args.data,
                 fp16=self.args.half,
+                runtime=self.args.runtime,
             )
             self.device = model.device  # update device
             self.args.half = model.fp16  # update half
@@ -188,10 +190,7 @@ class BaseValidator:
             model.eval()
             if self.args.compile:
                 model = attempt_compile(model, device=self.device)
-            # model.warmup(imgsz=(1 if pt else self.args.batch, self.data["channels"], imgsz, imgsz))  # warmup
-            # Fix cứng cho 4 kênh
-            model.warmup(imgsz=(1 if pt else self.args.batch, 4, imgsz, imgsz))
-
+            model.warmup(imgsz=(1 if pt else self.args.batch, self.data["channels"], imgsz, imgsz))  # warmup
 
         self.run_callbacks("on_val_start")
         dt = (
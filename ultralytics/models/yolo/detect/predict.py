@@ -1,8 +1,13 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
+import numpy as np
+import torch
+
 from ultralytics.engine.predictor import BasePredictor
-from ultralytics.engine.results import Results
-from ultralytics.utils import nms, ops
+from ultralytics.engine.results import BatchResults, Results
+from ultralytics.utils import DEFAULT_CFG, nms, ops
 
 
 class DetectionPredictor(BasePredictor):
@@ -17,8 +22,11 @@ class DetectionPredictor(BasePredictor):
         batch (list): Batch of images and metadata for processing.
 
     Methods:
+        preprocess: Prepare images, cutting them into overlapping tiles when `tile` is set.
+        tile_grid: Return the cached tile grid for an image shape.
+        merge_tiles: Map tile detections back to their images and merge them with a cross-tile NMS.
         postprocess: Process raw model predictions into detection results.
-        construct_results: Build Results objects from processed predictions.
+        construct_results: Build Results objects, or one BatchResults with `batch_results`, from processed predictions.
         construct_result: Create a single Result object from a prediction.
         get_obj_feats: Extract object features from the feature maps.
 
@@ -28,8 +36,89 @@ class DetectionPredictor(BasePredictor):
         >>> args = dict(model="yolo11n.pt", source=ASSETS)
         >>> predictor = DetectionPredictor(overrides=args)
         >>> predictor.predict_cli()
+
+        Sliced inference on large images with overlapping 640 px tiles
+        >>> predictor = DetectionPredictor(overrides=dict(model="yolo11n.pt", tile=640, tile_overlap=0.2))
+
+        Columnar results per batch without holding the original images
+        >>> predictor = DetectionPredictor(overrides=dict(model="yolo11n.pt", batch_results=True, retain_imgs=False))
     """
 
+    def __init__(self, cfg=DEFAULT_CFG, overrides=None, _callbacks=None):
+        """Initialize the DetectionPredictor with an empty tile grid cache.
+
+        Args:
+            cfg (str | dict): Path to a configuration file or a configuration dictionary.
+            overrides (dict, optional): Configuration overrides.
+            _callbacks (dict, optional): Dictionary of callback functions.
+        """
+        super().__init__(cfg, overrides, _callbacks)
+        self._tile_grids = {}  # {(h, w): tile grid} reused across frames of the same size
+
+    @property
+    def tiling(self) -> bool:
+        """Whether sliced inference is enabled, which is supported for plain detection only."""
+        return bool(self.args.tile) and self.args.task == "detect"
+
+    @property
+    def batched(self) -> bool:
+        """Whether batches are returned as one BatchResults, which is supported for plain detection without tracking."""
+        return bool(self.args.batch_results) and self.args.task == "detect" and self.args.mode != "track"
+
+    def preprocess(self, im):
+        """Prepare input images before inference, cutting each image into overlapping tiles when `tile` is set.
+
+        Tiles are zero-copy views at native resolution and all tiles of the batch are letterboxed into one reusable
+        batch buffer, so the model sees them as a single large batch.
+
+        Args:
+            im (torch.Tensor | list[np.ndarray]): Images of shape (N, 3, H, W) for tensor, [(H, W, C) x N] for list.
+
+        Returns:
+            (torch.Tensor): Preprocessed image or tile tensor of shape (N or tiles, C, H, W).
+        """
+        if self.tiling and not isinstance(im, torch.Tensor):
+            im = [x[y0:y1, x0:x1] for x in im for x0, y0, x1, y1 in self.tile_grid(x.shape[:2])]
+        return super().preprocess(im)
+
+    def tile_grid(self, shape: tuple[int, int]) -> np.ndarray:
+        """Return the overlapping tile grid for an image shape, computing it once per shape.
+
+        Args:
+            shape (tuple[int, int]): Image shape (height, width).
+
+        Returns:
+            (np.ndarray): Tile boxes of shape (T, 4) as (x0, y0, x1, y1) pixel coordinates, see `ops.tile_grid`.
+        """
+        shape = tuple(shape)
+        grid = self._tile_grids.get(shape)
+        if grid is None:
+            grid = self._tile_grids[shape] = ops.tile_grid(shape, self.args.tile, self.args.tile_overlap)
+        return grid
+
+    def merge_tiles(self, preds: list[torch.Tensor], shape: tuple[int, int], orig_imgs: list[np.ndarray]):
+        """Map tile detections back to their images and merge duplicates from overlapping tiles with a single NMS.
+
+        Args:
+            preds (list[torch.Tensor]): Per-tile detections of shape (N, 6) in letterboxed tile coordinates.
+            shape (tuple[int, int]): Letterboxed tile shape (height, width) used for inference.
+            orig_imgs (list[np.ndarray]): Original images the tiles were cut from.
+
+        Returns:
+            (list[torch.Tensor]): Per-image detections of shape (N, 6) in original image coordinates.
+        """
+        grids = [self.tile_grid(x.shape[:2]) for x in orig_imgs]
+        for pred, (x0, y0, x1, y1) in zip(preds, np.concatenate(grids)):
+            pred[:, :4] = ops.scale_boxes(shape, pred[:, :4], (y1 - y0, x1 - x0))
+            pred[:, :4] += pred.new_tensor([x0, y0, x0, y0])
+        pred, device = torch.cat(preds), preds[0].device
+        tile_img = torch.tensor([i for i, g in enumerate(grids) for _ in g], device=device)  # image index of each tile
+        img_idx = torch.repeat_interleave(tile_img, torch.tensor([len(p) for p in preds], device=device))
+        idxs = img_idx if self.args.agnostic_nms else img_idx * len(self.model.names) + pred[:, 5].long()
+        keep = nms.TorchNMS.batched_nms(pred[:, :4], pred[:, 4], idxs, self.args.iou)  # sorted by confidence
+        pred, img_idx = pred[keep], img_idx[keep]
+        return [pred[img_idx == i][: self.args.max_det] for i in range(len(orig_imgs))]
+
     def postprocess(self, preds, img, orig_imgs, **kwargs):
         """Post-process predictions and return a list of Results objects.
 
@@ -43,7 +132,8 @@ class DetectionPredictor(BasePredictor):
             **kwargs (Any): Additional keyword arguments.
 
         Returns:
-            (list): List of Results objects containing the post-processed predictions.
+            (list | BatchResults): List of Results objects containing the post-processed predictions, or a single
+                BatchResults when `batch_results` is set.
 
         Examples:
             >>> predictor = DetectionPredictor(overrides=dict(model="yolo11n.pt"))
@@ -51,6 +141,7 @@ class DetectionPredictor(BasePredictor):
             >>> processed_results = predictor.postprocess(preds, img, orig_imgs)
         """
         save_feats = getattr(self, "_feats", None) is not None
+        tiled = self.tiling and isinstance(orig_imgs, list)
         preds = nms.non_max_suppression(
             preds,
             self.args.conf,
@@ -67,6 +158,16 @@ class DetectionPredictor(BasePredictor):
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)[..., ::-1]
 
+        if tiled:
+            preds = preds[0] if save_feats else preds
+            preds = self.merge_tiles(preds, img.shape[2:], orig_imgs)
+            if self.batched:
+                return BatchResults.from_list([p[:, :6] for p in preds], orig_imgs, self.batch[0], self.model.names)
+            return [
+                Results(orig_img, path=img_path, names=self.model.names, boxes=pred[:, :6])
+                for pred, orig_img, img_path in zip(preds, orig_imgs, self.batch[0])
+            ]
+
         if save_feats:
             obj_feats = self.get_obj_feats(self._feats, preds[1])
             preds = preds[0]
@@ -99,8 +200,13 @@ class DetectionPredictor(BasePredictor):
             orig_imgs (list[np.ndarray]): List of original images before preprocessing.
 
         Returns:
-            (list[Results]): List of Results objects containing detection information for each image.
+            (list[Results] | BatchResults): List of Results objects containing detection information for each image,
+                or one BatchResults holding the detections of all images when `batch_results` is set.
         """
+        if self.batched:
+            for pred, orig_img in zip(preds, orig_imgs):
+                pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+            return BatchResults.from_list([p[:, :6] for p in preds], orig_imgs, self.batch[0], self.model.names)
         return [
             self.construct_result(pred, img, orig_img, img_path)
             for pred, orig_img, img_path in zip(preds, orig_imgs, self.batch[0])
@@ -117,6 +117,8 @@ class DetectionTrainer(BaseTrainer):
             if isinstance(v, torch.Tensor):
                 batch[k] = v.to(self.device, non_blocking=self.device.type == "cuda")
         batch["img"] = batch["img"].float() / 255
+        if (augment := getattr(self.train_loader.dataset, "batch_transforms", None)) is not None:
+            batch = augment(batch)  # batched mosaic, affine, mixup, flip and color augmentation on device
         if self.args.multi_scale:
             imgs = batch["img"]
             sz = (
@@ -155,8 +157,7 @@ class DetectionTrainer(BaseTrainer):
         Returns:
             (DetectionModel): YOLO detection model.
         """
-        # model = DetectionModel(cfg, nc=self.data["nc"], ch=self.data["channels"], verbose=verbose and RANK == -1)
-        model = DetectionModel(cfg, nc=self.data["nc"], verbose=verbose and RANK == -1, ch=4)
+        model = DetectionModel(cfg, nc=self.data["nc"], ch=self.data["channels"], verbose=verbose and RANK == -1)
         if weights:
             model.load(weights)
         return model
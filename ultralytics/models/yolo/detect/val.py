@@ -58,7 +58,7 @@ class DetectionValidator(BaseValidator):
         self.args.task = "detect"
         self.iouv = torch.linspace(0.5, 0.95, 10)  # IoU vector for mAP@0.5:0.95
         self.niou = self.iouv.numel()
-        self.metrics = DetMetrics()
+        self.metrics = DetMetrics(bins=self.args.ap_bins)
 
     def preprocess(self, batch: dict[str, Any]) -> dict[str, Any]:
         """Preprocess batch of images for YOLO validation.
@@ -223,20 +223,16 @@ class DetectionValidator(BaseValidator):
         """Gather stats from all GPUs."""
         if RANK == 0:
             gathered_stats = [None] * dist.get_world_size()
-            dist.gather_object(self.metrics.stats, gathered_stats, dst=0)
-            merged_stats = {key: [] for key in self.metrics.stats.keys()}
-            for stats_dict in gathered_stats:
-                for key in merged_stats:
-                    merged_stats[key].extend(stats_dict[key])
+            dist.gather_object(self.metrics.accumulator or self.metrics.stats, gathered_stats, dst=0)
+            self.metrics.merge_stats(gathered_stats)
             gathered_jdict = [None] * dist.get_world_size()
             dist.gather_object(self.jdict, gathered_jdict, dst=0)
             self.jdict = []
             for jdict in gathered_jdict:
                 self.jdict.extend(jdict)
-            self.metrics.stats = merged_stats
             self.seen = len(self.dataloader.dataset)  # total image count from dataset
         elif RANK > 0:
-            dist.gather_object(self.metrics.stats, None, dst=0)
+            dist.gather_object(self.metrics.accumulator or self.metrics.stats, None, dst=0)
             dist.gather_object(self.jdict, None, dst=0)
             self.jdict = []
             self.metrics.clear_stats()
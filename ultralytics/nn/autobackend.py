@@ -5,6 +5,7 @@ from __future__ import annotations
 import ast
 import json
 import platform
+import queue
 import zipfile
 from collections import OrderedDict, namedtuple
 from pathlib import Path
@@ -146,6 +147,8 @@ class AutoBackend(nn.Module):
         fp16: bool = False,
         fuse: bool = True,
         verbose: bool = True,
+        runtime: dict | None = None,
+        fuse_cache: bool = False,
     ):
         """Initialize the AutoBackend for inference.
 
@@ -157,9 +160,17 @@ class AutoBackend(nn.Module):
             fp16 (bool): Enable half-precision inference. Supported only on specific backends.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization.
             verbose (bool): Enable verbose logging.
+            runtime (dict, optional): ONNX Runtime and OpenVINO CPU execution settings. Supported keys are `threads`
+                (intra-op threads, 0 for the runtime default), `inter_threads`, `parallel` (parallel graph execution),
+                `optimize` ('disable', 'basic', 'extended' or 'all' ONNX Runtime graph optimizations), `arena` (ONNX
+                Runtime CPU memory arena), `io_binding` (bind static-shape ONNX inputs and outputs to preallocated
+                buffers, default True) and `sessions` (sessions or OpenVINO infer requests serving concurrent calls).
+            fuse_cache (bool): With `fuse`, reuse or write a `*.fused.pt` FP32 checkpoint of the fused model next to
+                `*.pt` weights, so later loads skip the FP32 conversion and Conv-BN fusion.
         """
         super().__init__()
         nn_module = isinstance(model, torch.nn.Module)
+        runtime = runtime or {}
         (
             pt,
             jit,
@@ -209,7 +220,7 @@ class AutoBackend(nn.Module):
             else:  # pt file
                 from ultralytics.nn.tasks import load_checkpoint
 
-                model, _ = load_checkpoint(model, device=device, fuse=fuse)  # load model, ckpt
+                model, _ = load_checkpoint(model, device=device, fuse=fuse, mmap=True, cache=fuse_cache)
 
             # Common PyTorch model processing
             if hasattr(model, "kpt_shape"):
@@ -260,7 +271,24 @@ class AutoBackend(nn.Module):
                 f"Using ONNX Runtime {onnxruntime.__version__} with {providers[0] if isinstance(providers[0], str) else providers[0][0]}"
             )
             if onnx:
-                session = onnxruntime.InferenceSession(w, providers=providers)
+                options = onnxruntime.SessionOptions()
+                options.intra_op_num_threads = int(runtime.get("threads", 0))
+                options.inter_op_num_threads = int(runtime.get("inter_threads", 0))
+                options.execution_mode = getattr(
+                    onnxruntime.ExecutionMode, "ORT_PARALLEL" if runtime.get("parallel") else "ORT_SEQUENTIAL"
+                )
+                options.graph_optimization_level = getattr(
+                    onnxruntime.GraphOptimizationLevel,
+                    {"disable": "ORT_DISABLE_ALL", "basic": "ORT_ENABLE_BASIC", "extended": "ORT_ENABLE_EXTENDED"}.get(
+                        runtime.get("optimize", "all"), "ORT_ENABLE_ALL"
+                    ),
+                )
+                options.enable_cpu_mem_arena = bool(runtime.get("arena", True))
+                sessions = [
+                    onnxruntime.InferenceSession(w, options, providers=providers)
+                    for _ in range(max(int(runtime.get("sessions", 1)), 1))
+                ]
+                session = sessions[0]
             else:
                 check_requirements(("model-compression-toolkit>=2.4.1", "edge-mdt-cl<1.1.0", "onnxruntime-extensions"))
                 w = next(Path(w).glob("*.onnx"))
@@ -271,18 +299,20 @@ class AutoBackend(nn.Module):
                 session_options = mctq.get_ort_session_options()
                 session_options.enable_mem_reuse = False  # fix the shape mismatch from onnxruntime
                 session = onnxruntime.InferenceSession(w, session_options, providers=["CPUExecutionProvider"])
+                sessions = [session]
 
             output_names = [x.name for x in session.get_outputs()]
             metadata = session.get_modelmeta().custom_metadata_map
             dynamic = isinstance(session.get_outputs()[0].shape[0], str)
             fp16 = "float16" in session.get_inputs()[0].type
 
-            # Setup IO binding for optimized inference (CUDA only, not supported for CoreML)
-            use_io_binding = not dynamic and cuda
-            if use_io_binding:
-                io = session.io_binding()
-                bindings = []
-                for output in session.get_outputs():
+            # Setup IO binding for optimized inference (CUDA and CPU, not supported for CoreML)
+            cpu_binding = onnx and device.type == "cpu" and runtime.get("io_binding", True)
+            use_io_binding = not dynamic and (cuda or cpu_binding)
+            session_pool = queue.Queue()  # (session, io, bindings), IO bindings serve one request at a time
+            for session in sessions:
+                io, bindings = (session.io_binding(), []) if use_io_binding else (None, None)
+                for output in session.get_outputs() if use_io_binding else ():
                     out_fp16 = "float16" in output.type
                     y_tensor = torch.empty(output.shape, dtype=torch.float16 if out_fp16 else torch.float32).to(device)
                     io.bind_output(
@@ -294,6 +324,7 @@ class AutoBackend(nn.Module):
                         buffer_ptr=y_tensor.data_ptr(),
                     )
                     bindings.append(y_tensor)
+                session_pool.put((session, io, bindings))
 
         # OpenVINO
         elif xml:
@@ -323,11 +354,17 @@ class AutoBackend(nn.Module):
                 dynamic = metadata.get("args", {}).get("dynamic", dynamic)
             # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (not recommended), or 'CUMULATIVE_THROUGHPUT'
             inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 and dynamic else "LATENCY"
-            ov_compiled_model = core.compile_model(
-                ov_model,
-                device_name=device_name,
-                config={"PERFORMANCE_HINT": inference_mode},
-            )
+            config = {"PERFORMANCE_HINT": inference_mode}
+            num_requests, threads = max(int(runtime.get("sessions", 1)), 1), int(runtime.get("threads", 0))
+            cpu_config = {"INFERENCE_NUM_THREADS": threads} if threads else {}
+            if num_requests > 1:
+                cpu_config["NUM_STREAMS"] = num_requests  # one CPU stream per infer request
+            if cpu_config and device_name in {"CPU", "AUTO"}:
+                config.update(cpu_config if device_name == "CPU" else {"DEVICE_PROPERTIES": {"CPU": cpu_config}})
+            ov_compiled_model = core.compile_model(ov_model, device_name=device_name, config=config)
+            ov_requests = queue.Queue()  # LATENCY mode infer requests, one per concurrent call
+            for _ in range(num_requests):
+                ov_requests.put(ov_compiled_model.create_infer_request())
             LOGGER.info(
                 f"Using OpenVINO {inference_mode} mode for batch={batch} inference on {', '.join(ov_compiled_model.get_property('EXECUTION_DEVICES'))}..."
             )
@@ -712,22 +749,27 @@ class AutoBackend(nn.Module):
 
         # ONNX Runtime
         elif self.onnx or self.imx:
-            if self.use_io_binding:
-                if not self.cuda:
-                    im = im.cpu()
-                self.io.bind_input(
-                    name="images",
-                    device_type=im.device.type,
-                    device_id=im.device.index if im.device.type == "cuda" else 0,
-                    element_type=np.float16 if self.fp16 else np.float32,
-                    shape=tuple(im.shape),
-                    buffer_ptr=im.data_ptr(),
-                )
-                self.session.run_with_iobinding(self.io)
-                y = self.bindings
-            else:
-                im = im.cpu().numpy()  # torch to numpy
-                y = self.session.run(self.output_names, {self.session.get_inputs()[0].name: im})
+            session, io, bindings = self.session_pool.get()
+            try:
+                if io is not None:
+                    im = (im if self.cuda else im.cpu()).contiguous()  # bound in place, no copy
+                    io.bind_input(
+                        name="images",
+                        device_type=im.device.type,
+                        device_id=im.device.index if im.device.type == "cuda" else 0,
+                        element_type=np.float16 if self.fp16 else np.float32,
+                        shape=tuple(im.shape),
+                        buffer_ptr=im.data_ptr(),
+                    )
+                    session.run_with_iobinding(io)
+                    # Output buffers are rebound by the next call on this session, copy the small outputs unless
+                    # running a single CUDA session as before
+                    y = bindings if self.cuda and len(self.sessions) == 1 else [b.clone() for b in bindings]
+                else:
+                    im = im.cpu().numpy()  # torch to numpy
+                    y = session.run(self.output_names, {session.get_inputs()[0].name: im})
+            finally:
+                self.session_pool.put((session, io, bindings))
             if self.imx:
                 if self.task == "detect":
                     # boxes, conf, cls
@@ -763,7 +805,11 @@ class AutoBackend(nn.Module):
                 y = [list(r.values()) for r in results]
                 y = [np.concatenate(x) for x in zip(*y)]
             else:  # inference_mode = "LATENCY", optimized for fastest first result at batch-size 1
-                y = list(self.ov_compiled_model(im).values())
+                request = self.ov_requests.get()
+                try:  # share_inputs reads the contiguous input in place, outputs are copied out of the request
+                    y = list(request.infer({self.input_name: np.ascontiguousarray(im)}, share_inputs=True).values())
+                finally:
+                    self.ov_requests.put(request)
 
         # TensorRT
         elif self.engine:
@@ -180,9 +180,9 @@ __all__ = (
     "FusionAdd", # MỚI
     "FusionAFF", # MỚI 
     "FusionRectify", #MỚI
-    "FusionDeformRectify" #NEW
-    "FusionCrossCBAM" #NEW
-    "FusionRectifyFeedback" #New
+    "FusionDeformRectify", #NEW
+    "FusionCrossCBAM", #NEW
+    "FusionRectifyFeedback", #New
     "Segment",
     "SpatialAttention",
     "TorchVision",
@@ -1958,25 +1958,79 @@ class InputContainer(nn.Module):
 
 class InputContainer(nn.Module):
     """
-    Module tách kênh an toàn.
-    Hỗ trợ cả trường hợp dummy input (ch=3) lúc khởi tạo model.
+    Split a multispectral input into per-stream channel groups without copying.
+
+    Each stream is a list of input channel indices, resolved by parse_model from the `bands` layout declared in the
+    model YAML. Streams made of consecutive channels are returned as zero-copy views of the input, any other stream
+    falls back to a single gather with an index tensor registered as a non-persistent buffer, so `model.to()` moves it
+    with the model.
+
+    Attributes:
+        streams (list[slice | str]): Channel slice, or name of the index buffer, for each stream.
+
+    Examples:
+        >>> m = InputContainer(4, [[0, 1, 2], [3]])
+        >>> rgb, nir = m(torch.randn(1, 4, 64, 64))
+        >>> rgb.shape, nir.shape
+        (torch.Size([1, 3, 64, 64]), torch.Size([1, 1, 64, 64]))
     """
-    def __init__(self, c1=4, c2=4):
+
+    def __init__(self, c1=4, streams=None):
+        """
+        Initialize InputContainer.
+
+        Args:
+            c1 (int): Number of input channels.
+            streams (list[list[int]], optional): Input channel indices of each stream, defaults to the first three
+                channels and the remaining auxiliary bands.
+
+        Raises:
+            ValueError: If a stream is empty or selects a channel outside the c1 input channels, e.g. a dual-stream
+                model built with 3 input channels.
+        """
         super().__init__()
+        streams = streams or [[0, 1, 2], list(range(3, c1))]
+        self.streams = []
+        for i, s in enumerate(streams):
+            if not s or not all(0 <= j < c1 for j in s):
+                raise ValueError(f"InputContainer stream {i} {list(s)} is empty or outside the {c1} input channels")
+            if s == list(range(s[0], s[-1] + 1)):
+                self.streams.append(slice(s[0], s[-1] + 1))
+            else:
+                self.register_buffer(f"index{i}", torch.tensor(s), persistent=False)
+                self.streams.append(f"index{i}")
 
     def forward(self, x):
-        # Kiểm tra nếu đầu vào thiếu kênh (VD: dummy pass kiểm tra stride chỉ có 3 kênh)
-        if x.shape[1] < 4:
-            # Tạo kênh NIR giả (tất cả bằng 0) để không bị lỗi dimension
-            # Lấy slice 0:1 để giữ nguyên số chiều [Batch, 1, H, W]
-            nir = torch.zeros_like(x[:, 0:1, ...])
-        else:
-            # Lấy kênh thứ 4 (NIR) chuẩn
-            nir = x[:, 3:4, ...] 
-            
-        # Trả về [RGB (3 kênh), NIR (1 kênh)]
-        return [x[:, :3, ...], nir]
-    
+        """Return the list of stream tensors, views of x wherever the stream channels are consecutive."""
+        return [x[:, s] if isinstance(s, slice) else x.index_select(1, getattr(self, s)) for s in self.streams]
+
+
+def _fuse_cross_gates(rectify_rgb, rectify_nir):
+    """
+    Merge two cross-modal rectify gates into one grouped 1x1 conv stack with BatchNorm folded in.
+
+    The NIR gate is computed from RGB features and the RGB gate from NIR features, so the fused gate reads
+    torch.cat((rgb, nir), 1) and returns the pre-sigmoid [nir_gate, rgb_gate] logits.
+
+    Args:
+        rectify_rgb (nn.Sequential): Conv2d, BatchNorm2d, ReLU, Conv2d, Sigmoid gate applied to NIR features.
+        rectify_nir (nn.Sequential): Conv2d, BatchNorm2d, ReLU, Conv2d, Sigmoid gate applied to RGB features.
+
+    Returns:
+        (nn.Sequential): Grouped Conv2d, ReLU, grouped Conv2d.
+    """
+    gates = (rectify_nir, rectify_rgb)  # ordered by input stream
+    cv1 = [fuse_conv_and_bn(g[0], g[1]) for g in gates]
+    c, c_ = cv1[0].in_channels, cv1[0].out_channels
+    fused = nn.Sequential(
+        nn.Conv2d(2 * c, 2 * c_, 1, groups=2), nn.ReLU(inplace=True), nn.Conv2d(2 * c_, 2 * c, 1, groups=2, bias=False)
+    ).to(cv1[0].weight)
+    fused[0].weight.data = torch.cat([m.weight for m in cv1])
+    fused[0].bias.data = torch.cat([m.bias for m in cv1])
+    fused[2].weight.data = torch.cat([g[3].weight for g in gates])
+    return fused.requires_grad_(False)
+
+
 # FusionAdd method
 class FusionAdd(nn.Module):
     """
@@ -2028,6 +2082,19 @@ class FusionAFF(nn.Module):
         xg = self.global_att(xa)
         weights = self.sigmoid(xl + xg)
         return 2.0 * (weights * rgb + (1.0 - weights) * nir)
+
+    def forward_fuse(self, x):
+        """Apply the fused local branch and blend both streams with a single lerp."""
+        rgb, nir = x[0], x[1]
+        xa = rgb + nir
+        weights = self.local_att(xa).add_(self.global_att(xa)).sigmoid_()
+        return torch.lerp(nir, rgb, weights).mul_(2.0)
+
+    @torch.no_grad()
+    def fuse(self):
+        """Fold the local branch BatchNorm layers into their convolutions."""
+        a = self.local_att
+        self.local_att = nn.Sequential(fuse_conv_and_bn(a[0], a[1]), a[2], fuse_conv_and_bn(a[3], a[4]))
     
 class FusionRectify(nn.Module):
     """
@@ -2078,6 +2145,18 @@ class FusionRectify(nn.Module):
         
         # 3. Cộng lại (Feature Aggregation)
         return rgb_rectified + nir_rectified
+
+    def forward_fuse(self, x):
+        """Compute both rectify gates with one grouped conv stack and apply them with fused multiply-adds."""
+        rgb, nir = x[0], x[1]
+        nir_gate, rgb_gate = self.gate(torch.cat((rgb, nir), 1)).sigmoid_().chunk(2, 1)
+        return torch.addcmul(rgb, rgb, rgb_gate).add_(torch.addcmul(nir, nir, nir_gate))
+
+    @torch.no_grad()
+    def fuse(self):
+        """Merge the RGB and NIR rectify gates into a single BatchNorm-free grouped gate."""
+        self.gate = _fuse_cross_gates(self.rectify_rgb, self.rectify_nir)
+        del self.rectify_rgb, self.rectify_nir
     
 
 class FusionDeformRectify(nn.Module):
@@ -2140,6 +2219,26 @@ class FusionDeformRectify(nn.Module):
         y = self.sigmoid(y).view(b, c, 1, 1)
         
         return fused * y
+
+    def forward_fuse(self, x):
+        """Align, rectify and reweight both streams with grouped convs over the concatenated features."""
+        aligned = self.align(torch.cat((x[0], x[1]), 1))
+        nir_gate, rgb_gate = self.gate(aligned).sigmoid_().chunk(2, 1)
+        rgb, nir = aligned.chunk(2, 1)
+        fused = torch.addcmul(rgb, rgb, rgb_gate).add_(torch.addcmul(nir, nir, nir_gate))
+        b, c = fused.shape[:2]
+        y = self.conv_eca(self.avg_pool(fused).view(b, 1, c)).sigmoid_()
+        return fused.mul_(y.view(b, c, 1, 1))
+
+    @torch.no_grad()
+    def fuse(self):
+        """Merge the two 3x3 align convs and the two rectify gates into grouped convs."""
+        c = self.align_rgb.in_channels
+        self.align = nn.Conv2d(2 * c, 2 * c, 3, padding=1, groups=2).to(self.align_rgb.weight).requires_grad_(False)
+        self.align.weight.data = torch.cat((self.align_rgb.weight, self.align_nir.weight))
+        self.align.bias.data = torch.cat((self.align_rgb.bias, self.align_nir.bias))
+        self.gate = _fuse_cross_gates(self.rectify_rgb, self.rectify_nir)
+        del self.align_rgb, self.align_nir, self.rectify_rgb, self.rectify_nir
     
 # --- Thêm vào ultralytics/nn/modules/block.py ---
 
@@ -2224,6 +2323,18 @@ class FusionCrossCBAM(nn.Module):
         
         # Trộn đều bằng Conv 1x1
         return self.act(self.bn(self.conv_out(fused)))
+
+    def forward_fuse(self, x):
+        """Apply cross spatial attention with fused multiply-adds and the BatchNorm-folded output conv."""
+        rgb, nir = x[0], x[1]
+        fused = torch.addcmul(rgb, rgb, self.sa_nir(nir)).add_(torch.addcmul(nir, nir, self.sa_rgb(rgb)))
+        return self.act(self.conv_out(fused))
+
+    @torch.no_grad()
+    def fuse(self):
+        """Fold the output BatchNorm into the 1x1 output conv."""
+        self.conv_out = fuse_conv_and_bn(self.conv_out, self.bn)
+        del self.bn
     
 class FusionRectifyFeedback(nn.Module):
     """
@@ -2274,4 +2385,16 @@ class FusionRectifyFeedback(nn.Module):
         nir_new = nir + nir * nir_gate
         
         # Trả về list 2 nhánh đã được cường hóa để đi tiếp xuống tầng sau
-        return [rgb_new, nir_new]
\ No newline at end of file
+        return [rgb_new, nir_new]
+
+    def forward_fuse(self, x):
+        """Compute both rectify gates with one grouped conv stack and return the rectified [rgb, nir] streams."""
+        rgb, nir = x[0], x[1]
+        nir_gate, rgb_gate = self.gate(torch.cat((rgb, nir), 1)).sigmoid_().chunk(2, 1)
+        return [torch.addcmul(rgb, rgb, rgb_gate), torch.addcmul(nir, nir, nir_gate)]
+
+    @torch.no_grad()
+    def fuse(self):
+        """Merge the RGB and NIR rectify gates into a single BatchNorm-free grouped gate."""
+        self.gate = _fuse_cross_gates(self.rectify_rgb, self.rectify_nir)
+        del self.rectify_rgb, self.rectify_nir
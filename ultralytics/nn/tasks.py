@@ -1,9 +1,11 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import contextlib
+import os
 import pickle
 import re
 import types
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 
@@ -90,6 +92,7 @@ from ultralytics.utils.ops import make_divisible
 from ultralytics.utils.patches import torch_load
 from ultralytics.utils.plotting import feature_visualization
 from ultralytics.utils.torch_utils import (
+    TORCH_2_1,
     fuse_conv_and_bn,
     fuse_deconv_and_bn,
     initialize_weights,
@@ -158,61 +161,114 @@ class BaseModel(torch.nn.Module):
         """
         if augment:
             return self._predict_augment(x)
+        if getattr(self, "branches", None) and not (profile or visualize or embed):
+            return self._predict_branches(x)
         return self._predict_once(x, profile, visualize, embed)
 
-    
     def _predict_once(self, x, profile=False, visualize=False, embed=None):
+        """Perform a forward pass through the network.
+
+        Args:
+            x (torch.Tensor): The input tensor to the model.
+            profile (bool): Print the computation time of each layer if True.
+            visualize (bool): Save the feature maps of the model if True.
+            embed (list, optional): A list of feature vectors/embeddings to return.
+
+        Returns:
+            (torch.Tensor): The last output of the model.
         """
-        Perform a forward pass through the network.
-        FIXED FOR EXP 12: Dual-Stream Rectified Feedback
-        """
-        y, dt, embeddings = [], [], []
+        y, dt, embeddings = [], [], []  # outputs
         embed = frozenset(embed) if embed is not None else {-1}
         max_idx = max(embed)
-
         for m in self.model:
-            # 1. Chuẩn bị Input (x) cho layer hiện tại (m)
-            if m.f != -1:
-                x = y[m.f] if isinstance(m.f, int) else [x if j == -1 else y[j] for j in m.f]
-            
+            if m.f != -1:  # if not from previous layer
+                x = y[m.f] if isinstance(m.f, int) else [x if j == -1 else y[j] for j in m.f]  # from earlier layers
+            if m.s is not None:  # select streams of multi-stream inputs, resolved once by parse_model()
+                x = x[m.s] if isinstance(m.s, int) else [xi if si is None else xi[si] for xi, si in zip(x, m.s)]
             if profile:
                 self._profile_one_layer(m, x, dt)
-
-            # ==========================================================
-            # [PATCH EXP 12] LOGIC TÁCH DÒNG CHẢY (SELECTOR)
-            # Chỉ can thiệp nếu input là List (Dual-Stream) VÀ không phải là Concat/Fusion
-            # ==========================================================
-            if isinstance(x, list) and len(x) == 2:
-                # Lấy tên class của layer để kiểm tra
-                m_type = str(type(m))
-                
-                # CHỈ xử lý nếu layer là Conv (Selector), KHÔNG xử lý Concat hay Fusion
-                if 'Concat' not in m_type and 'Fusion' not in m_type:
-                    # Danh sách các Layer Selector của nhánh RGB (Lấy phần tử 0)
-                    # 1: Stem RGB, 13: P3 RGB, 21: P4 RGB
-                    if m.i in [1, 13, 21]: 
-                        x = x[0]
-                    
-                    # Danh sách các Layer Selector của nhánh NIR (Lấy phần tử 1)
-                    # 4: Stem NIR, 14: P3 NIR, 22: P4 NIR
-                    elif m.i in [4, 14, 22]:
-                        x = x[1]
-            # ==========================================================
-
-            # 2. Chạy Layer
-            x = m(x)
-            
-            # 3. Lưu Output vào Cache (y)
-            y.append(x if m.i in self.save else None)
-
+            x = m(x)  # run
+            y.append(x if m.i in self.save else None)  # save output
             if visualize:
                 feature_visualization(x, m.type, m.i, save_dir=visualize)
             if m.i in embed:
-                embeddings.append(torch.nn.functional.adaptive_avg_pool2d(x, (1, 1)).squeeze(-1).squeeze(-1))
+                embeddings.append(torch.nn.functional.adaptive_avg_pool2d(x, (1, 1)).squeeze(-1).squeeze(-1))  # flatten
                 if m.i == max_idx:
                     return torch.unbind(torch.cat(embeddings, 1), dim=0)
         return x
-    
+
+    def _predict_branches(self, x):
+        """Perform a forward pass, running the independent branches of each region in `self.branches` concurrently.
+
+        Branches run in worker threads on CPU, where PyTorch ops release the GIL so that e.g. a small NIR backbone
+        overlaps with the RGB backbone, and additionally on separate CUDA streams on GPU. Eager `torch.jit.fork` is not
+        used as it executes Python callables synchronously.
+
+        Args:
+            x (torch.Tensor): The input tensor to the model.
+
+        Returns:
+            (torch.Tensor): The last output of the model.
+        """
+        y = [None] * len(self.model)  # outputs of the layers in self.save, as in _predict_once()
+
+        def forward(m, x):
+            """Run layer m on the output x of layer m.i - 1 and its other inputs from y, as in _predict_once()."""
+            if m.f != -1:  # if not from previous layer
+                x = y[m.f] if isinstance(m.f, int) else [x if j == -1 else y[j] for j in m.f]
+            if m.s is not None:
+                x = x[m.s] if isinstance(m.s, int) else [xi if si is None else xi[si] for xi, si in zip(x, m.s)]
+            x = m(x)
+            y[m.i] = x if m.i in self.save else None
+            return x
+
+        grad, inference = torch.is_grad_enabled(), torch.is_inference_mode_enabled()
+        cuda = x.device.type == "cuda"
+
+        def run(layers, x, stream=None):
+            """Run a branch on input x in the calling thread's grad mode, on its own CUDA stream if given."""
+            with torch.inference_mode(inference), torch.set_grad_enabled(grad):
+                with torch.cuda.stream(stream) if stream else contextlib.nullcontext():
+                    for i in layers:
+                        x = forward(self.model[i], x)
+            return x
+
+        i, regions = 0, {r[0]: r for r in self.branches}
+        while i < len(self.model):
+            if i not in regions:
+                x = forward(self.model[i], x)
+                i += 1
+                continue
+            _, i, branches = regions[i]
+            streams = [None] * len(branches)
+            if cuda:
+                main = torch.cuda.current_stream(x.device)
+                streams = _branch_streams(x.device, len(branches))
+                for s in streams:
+                    s.wait_stream(main)
+            futures = [_branch_pool().submit(run, b, x, s) for b, s in zip(branches[1:], streams[1:])]
+            outputs = [run(branches[0], x, streams[0])] + [f.result() for f in futures]
+            if cuda:
+                for s in streams:
+                    main.wait_stream(s)
+            x = next(o for b, o in zip(branches, outputs) if b[-1] == i - 1)  # output of the last layer of the region
+        return x
+
+    def parallelize(self, enabled=True):
+        """Enable or disable concurrent execution of independent branches, i.e. the RGB and NIR backbones.
+
+        Branches start at a stream selector of a multi-stream layer (see `parse_streams()`) and end before the first
+        layer joining several branches, i.e. a Fusion* or Concat layer. Profiling, visualization and embeddings always
+        use the sequential forward pass.
+
+        Args:
+            enabled (bool): Whether to run independent branches concurrently.
+
+        Returns:
+            (BaseModel): The model, with `branches` set to the regions found by `branch_regions()` or None.
+        """
+        self.branches = (branch_regions(self.model) or None) if enabled else None
+        return self
 
     def _predict_augment(self, x):
         """Perform augmentations on input image x and return augmented inference."""
@@ -272,6 +328,11 @@ class BaseModel(torch.nn.Module):
                 if isinstance(m, RepVGGDW):
                     m.fuse()
                     m.forward = m.forward_fuse
+                if isinstance(
+                    m, (FusionAFF, FusionRectify, FusionDeformRectify, FusionCrossCBAM, FusionRectifyFeedback)
+                ):
+                    m.fuse()
+                    m.forward = m.forward_fuse
                 if isinstance(m, v10Detect):
                     m.fuse()  # remove one2many head
             self.info(verbose=verbose)
@@ -410,6 +471,8 @@ class DetectionModel(BaseModel):
             self.yaml["backbone"][0][2] = "nn.Identity"
 
         # Define model
+        if self.yaml.get("bands"):
+            ch = len(self.yaml["bands"])  # declared band layout sets the true input channels
         self.yaml["channels"] = ch  # save channels
         if nc and nc != self.yaml["nc"]:
             LOGGER.info(f"Overriding model.yaml nc={self.yaml['nc']} with nc={nc}")
@@ -1395,7 +1458,7 @@ class SafeUnpickler(pickle.Unpickler):
             return SafeClass
 
 
-def torch_safe_load(weight, safe_only=False):
+def torch_safe_load(weight, safe_only=False, mmap=False):
     """Attempt to load a PyTorch model with the torch.load() function. If a ModuleNotFoundError is raised, it catches
     the error, logs a warning message, and attempts to install the missing module via the check_requirements()
     function. After installation, the function again attempts to load the model using torch.load().
@@ -1403,6 +1466,8 @@ def torch_safe_load(weight, safe_only=False):
     Args:
         weight (str): The file path of the PyTorch model.
         safe_only (bool): If True, replace unknown classes with SafeClass during loading.
+        mmap (bool): If True, memory-map tensor storages so payloads are only read from disk when accessed. Requires
+            torch>=2.1 and a zip-format checkpoint, otherwise the file is read eagerly.
 
     Returns:
         ckpt (dict): The loaded model checkpoint.
@@ -1437,7 +1502,7 @@ def torch_safe_load(weight, safe_only=False):
                 with open(file, "rb") as f:
                     ckpt = torch_load(f, pickle_module=safe_pickle)
             else:
-                ckpt = torch_load(file, map_location="cpu")
+                ckpt = _torch_load_mmap(file) if mmap else torch_load(file, map_location="cpu")
 
     except ModuleNotFoundError as e:  # e.name is missing module name
         if e.name == "models":
@@ -1476,7 +1541,23 @@ def torch_safe_load(weight, safe_only=False):
     return ckpt, file
 
 
-def load_checkpoint(weight, device=None, inplace=True, fuse=False):
+def _torch_load_mmap(file):
+    """Load a checkpoint with memory-mapped storages, falling back to an eager load for legacy non-zip files."""
+    if TORCH_2_1:
+        try:
+            return torch_load(file, map_location="cpu", mmap=True)
+        except RuntimeError:  # saved with _use_new_zipfile_serialization=False
+            pass
+    return torch_load(file, map_location="cpu")
+
+
+def _fused_cache_stamp(weight):
+    """Return the size and modification time of a weights file used to validate its fused inference cache."""
+    stat = Path(weight).stat()
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def load_checkpoint(weight, device=None, inplace=True, fuse=False, mmap=False, cache=False):
     """Load a single model weights.
 
     Args:
@@ -1484,14 +1565,36 @@ def load_checkpoint(weight, device=None, inplace=True, fuse=False):
         device (torch.device, optional): Device to load model to.
         inplace (bool): Whether to do inplace operations.
         fuse (bool): Whether to fuse model.
+        mmap (bool): Memory-map the checkpoint and drop optimizer and unused weight payloads from the returned ckpt, so
+            only the tensors of the loaded model are read from disk. Intended for inference-only loading. FP32
+            checkpoints are used in place; FP16 checkpoints, the default for saved weights, are still read and copied
+            by the FP32 conversion, so mmap then only avoids reading the optimizer and EMA payloads.
+        cache (bool): With `fuse`, reuse or write a `*.fused.pt` FP32 checkpoint of the fused model next to the weights,
+            so later loads skip the FP32 conversion and Conv-BN fusion. The cache is rebuilt when the weights change.
 
     Returns:
         model (torch.nn.Module): Loaded model.
         ckpt (dict): Model checkpoint dictionary.
+
+    Examples:
+        >>> from ultralytics.nn.tasks import load_checkpoint
+        >>> model, _ = load_checkpoint("path/to/best.pt", fuse=True, mmap=True, cache=True)
     """
-    ckpt, weight = torch_safe_load(weight)  # load ckpt
+    cache_file = Path(weight).with_suffix(".fused.pt") if fuse and cache and Path(weight).is_file() else None
+    if cache_file and cache_file.is_file():
+        ckpt, _ = torch_safe_load(cache_file, mmap=True)
+        if ckpt.get("source") == _fused_cache_stamp(weight):
+            model = ckpt["model"]
+            model.pt_path = str(weight)
+            return _prepare_inference_model(model, device, inplace), ckpt
+
+    ckpt, weight = torch_safe_load(weight, mmap=mmap)  # load ckpt
     args = {**DEFAULT_CFG_DICT, **(ckpt.get("train_args", {}))}  # combine model and default args, preferring model args
-    model = (ckpt.get("ema") or ckpt["model"]).float()  # FP32 model
+    model = ckpt.get("ema") or ckpt["model"]
+    if any(t.is_floating_point() and t.dtype != torch.float32 for t in model.state_dict().values()):
+        model = model.float()  # FP32 model, converting an FP32 model would only touch every mapped page
+    if mmap:  # release payloads that are never needed for inference, their storages are never paged in
+        ckpt = {k: v for k, v in ckpt.items() if k not in {"ema", "model", "optimizer", "train_results"}}
 
     # Model compatibility updates
     model.args = args  # attach args to model
@@ -1499,18 +1602,38 @@ def load_checkpoint(weight, device=None, inplace=True, fuse=False):
     model.task = getattr(model, "task", guess_model_task(model))
     if not hasattr(model, "stride"):
         model.stride = torch.tensor([32.0])
+    for m in getattr(model, "model", ()):
+        if hasattr(m, "f") and not hasattr(m, "s"):  # models saved before YAML stream selection
+            j = m.i - 1 if m.f == -1 else m.f
+            multi = isinstance(j, int) and isinstance(model.model[j], (InputContainer, FusionRectifyFeedback))
+            m.s = {1: 0, 13: 0, 21: 0, 4: 1, 14: 1, 22: 1}.get(m.i) if multi else None  # legacy dual-stream indices
+        if isinstance(m, InputContainer) and not hasattr(m, "streams"):
+            m.streams = [slice(0, 3), slice(3, 4)]  # legacy fixed RGB + NIR split
+
+    model = model.fuse() if fuse and hasattr(model, "fuse") else model
+    if cache_file:
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:  # write-then-rename so processes still mapping a previous cache keep a valid file
+            stamp = _fused_cache_stamp(weight)
+            torch.save({"model": model, "source": stamp, "train_args": ckpt.get("train_args")}, tmp)
+            os.replace(tmp, cache_file)
+        except (OSError, RuntimeError) as e:  # read-only weights directory, torch.save raises RuntimeError
+            tmp.unlink(missing_ok=True)
+            LOGGER.warning(f"Unable to write fused checkpoint cache '{cache_file}': {e}")
+
+    # Return model and ckpt
+    return _prepare_inference_model(model, device, inplace), ckpt
 
-    model = (model.fuse() if fuse and hasattr(model, "fuse") else model).eval().to(device)  # model in eval mode
 
-    # Module updates
+def _prepare_inference_model(model, device=None, inplace=True):
+    """Put a loaded model in eval mode on the target device and apply module compatibility updates."""
+    model = model.eval().to(device)  # model in eval mode
     for m in model.modules():
         if hasattr(m, "inplace"):
             m.inplace = inplace
         elif isinstance(m, torch.nn.Upsample) and not hasattr(m, "recompute_scale_factor"):
             m.recompute_scale_factor = None  # torch 1.11.0 compatibility
-
-    # Return model and ckpt
-    return model, ckpt
+    return model
 
 
 def parse_model(d, ch, verbose=True):
@@ -1552,6 +1675,14 @@ def parse_model(d, ch, verbose=True):
     repeat_modules = frozenset({BottleneckCSP, C1, C2, C2f, C3k2, C2fAttn, C3, C3TR, C3Ghost, C3x, RepC3, C2fPSA, C2fCIB, C2PSA, A2C2f})
 
     for i, (f, n, m, args) in enumerate(d["backbone"] + d["head"]):  # from, number, module, args
+        f, s = parse_streams(f)  # layer indices, stream selectors
+        if s is None:
+            ch_in = ch
+        else:  # expose the channels of selected streams of multi-stream layers, i.e. [3, 1] -> 1 for {0: 1}
+            ch_in = ch.copy()
+            for x, si in zip(*(([f], [s]) if isinstance(f, int) else (f, s))):
+                if si is not None:
+                    ch_in[x] = ch[x][si]
         m = (
             getattr(torch.nn, m[3:])
             if "nn." in m
@@ -1568,18 +1699,7 @@ def parse_model(d, ch, verbose=True):
         n = n_ = max(round(n * depth), 1) if n > 1 else n  # depth gain
         
         if m in base_modules:
-            c1, c2 = ch[f], args[0]
-            
-            # =========================================================
-            # [ PATCH CHO EXP 11 DUAL-BACKBONE ]
-            # Sửa số kênh đầu vào (c1) cho đúng với việc tách RGB/NIR
-            # =========================================================
-            if i == 1:      # Layer 1 (Nhánh RGB) -> Ép nhận 3 kênh
-                c1 = 3
-            elif i == 4:   # Layer 4 (Nhánh NIR) -> Ép nhận 1 kênh
-                c1 = 1
-            # =========================================================
-
+            c1, c2 = ch_in[f], args[0]
             if c2 != nc:  # if c2 != nc (e.g., Classify() output)
                 c2 = make_divisible(min(c2, max_channels) * width, 8)
             if m is C2fAttn:
@@ -1602,9 +1722,9 @@ def parse_model(d, ch, verbose=True):
                 legacy = False
 
         elif m is AIFI:
-            args = [ch[f], *args]
+            args = [ch_in[f], *args]
         elif m in frozenset({HGStem, HGBlock}):
-            c1, cm, c2 = ch[f], args[0], args[1]
+            c1, cm, c2 = ch_in[f], args[0], args[1]
             args = [c1, cm, c2, *args[2:]]
             if m is HGBlock:
                 args.insert(4, n)
@@ -1612,52 +1732,46 @@ def parse_model(d, ch, verbose=True):
         elif m is ResNetLayer:
             c2 = args[1] if args[3] else args[1] * 4
         elif m is torch.nn.BatchNorm2d:
-            args = [ch[f]]
+            args = [ch_in[f]]
         elif m is Concat:
-            c2 = sum(ch[x] for x in f)
+            c2 = sum(ch_in[x] for x in f)
         elif m in frozenset({Detect, WorldDetect, YOLOEDetect, Segment, YOLOESegment, Pose, OBB, ImagePoolingAttn, v10Detect}):
-            args.append([ch[x] for x in f])
+            args.append([ch_in[x] for x in f])
             if m is Segment or m is YOLOESegment:
                 args[2] = make_divisible(min(args[2], max_channels) * width, 8)
             if m in {Detect, YOLOEDetect, Segment, YOLOESegment, Pose, OBB}:
                 m.legacy = legacy
         elif m is RTDETRDecoder:
-            args.insert(1, [ch[x] for x in f])
+            args.insert(1, [ch_in[x] for x in f])
         elif m is CBLinear:
             c2 = args[0]
-            c1 = ch[f]
+            c1 = ch_in[f]
             args = [c1, c2, *args[1:]]
         elif m is CBFuse:
-            c2 = ch[f[-1]]
+            c2 = ch_in[f[-1]]
         elif m in frozenset({TorchVision, Index}):
             c2 = args[0]
-            c1 = ch[f]
+            c1 = ch_in[f]
             args = [*args[1:]]
-        
-        # =========================================================
-        # [ MODULE FUSION MỚI 
-        # =========================================================
-        elif m in {FusionAdd, FusionRectify, FusionDeformRectify, FusionCrossCBAM, FusionRectifyFeedback}:
-            if isinstance(f, list):
-                c2 = ch[f[0]]
-            else:
-                c2 = ch[f]
-            
-            # Logic args
-            if m in {FusionRectify, FusionDeformRectify, FusionCrossCBAM, FusionRectifyFeedback}: # <--- THÊM VÀO ĐÂY
-                args = [c2]
-            else:
-                args = [c2, c2]
-        # =========================================================
-
+        elif m is InputContainer:
+            bands = d.get("bands") or list(range(ch_in[f]))  # band names, or channel indices if undeclared
+            streams = [[bands.index(b) for b in x] for x in args] or [[0, 1, 2], list(range(3, ch_in[f]))]
+            c2 = [len(x) for x in streams]  # RGB and auxiliary band streams
+            args = [ch_in[f], streams]
+        elif m in frozenset(
+            {FusionAdd, FusionAFF, FusionRectify, FusionDeformRectify, FusionCrossCBAM, FusionRectifyFeedback}
+        ):
+            c2 = ch_in[f[0]]
+            args = [c2, c2] if m is FusionAdd else [c2]
+            if m is FusionRectifyFeedback:
+                c2 = [c2, c2]  # returns rectified [RGB, NIR] streams
         else:
-            c2 = ch[f]
+            c2 = ch_in[f]
 
-        # Khởi tạo module
         m_ = torch.nn.Sequential(*(m(*args) for _ in range(n))) if n > 1 else m(*args)
         t = str(m)[8:-2].replace("__main__.", "")
         m_.np = sum(x.numel() for x in m_.parameters())
-        m_.i, m_.f, m_.type = i, f, t
+        m_.i, m_.f, m_.s, m_.type = i, f, s, t  # attach index, 'from' index, stream selectors, type
         if verbose:
             LOGGER.info(f"{i:>3}{f!s:>20}{n_:>3}{m_.np:10.0f}  {t:<45}{args!s:<30}")
         save.extend(x % i for x in ([f] if isinstance(f, int) else f) if x != -1)
@@ -1668,6 +1782,91 @@ def parse_model(d, ch, verbose=True):
     
     return torch.nn.Sequential(*layers), sorted(save)
 
+
+_BRANCH_POOL = None  # worker threads shared by all models running branches concurrently
+_BRANCH_STREAMS = {}  # CUDA streams per device
+
+
+def _branch_pool():
+    """Return the thread pool used to run model branches concurrently, created on first use."""
+    global _BRANCH_POOL
+    if _BRANCH_POOL is None:
+        _BRANCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="branch")
+    return _BRANCH_POOL
+
+
+def _branch_streams(device, n):
+    """Return n CUDA streams for running model branches concurrently on device, created on first use."""
+    streams = _BRANCH_STREAMS.setdefault(str(device), [])
+    streams.extend(torch.cuda.Stream(device) for _ in range(n - len(streams)))
+    return streams[:n]
+
+
+def branch_regions(layers):
+    """Group model layers into regions of independent branches that can run concurrently.
+
+    A layer selecting a stream of a multi-stream layer starts a new branch and a layer with a single input from a branch
+    extends it. Every other layer, i.e. one joining several branches, belongs to the shared trunk and ends the region.
+
+    Args:
+        layers (torch.nn.Sequential): Layers built by parse_model(), with 'i', 'f' and 's' attributes.
+
+    Returns:
+        (list[tuple[int, int, list[list[int]]]]): Start index, end index (exclusive) and the layer indices of each
+            branch for every region with at least two branches.
+
+    Examples:
+        >>> model = DetectionModel("configs/yolo11_dual_rectify.yaml", ch=4)
+        >>> branch_regions(model.model)[0][2]  # RGB layers 1-10 and NDVI layers 11-21
+        [[1, 2, 3, 4, 5, 6, 7, 8, 9, 10], [11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21]]
+    """
+    branch, n = [None] * len(layers), 0
+    for m in layers:
+        f = [m.f] if isinstance(m.f, int) else m.f
+        if len(f) != 1 or m.i == 0:
+            continue
+        j = m.i - 1 if f[0] == -1 else f[0]
+        if m.s is not None:  # stream selector, start a new branch
+            branch[m.i], n = n, n + 1
+        elif branch[j] is not None:  # continue the branch of its only input
+            branch[m.i] = branch[j]
+
+    regions, i = [], 0
+    while i < len(layers):
+        j = i
+        while j < len(layers) and branch[j] is not None:
+            j += 1
+        if len(ids := list(dict.fromkeys(branch[i:j]))) > 1:
+            regions.append((i, j, [[k for k in range(i, j) if branch[k] == b] for b in ids]))
+        i = j + 1
+    return regions
+
+
+def parse_streams(f):
+    """Split a layer 'from' field into layer indices and stream selectors.
+
+    A 'from' entry written as a mapping {layer: stream} selects one stream of a multi-stream layer output, i.e. the
+    [RGB, NIR] list returned by InputContainer or FusionRectifyFeedback. For example `[{0: 1}, 1, Conv, [16, 3, 2]]`
+    feeds the NIR stream of layer 0 into a Conv and `[[{12: 0}, 5], 1, Concat, [1]]` concatenates the RGB stream of
+    layer 12 with layer 5.
+
+    Args:
+        f (int | dict | list[int | dict]): Layer 'from' field.
+
+    Returns:
+        f (int | list[int]): Layer indices.
+        s (int | list[int | None] | None): Stream selector of each input, or None if no input selects a stream.
+
+    Examples:
+        >>> parse_streams([{12: 0}, 5])
+        ([12, 5], [0, None])
+    """
+    fs = [next(iter(x.items())) if isinstance(x, dict) else (x, None) for x in (f if isinstance(f, list) else [f])]
+    if not isinstance(f, list):
+        return fs[0]
+    return [x for x, _ in fs], ([si for _, si in fs] if any(si is not None for _, si in fs) else None)
+
+
 def yaml_model_load(path):
     """Load a YOLOv8 model from a YAML file.
 
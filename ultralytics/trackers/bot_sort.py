@@ -36,10 +36,10 @@ class BOTrack(STrack):
     Methods:
         update_features: Update features vector and smooth it using exponential moving average.
         predict: Predict the mean and covariance using Kalman filter.
-        re_activate: Reactivate a track with updated features and optionally new ID.
-        update: Update the track with new detection and frame ID.
+        assign: Take over the detection attributes and features of a matched detection.
         tlwh: Property that gets the current position in tlwh format `(top left x, top left y, width, height)`.
         multi_predict: Predict the mean and covariance of multiple object tracks using shared Kalman filter.
+        multi_tlwh: Get the tlwh boxes of multiple tracks as one array.
         convert_coords: Convert tlwh bounding box coordinates to xywh format.
         tlwh_to_xywh: Convert bounding box to xywh format `(center x, center y, width, height)`.
 
@@ -95,17 +95,11 @@ class BOTrack(STrack):
 
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
-    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False) -> None:
-        """Reactivate a track with updated features and optionally assign a new ID."""
+    def assign(self, new_track: BOTrack, frame_id: int) -> None:
+        """Take over the detection attributes of a matched or re-found detection and smooth in its features."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().re_activate(new_track, frame_id, new_id)
-
-    def update(self, new_track: BOTrack, frame_id: int) -> None:
-        """Update the track with new detection information and the current frame ID."""
-        if new_track.curr_feat is not None:
-            self.update_features(new_track.curr_feat)
-        super().update(new_track, frame_id)
+        super().assign(new_track, frame_id)
 
     @property
     def tlwh(self) -> np.ndarray:
@@ -121,16 +115,20 @@ class BOTrack(STrack):
         """Predict the mean and covariance for multiple object tracks using a shared Kalman filter."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
+        multi_mean = np.asarray([st.mean for st in stracks])  # stacked copies
         multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][6] = 0
-                multi_mean[i][7] = 0
+        multi_mean[np.array([st.state != TrackState.Tracked for st in stracks]), 6:8] = 0
         multi_mean, multi_covariance = BOTrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+            st.mean, st.covariance = mean, cov
+
+    @staticmethod
+    def multi_tlwh(stracks: list[BOTrack]) -> np.ndarray:
+        """Get the (N, 4) top-left-width-height boxes of multiple tracks, converting their states in one operation."""
+        ret = np.asarray([st._tlwh if st.mean is None else st.mean[:4] for st in stracks], dtype=np.float64)
+        i = np.array([st.mean is not None for st in stracks], dtype=bool)
+        ret[i, :2] -= ret[i, 2:] / 2
+        return ret
 
     def convert_coords(self, tlwh: np.ndarray) -> np.ndarray:
         """Convert tlwh bounding box coordinates to xywh format."""
@@ -138,9 +136,9 @@ class BOTrack(STrack):
 
     @staticmethod
     def tlwh_to_xywh(tlwh: np.ndarray) -> np.ndarray:
-        """Convert bounding box from tlwh (top-left-width-height) to xywh (center-x-center-y-width-height) format."""
+        """Convert bounding box(es) from tlwh (top-left-width-height) to xywh (center-x-center-y-width-height)."""
         ret = np.asarray(tlwh).copy()
-        ret[:2] += ret[2:] / 2
+        ret[..., :2] += ret[..., 2:] / 2
         return ret
 
 
@@ -38,6 +38,9 @@ class STrack(BaseTrack):
         predict: Predict the next state of the object using Kalman filter.
         multi_predict: Predict the next states for multiple tracks.
         multi_gmc: Update multiple track states using a homography matrix.
+        multi_update: Update multiple matched tracks with one batched Kalman correction step.
+        multi_tlwh: Get the tlwh boxes of multiple tracks as one array.
+        multi_boxes: Get the xyxy or xywha boxes of multiple tracks as one array.
         activate: Activate a new tracklet.
         re_activate: Reactivate a previously lost tracklet.
         update: Update the state of a matched track.
@@ -87,34 +90,52 @@ class STrack(BaseTrack):
         """Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
+        multi_mean = np.asarray([st.mean for st in stracks])  # stacked copies
         multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][7] = 0
+        multi_mean[np.array([st.state != TrackState.Tracked for st in stracks]), 7] = 0
         multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+            st.mean, st.covariance = mean, cov
 
     @staticmethod
     def multi_gmc(stracks: list[STrack], H: np.ndarray = np.eye(2, 3)):
         """Update state tracks positions and covariances using a homography matrix for multiple tracks."""
         if stracks:
-            multi_mean = np.asarray([st.mean.copy() for st in stracks])
+            multi_mean = np.asarray([st.mean for st in stracks])
             multi_covariance = np.asarray([st.covariance for st in stracks])
 
             R = H[:2, :2]
             R8x8 = np.kron(np.eye(4, dtype=float), R)
             t = H[:2, 2]
 
-            for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-                mean = R8x8.dot(mean)
-                mean[:2] += t
-                cov = R8x8.dot(cov).dot(R8x8.transpose())
+            multi_mean = multi_mean @ R8x8.T
+            multi_mean[:, :2] += t
+            multi_covariance = R8x8 @ multi_covariance @ R8x8.T
+            for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+                st.mean, st.covariance = mean, cov
 
-                stracks[i].mean = mean
-                stracks[i].covariance = cov
+    @staticmethod
+    def multi_update(stracks: list[STrack], detections: list[STrack], frame_id: int):
+        """Update matched tracks with their detections using one batched Kalman correction step.
+
+        Tracked tracks are updated as in `update()` and lost tracks re-activated as in `re_activate(new_id=False)`.
+
+        Args:
+            stracks (list[STrack]): Matched tracks sharing one Kalman filter.
+            detections (list[STrack]): Detection matched to each track.
+            frame_id (int): The ID of the current frame.
+        """
+        if not stracks:
+            return
+        multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(
+            np.asarray([st.mean for st in stracks]),
+            np.asarray([st.covariance for st in stracks]),
+            stracks[0].convert_coords(np.asarray([det.tlwh for det in detections])),
+        )
+        for st, det, mean, cov in zip(stracks, detections, multi_mean, multi_covariance):
+            st.mean, st.covariance = mean, cov
+            st.tracklet_len = st.tracklet_len + 1 if st.state == TrackState.Tracked else 0
+            st.assign(det, frame_id)
 
     def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int):
         """Activate a new tracklet using the provided Kalman filter and initialize its state and covariance."""
@@ -135,15 +156,9 @@ class STrack(BaseTrack):
             self.mean, self.covariance, self.convert_coords(new_track.tlwh)
         )
         self.tracklet_len = 0
-        self.state = TrackState.Tracked
-        self.is_activated = True
-        self.frame_id = frame_id
+        self.assign(new_track, frame_id)
         if new_id:
             self.track_id = self.next_id()
-        self.score = new_track.score
-        self.cls = new_track.cls
-        self.angle = new_track.angle
-        self.idx = new_track.idx
 
     def update(self, new_track: STrack, frame_id: int):
         """Update the state of a matched track.
@@ -158,16 +173,17 @@ class STrack(BaseTrack):
             >>> new_track = STrack([105, 205, 55, 85, 0.95, 1])
             >>> track.update(new_track, 2)
         """
-        self.frame_id = frame_id
         self.tracklet_len += 1
-
-        new_tlwh = new_track.tlwh
         self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_tlwh)
+            self.mean, self.covariance, self.convert_coords(new_track.tlwh)
         )
+        self.assign(new_track, frame_id)
+
+    def assign(self, new_track: STrack, frame_id: int):
+        """Mark the track as tracked in frame `frame_id` and take over the detection attributes of `new_track`."""
+        self.frame_id = frame_id
         self.state = TrackState.Tracked
         self.is_activated = True
-
         self.score = new_track.score
         self.cls = new_track.cls
         self.angle = new_track.angle
@@ -194,12 +210,31 @@ class STrack(BaseTrack):
         ret[2:] += ret[:2]
         return ret
 
+    @staticmethod
+    def multi_tlwh(stracks: list[STrack]) -> np.ndarray:
+        """Get the (N, 4) top-left-width-height boxes of multiple tracks, converting their states in one operation."""
+        ret = np.asarray([st._tlwh if st.mean is None else st.mean[:4] for st in stracks], dtype=np.float64)
+        i = np.array([st.mean is not None for st in stracks], dtype=bool)
+        ret[i, 2] *= ret[i, 3]
+        ret[i, :2] -= ret[i, 2:] / 2
+        return ret
+
+    @classmethod
+    def multi_boxes(cls, stracks: list[STrack]) -> np.ndarray:
+        """Get the (N, 4) xyxy boxes of multiple tracks, or (N, 5) xywha boxes for tracks with an angle."""
+        ret = cls.multi_tlwh(stracks)
+        if stracks and stracks[0].angle is not None:
+            ret[:, :2] += ret[:, 2:] / 2
+            return np.concatenate([ret, np.asarray([st.angle for st in stracks], dtype=np.float64)[:, None]], 1)
+        ret[:, 2:] += ret[:, :2]
+        return ret
+
     @staticmethod
     def tlwh_to_xyah(tlwh: np.ndarray) -> np.ndarray:
-        """Convert bounding box from tlwh format to center-x-center-y-aspect-height (xyah) format."""
+        """Convert bounding box(es) from tlwh format to center-x-center-y-aspect-height (xyah) format."""
         ret = np.asarray(tlwh).copy()
-        ret[:2] += ret[2:] / 2
-        ret[2] /= ret[3]
+        ret[..., :2] += ret[..., 2:] / 2
+        ret[..., 2] /= ret[..., 3]
         return ret
 
     @property
@@ -250,6 +285,7 @@ class BYTETracker:
         init_track: Initialize object tracking with detections.
         get_dists: Calculate the distance between tracks and detections.
         multi_predict: Predict the location of tracks.
+        update_matches: Update matched tracks with their detections in one batch.
         reset_id: Reset the ID counter of STrack.
         reset: Reset the tracker by clearing all tracks.
         joint_stracks: Combine two lists of stracks.
@@ -325,31 +361,14 @@ class BYTETracker:
 
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
-
-        for itracked, idet in matches:
-            track = strack_pool[itracked]
-            det = detections[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matches(strack_pool, detections, matches, activated_stracks, refind_stracks)
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(results_second, feats_second)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO: consider fusing scores or appearance features for second association.
         dists = matching.iou_distance(r_tracked_stracks, detections_second)
         matches, u_track, _u_detection_second = matching.linear_assignment(dists, thresh=0.5)
-        for itracked, idet in matches:
-            track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matches(r_tracked_stracks, detections_second, matches, activated_stracks, refind_stracks)
 
         for it in u_track:
             track = r_tracked_stracks[it]
@@ -360,9 +379,7 @@ class BYTETracker:
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
-        for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
-            activated_stracks.append(unconfirmed[itracked])
+        self.update_matches(unconfirmed, detections, matches, activated_stracks, activated_stracks)
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
@@ -393,6 +410,24 @@ class BYTETracker:
 
         return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
 
+    def update_matches(
+        self, tracks: list[STrack], detections: list[STrack], matches, activated: list[STrack], refind: list[STrack]
+    ):
+        """Update matched tracks with their detections in one batch.
+
+        Args:
+            tracks (list[STrack]): Tracks indexed by the first column of `matches`.
+            detections (list[STrack]): Detections indexed by the second column of `matches`.
+            matches (list[list[int]] | np.ndarray): Matched (track, detection) index pairs of shape (K, 2).
+            activated (list[STrack]): Receives the matched tracks that were tracked, in match order.
+            refind (list[STrack]): Receives the matched tracks that were lost and are re-activated, in match order.
+        """
+        tracks = [tracks[i] for i, _ in matches]
+        for track in tracks:
+            (activated if track.state == TrackState.Tracked else refind).append(track)
+        if tracks:
+            tracks[0].multi_update(tracks, [detections[j] for _, j in matches], self.frame_id)
+
     def get_kalmanfilter(self) -> KalmanFilterXYAH:
         """Return a Kalman filter object for tracking bounding boxes using KalmanFilterXYAH."""
         return KalmanFilterXYAH()
@@ -455,15 +490,12 @@ class BYTETracker:
     def remove_duplicate_stracks(stracksa: list[STrack], stracksb: list[STrack]) -> tuple[list[STrack], list[STrack]]:
         """Remove duplicate stracks from two lists based on Intersection over Union (IoU) distance."""
         pdist = matching.iou_distance(stracksa, stracksb)
-        pairs = np.where(pdist < 0.15)
-        dupa, dupb = [], []
-        for p, q in zip(*pairs):
-            timep = stracksa[p].frame_id - stracksa[p].start_frame
-            timeq = stracksb[q].frame_id - stracksb[q].start_frame
-            if timep > timeq:
-                dupb.append(q)
-            else:
-                dupa.append(p)
+        p, q = np.nonzero(pdist < 0.15)
+        if not len(p):
+            return stracksa, stracksb
+        timep = np.array([stracksa[i].frame_id - stracksa[i].start_frame for i in p])
+        timeq = np.array([stracksb[i].frame_id - stracksb[i].start_frame for i in q])
+        dupa, dupb = set(p[timep <= timeq].tolist()), set(q[timep > timeq].tolist())
         resa = [t for i, t in enumerate(stracksa) if i not in dupa]
         resb = [t for i, t in enumerate(stracksb) if i not in dupb]
         return resa, resb
@@ -23,7 +23,9 @@ class KalmanFilterXYAH:
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step (vectorized version).
+        multi_project: Project multiple state distributions to measurement space (vectorized version).
         update: Run the Kalman filter correction step.
+        multi_update: Run the Kalman filter correction step (vectorized version).
         gating_distance: Compute the gating distance between state distribution and measurements.
 
     Examples:
@@ -227,6 +229,55 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected mean matrix with shape (N, 4).
+            covariance (np.ndarray): Projected covariance matrix with shape (N, 4, 4).
+        """
+        std = self._std_weight_position * mean[:, 3]
+        std = np.stack([std, std, np.full_like(std, 1e-1), std], 1)
+        return self._multi_project(mean, covariance, std)
+
+    def _multi_project(self, mean: np.ndarray, covariance: np.ndarray, std: np.ndarray):
+        """Project Nx8 states to measurement space, adding the Nx4 measurement noise standard deviations `std`."""
+        innovation_cov = np.square(std)[:, :, None] * np.eye(4)
+        mean = mean @ self._update_mat.T
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
+        """Run Kalman filter correction step for multiple object states (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the predicted states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the predicted states.
+            measurement (np.ndarray): The Nx4 dimensional measurement matrix in the filter's measurement space.
+
+        Returns:
+            new_mean (np.ndarray): Measurement-corrected state means with shape (N, 8).
+            new_covariance (np.ndarray): Measurement-corrected state covariances with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean, covariance = np.zeros((3, 8)) + [0, 0, 1, 1, 0, 0, 0, 0], np.tile(np.eye(8), (3, 1, 1))
+            >>> new_mean, new_covariance = kf.multi_update(mean, covariance, np.ones((3, 4)))
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        kalman_gain = np.linalg.solve(projected_cov, (covariance @ self._update_mat.T).transpose(0, 2, 1))
+        kalman_gain = kalman_gain.transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum("nij,nj->ni", kalman_gain, innovation)
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -297,6 +348,7 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step in a vectorized manner.
+        multi_project: Project multiple state distributions to measurement space in a vectorized manner.
         update: Run the Kalman filter correction step.
 
     Examples:
@@ -459,6 +511,20 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected mean matrix with shape (N, 4).
+            covariance (np.ndarray): Projected covariance matrix with shape (N, 4, 4).
+        """
+        std = self._std_weight_position * mean[:, [2, 3, 2, 3]]
+        return self._multi_project(mean, covariance, std)
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
         """Run Kalman filter correction step.
 
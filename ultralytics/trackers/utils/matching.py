@@ -81,8 +81,8 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
         atlbrs = atracks
         btlbrs = btracks
     else:
-        atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
-        btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
+        atlbrs = type(atracks[0]).multi_boxes(atracks) if atracks else []  # all track states converted at once
+        btlbrs = type(btracks[0]).multi_boxes(btracks) if btracks else []
 
     ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
     if len(atlbrs) and len(btlbrs):
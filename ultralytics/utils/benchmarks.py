@@ -3,8 +3,9 @@
 Benchmark YOLO model formats for speed and accuracy.
 
 Usage:
-    from ultralytics.utils.benchmarks import ProfileModels, benchmark
+    from ultralytics.utils.benchmarks import ProfileModels, ProfileStreams, benchmark
     ProfileModels(['yolo11n.yaml', 'yolov8s.yaml']).run()
+    ProfileStreams(['configs/yolo11_dual_rectify.yaml', 'configs/yolo11s_early_fusion.yaml']).run()
     benchmark(model='yolo11n.pt', imgsz=160)
 
 Format                  | `format=argument`         | Model
@@ -31,11 +32,14 @@ ExecuTorch              | `executorch`              | yolo11n_executorch_model/
 from __future__ import annotations
 
 import glob
+import json
 import os
 import platform
 import re
 import shutil
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import numpy as np
@@ -43,11 +47,23 @@ import torch.cuda
 
 from ultralytics import YOLO, YOLOWorld
 from ultralytics.cfg import TASK2DATA, TASK2METRIC
+from ultralytics.data.augment import LetterBox
 from ultralytics.engine.exporter import export_formats
+from ultralytics.nn.modules import (
+    Detect,
+    FusionAdd,
+    FusionAFF,
+    FusionCrossCBAM,
+    FusionDeformRectify,
+    FusionRectify,
+    FusionRectifyFeedback,
+)
+from ultralytics.nn.tasks import branch_regions
 from ultralytics.utils import ARM64, ASSETS, ASSETS_URL, IS_JETSON, LINUX, LOGGER, MACOS, TQDM, WEIGHTS_DIR, YAML
 from ultralytics.utils.checks import IS_PYTHON_3_13, check_imgsz, check_requirements, check_yolo, is_rockchip
 from ultralytics.utils.downloads import safe_download
 from ultralytics.utils.files import file_size
+from ultralytics.utils.ops import Profile, non_max_suppression
 from ultralytics.utils.torch_utils import get_cpu_info, select_device
 
 
@@ -726,3 +742,263 @@ class ProfileModels:
         LOGGER.info(separator)
         for row in table_rows:
             LOGGER.info(row)
+
+
+class ProfileStreams:
+    """ProfileStreams class for stage-level latency profiling of multispectral dual-stream and early-fusion models.
+
+    Each model is profiled in PyTorch on synthetic N-band uint8 images with the band count declared by the model. Every
+    run is split into preprocess, backbone, RGB branch, NDVI branch, fusion, head and NMS stages. For each stage the
+    p50/p95/p99 latency is reported, followed by end-to-end throughput at several batch sizes and peak memory. Results
+    are written to a JSON file so experiments can be compared across deployment hardware.
+
+    Attributes:
+        paths (list[str]): Paths of the model configs or weights to profile.
+        imgsz (int): Inference image size.
+        batch_sizes (tuple[int, ...]): Batch sizes for the throughput sweep.
+        num_timed_runs (int): Number of timed runs per measurement.
+        num_warmup_runs (int): Number of warmup runs before each measurement.
+        half (bool): Whether to profile in FP16 on CUDA devices.
+        device (torch.device): Device used for profiling.
+        save (Path | None): JSON file the results are written to, or None to skip saving.
+
+    Methods:
+        run: Profile all models, print a summary table and save the JSON results.
+        get_files: Get all relevant model files.
+        layer_stages: Assign every model layer to a profiling stage.
+        profile_model: Profile a single model.
+        track_rss: Track the peak resident set size increase of the process over a block of code.
+
+    Examples:
+        Compare the CMX rectification and rectify-feedback models on CPU
+        >>> from ultralytics.utils.benchmarks import ProfileStreams
+        >>> profiler = ProfileStreams(["configs/yolo11_dual_rectify.yaml", "configs/yolo11_dual_rectify_feedback.yaml"])
+        >>> results = profiler.run()
+    """
+
+    stages = ("preprocess", "backbone", "branch_rgb", "branch_ndvi", "fusion", "head", "nms")
+
+    def __init__(
+        self,
+        paths: list[str],
+        imgsz: int = 640,
+        batch_sizes: tuple[int, ...] = (1, 4, 8),
+        num_timed_runs: int = 100,
+        num_warmup_runs: int = 10,
+        half: bool = False,
+        device: torch.device | str | None = "cpu",
+        save: str | Path | None = "benchmarks_streams.json",
+    ):
+        """Initialize the ProfileStreams class.
+
+        Args:
+            paths (list[str]): Model *.yaml configs, *.pt weights or directories containing them.
+            imgsz (int): Inference image size.
+            batch_sizes (tuple[int, ...]): Batch sizes for the throughput sweep.
+            num_timed_runs (int): Number of timed runs per measurement.
+            num_warmup_runs (int): Number of warmup runs before each measurement.
+            half (bool): Whether to profile in FP16, only used on CUDA devices.
+            device (torch.device | str | None): Device used for profiling.
+            save (str | Path | None): JSON file the results are written to, or None to skip saving.
+        """
+        self.paths = paths
+        self.imgsz = imgsz
+        self.batch_sizes = batch_sizes
+        self.num_timed_runs = num_timed_runs
+        self.num_warmup_runs = num_warmup_runs
+        self.device = device if isinstance(device, torch.device) else select_device(device, verbose=False)
+        self.half = half and self.device.type != "cpu"
+        self.save = Path(save) if save else None
+
+    def run(self):
+        """Profile all models, print a summary table and save the JSON results.
+
+        Returns:
+            (list[dict]): Profiling results for each model.
+        """
+        results = [self.profile_model(file) for file in self.get_files()]
+        if not results:
+            LOGGER.warning("No matching *.pt or *.yaml files found.")
+            return results
+
+        stages = [k for k in self.stages if any(k in r["stages"] for r in results)]
+        LOGGER.info(f"\n{'Model':>32s}" + "".join(f"{k + ' p50/p99 (ms)':>28s}" for k in stages))
+        for r in results:
+            t = {k: f"{v['p50']:.2f}/{v['p99']:.2f}" for k, v in r["stages"].items()}
+            LOGGER.info(f"{r['model/name']:>32s}" + "".join(f"{t.get(k, '-'):>28s}" for k in stages))
+        if self.save:
+            self.save.parent.mkdir(parents=True, exist_ok=True)
+            system = {"device": str(self.device), "cpu": get_cpu_info(), "torch": torch.__version__}
+            if self.device.type == "cuda":
+                system["gpu"] = torch.cuda.get_device_name(self.device)
+            with open(self.save, "w", encoding="utf-8") as f:
+                json.dump({"system": system, "imgsz": self.imgsz, "half": self.half, "results": results}, f, indent=2)
+            LOGGER.info(f"Results saved to {self.save}")
+        return results
+
+    def get_files(self):
+        """Return a list of paths for all model configs and weights given by the user.
+
+        Returns:
+            (list[Path]): List of Path objects for the model files.
+        """
+        files = []
+        for path in self.paths:
+            path = Path(path)
+            if path.is_dir():
+                files.extend(file for ext in ("*.pt", "*.yaml") for file in glob.glob(str(path / ext)))
+            elif path.suffix in {".pt", ".yaml", ".yml"}:
+                files.append(str(path))
+            else:
+                files.extend(glob.glob(str(path)))
+
+        LOGGER.info(f"Profiling: {sorted(files)}")
+        return [Path(file) for file in sorted(files)]
+
+    @staticmethod
+    def layer_stages(model):
+        """Assign every layer of a model to a profiling stage.
+
+        Layers of an independent branch are labelled by the input stream they start from, Fusion* modules as fusion
+        and the remaining layers by the YAML section they were declared in.
+
+        Args:
+            model (torch.nn.Module): Model built by parse_model(), i.e. DetectionModel.
+
+        Returns:
+            (list[str]): Stage name of each layer in model.model.
+        """
+        n = len(model.yaml["backbone"])
+        stages = ["backbone" if m.i < n else "head" for m in model.model]
+        for _, _, branches in branch_regions(model.model):
+            for branch in branches:
+                s = model.model[branch[0]].s
+                for i in branch:
+                    stages[i] = {0: "branch_rgb", 1: "branch_ndvi"}.get(s, f"branch{s}")
+        fusion = (FusionAdd, FusionAFF, FusionRectify, FusionDeformRectify, FusionCrossCBAM, FusionRectifyFeedback)
+        for m in model.model:
+            if isinstance(m, fusion):
+                stages[m.i] = "fusion"
+            elif isinstance(m, Detect):
+                stages[m.i] = "head"
+        return stages
+
+    def profile_model(self, file: Path):
+        """Profile a single model stage by stage and across batch sizes.
+
+        Args:
+            file (Path): Model *.yaml config or *.pt weights.
+
+        Returns:
+            (dict): Model name, parameter count, per-stage latency percentiles in ms, throughput in images/s per batch
+                size, peak RSS increase and peak CUDA memory of this model in MB.
+        """
+        if self.device.type == "cuda":
+            torch.cuda.reset_peak_memory_stats(self.device)  # per-model peak, not the largest of all models so far
+        with self.track_rss() as rss:
+            model = YOLO(str(file)).model.fuse(verbose=False).to(self.device).eval()
+            model = model.half() if self.half else model.float()
+            ch = model.yaml.get("channels", 3)
+            stride = max(int(model.stride.max()), 32)
+            letterbox = LetterBox((self.imgsz, self.imgsz), auto=False, stride=stride)
+            rng = np.random.default_rng(0)
+            src = rng.integers(0, 256, (self.imgsz * 3 // 4, self.imgsz, ch), dtype=np.uint8)  # letterboxed to imgsz
+
+            def preprocess(n):
+                """Letterbox n images and convert them to a normalized BCHW tensor on the profiling device."""
+                im = np.ascontiguousarray(np.stack([letterbox(image=src) for _ in range(n)]).transpose(0, 3, 1, 2))
+                im = torch.from_numpy(im).to(self.device)
+                return (im.half() if self.half else im.float()) / 255
+
+            def pipeline(n):
+                """Run preprocess, model and NMS end to end for a batch of n images."""
+                return non_max_suppression(model(preprocess(n)), conf_thres=0.25, iou_thres=0.7, max_det=300)
+
+            # Stage latency at batch 1, timed with forward hooks on every top-level layer
+            stages = self.layer_stages(model)
+            dt = {k: Profile(device=self.device) for k in self.stages}
+            handles = []
+            for m, k in zip(model.model, stages):
+                handles.append(m.register_forward_pre_hook(lambda *_, p=dt[k]: p.__enter__()))
+                handles.append(m.register_forward_hook(lambda *_, p=dt[k]: p.__exit__(None, None, None)))
+            times = {k: [] for k in self.stages}
+            with torch.inference_mode():
+                for i in range(self.num_warmup_runs + self.num_timed_runs):
+                    for p in dt.values():
+                        p.t = 0.0
+                    with dt["preprocess"]:
+                        im = preprocess(1)
+                    preds = model(im)
+                    with dt["nms"]:
+                        non_max_suppression(preds, conf_thres=0.25, iou_thres=0.7, max_det=300)
+                    if i >= self.num_warmup_runs:
+                        for k, p in dt.items():
+                            times[k].append(p.t * 1000)
+            for h in handles:
+                h.remove()
+            used = {"preprocess", "nms", *stages}
+            stats = {
+                k: dict(zip(("p50", "p95", "p99"), np.percentile(v, (50, 95, 99)).round(3).tolist()))
+                for k, v in times.items()
+                if k in used
+            }
+
+            # End-to-end throughput across batch sizes
+            throughput = {}
+            with torch.inference_mode():
+                for n in self.batch_sizes:
+                    t = []
+                    for i in range(self.num_warmup_runs + self.num_timed_runs):
+                        with Profile(device=self.device) as p:
+                            pipeline(n)
+                        if i >= self.num_warmup_runs:
+                            t.append(p.dt)
+                    throughput[str(n)] = round(n / np.median(t), 2)  # images/s
+
+        return {
+            "model/name": file.stem,
+            "model/channels": ch,
+            "model/parameters": sum(x.numel() for x in model.parameters()),
+            "stages": stats,
+            "throughput(im/s)": throughput,
+            "memory/peak_rss_delta(MB)": round(rss["peak"] / 2**20, 1),
+            "memory/peak_cuda(MB)": round(torch.cuda.max_memory_allocated(self.device) / 2**20, 1)
+            if self.device.type == "cuda"
+            else None,
+        }
+
+    @staticmethod
+    @contextmanager
+    def track_rss(interval: float = 0.005):
+        """Sample the resident set size of the process in a background thread while the context is active.
+
+        The process-wide high-water mark never resets between models, so memory is reported as the peak increase over
+        the RSS at the start of the context instead.
+
+        Args:
+            interval (float): Sampling interval in seconds.
+
+        Yields:
+            (dict[str, int]): Dictionary whose 'peak' key holds the peak RSS increase in bytes once the context exits.
+        """
+        import psutil  # scoped as slow import
+
+        process = psutil.Process()
+        base = process.memory_info().rss
+        rss, stop = {"peak": 0}, threading.Event()
+
+        def sample():
+            """Update the peak RSS increase until stopped."""
+            while True:
+                rss["peak"] = max(rss["peak"], process.memory_info().rss - base)
+                if stop.wait(interval):
+                    break
+
+        thread = threading.Thread(target=sample, daemon=True)
+        thread.start()
+        try:
+            yield rss
+        finally:
+            stop.set()
+            thread.join()
+            rss["peak"] = max(rss["peak"], process.memory_info().rss - base)
@@ -755,6 +755,7 @@ def ap_per_class(
     names: dict[int, str] = {},
     eps: float = 1e-16,
     prefix: str = "",
+    n: np.ndarray | None = None,
 ) -> tuple:
     """Compute the average precision per class for object detection evaluation.
 
@@ -769,6 +770,8 @@ def ap_per_class(
         names (dict[int, str], optional): Dictionary of class names to plot PR curves.
         eps (float, optional): A small value to avoid division by zero.
         prefix (str, optional): A prefix string for saving the plot files.
+        n (np.ndarray, optional): Number of detections each row stands for, for binned input where `tp` holds true
+            positive counts (see `APAccumulator`). Defaults to one detection per row.
 
     Returns:
         tp (np.ndarray): True positive counts at threshold given by max F1 metric for each class.
@@ -787,6 +790,7 @@ def ap_per_class(
     # Sort by objectness
     i = np.argsort(-conf)
     tp, conf, pred_cls = tp[i], conf[i], pred_cls[i]
+    n = np.ones((len(i), 1)) if n is None else n[i, None]
 
     # Find unique classes
     unique_classes, nt = np.unique(target_cls, return_counts=True)
@@ -805,7 +809,7 @@ def ap_per_class(
             continue
 
         # Accumulate FPs and TPs
-        fpc = (1 - tp[i]).cumsum(0)
+        fpc = (n[i] - tp[i]).cumsum(0)
         tpc = tp[i].cumsum(0)
 
         # Recall
@@ -840,6 +844,130 @@ def ap_per_class(
     return tp, fp, p, r, f1, ap, unique_classes.astype(int), p_curve, r_curve, f1_curve, x, prec_values
 
 
+class APAccumulator:
+    """Constant-memory accumulator of detection statistics as per-class, confidence-binned histograms.
+
+    Instead of keeping every prediction until the end of validation, each batch is folded into per-class histograms of
+    prediction counts, summed confidences and true positive counts over `bins` equal-width confidence bins. Memory is
+    O(classes * bins * IoU thresholds) regardless of dataset size, and accumulators from DDP ranks or validation shards
+    can be merged by summation. `arrays()` returns one row per non-empty (class, bin) that `ap_per_class` accepts
+    through its `n` argument, giving AP equal to the exact result up to the ordering of predictions within a bin.
+
+    Attributes:
+        bins (int): Number of confidence bins over [0, 1].
+        n (np.ndarray | None): Prediction counts of shape (nc, bins).
+        conf (np.ndarray | None): Summed prediction confidences of shape (nc, bins).
+        tp (dict[str, np.ndarray]): True positive counts of shape (nc, bins, niou) for each stat key, e.g. 'tp', 'tp_m'.
+        nt (np.ndarray): Target counts per class.
+        nt_img (np.ndarray): Number of images containing each class.
+
+    Methods:
+        update: Fold a batch of detection statistics into the histograms.
+        merge: Add the histograms of other accumulators into this one.
+        arrays: Return binned statistics rows for `ap_per_class`.
+        clear: Reset all histograms.
+
+    Examples:
+        >>> acc = APAccumulator(bins=1000)
+        >>> acc.update({"tp": tp, "conf": conf, "pred_cls": pred_cls, "target_cls": target_cls, "target_img": img})
+        >>> stats = acc.arrays()
+        >>> results = ap_per_class(stats["tp"], stats["conf"], stats["pred_cls"], stats["target_cls"], n=stats["n"])
+    """
+
+    def __init__(self, bins: int = 1000) -> None:
+        """Initialize an empty accumulator.
+
+        Args:
+            bins (int): Number of equal-width confidence bins over [0, 1].
+        """
+        self.bins = bins
+        self.clear()
+
+    def clear(self) -> None:
+        """Reset all histograms."""
+        self.n, self.conf, self.tp = None, None, {}
+        self.nt, self.nt_img = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    def _grow(self, nc: int) -> None:
+        """Grow the class dimension of all histograms to at least `nc` classes."""
+        if self.n is None:
+            self.n, self.conf = np.zeros((0, self.bins), dtype=np.int64), np.zeros((0, self.bins))
+        pad = nc - len(self.n)
+        if pad > 0:
+            self.n = np.pad(self.n, ((0, pad), (0, 0)))
+            self.conf = np.pad(self.conf, ((0, pad), (0, 0)))
+            self.tp = {k: np.pad(v, ((0, pad), (0, 0), (0, 0))) for k, v in self.tp.items()}
+        for k in ("nt", "nt_img"):
+            setattr(self, k, np.pad(getattr(self, k), (0, max(nc - len(getattr(self, k)), 0))))
+
+    def update(self, stat: dict[str, np.ndarray]) -> None:
+        """Fold a batch of detection statistics into the histograms.
+
+        Args:
+            stat (dict[str, np.ndarray]): Batch statistics with 'conf', 'pred_cls', 'target_cls' and 'target_img' arrays
+                plus one (N, niou) boolean true positive array per remaining key, as in `DetMetrics.update_stats`.
+        """
+        conf, pred_cls = stat["conf"], stat["pred_cls"].astype(int)
+        target_cls, target_img = stat["target_cls"].astype(int), stat["target_img"].astype(int)
+        self._grow(max(pred_cls.max(initial=-1), target_cls.max(initial=-1), target_img.max(initial=-1)) + 1)
+        nc = len(self.n)
+        idx = pred_cls * self.bins + np.clip((conf * self.bins).astype(int), 0, self.bins - 1)  # flat (class, bin)
+        self.n += np.bincount(idx, minlength=nc * self.bins).reshape(nc, self.bins)
+        self.conf += np.bincount(idx, weights=conf, minlength=nc * self.bins).reshape(nc, self.bins)
+        for k in stat.keys() - {"conf", "pred_cls", "target_cls", "target_img"}:
+            tp, niou = stat[k], stat[k].shape[1]
+            if k not in self.tp:
+                self.tp[k] = np.zeros((nc, self.bins, niou), dtype=np.int64)
+            flat = (idx[:, None] * niou + np.arange(niou)).ravel()  # flat (class, bin, iou)
+            counts = np.bincount(flat, weights=tp.ravel(), minlength=nc * self.bins * niou)
+            self.tp[k] += counts.reshape(nc, self.bins, niou).astype(np.int64)
+        self.nt += np.bincount(target_cls, minlength=nc)
+        self.nt_img += np.bincount(target_img, minlength=nc)
+
+    def merge(self, *others: APAccumulator) -> APAccumulator:
+        """Add the histograms of other accumulators, e.g. from other DDP ranks or validation shards, into this one.
+
+        Args:
+            *others (APAccumulator): Accumulators with the same number of bins.
+
+        Returns:
+            (APAccumulator): This accumulator, updated in place.
+        """
+        for other in others:
+            assert other.bins == self.bins, f"cannot merge accumulators with {other.bins} and {self.bins} bins"
+            if other.n is None:
+                continue
+            self._grow(len(other.n))
+            other._grow(len(self.n))
+            self.n += other.n
+            self.conf += other.conf
+            for k, v in other.tp.items():
+                self.tp[k] = self.tp[k] + v if k in self.tp else v.copy()
+            self.nt += other.nt
+            self.nt_img += other.nt_img
+        return self
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Return binned statistics with one row per non-empty (class, bin), in the format `ap_per_class` accepts.
+
+        Returns:
+            (dict[str, np.ndarray]): 'tp'-like count arrays, mean 'conf', 'pred_cls' and prediction counts 'n' per row,
+                plus 'target_cls' and 'target_img' class arrays expanded from the target counts.
+        """
+        if self.n is None:
+            return {}
+        c, b = np.nonzero(self.n)
+        classes = np.arange(len(self.n))
+        return {
+            **{k: v[c, b] for k, v in self.tp.items()},
+            "conf": self.conf[c, b] / self.n[c, b],
+            "pred_cls": c,
+            "n": self.n[c, b],
+            "target_cls": np.repeat(classes, self.nt),
+            "target_img": np.repeat(classes, self.nt_img),
+        }
+
+
 class Metric(SimpleClass):
     """Class for computing evaluation metrics for Ultralytics YOLO models.
 
@@ -1016,11 +1144,13 @@ class DetMetrics(SimpleClass, DataExportMixin):
         task (str): The task type, set to 'detect'.
         stats (dict[str, list]): A dictionary containing lists for true positives, confidence scores, predicted classes,
             target classes, and target images.
+        accumulator (APAccumulator | None): Binned constant-memory statistics used instead of `stats` when `bins > 0`.
         nt_per_class: Number of targets per class.
         nt_per_image: Number of targets per image.
 
     Methods:
         update_stats: Update statistics by appending new values to existing stat collections.
+        merge_stats: Merge statistics gathered from several DDP ranks or validation shards.
         process: Process predicted results for object detection and update metrics.
         clear_stats: Clear the stored statistics.
         keys: Return a list of keys for accessing specific metrics.
@@ -1035,17 +1165,19 @@ class DetMetrics(SimpleClass, DataExportMixin):
         summary: Generate a summarized representation of per-class detection metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize a DetMetrics instance with a save directory, plot flag, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Confidence bins for constant-memory streaming accumulation, 0 for exact metrics.
         """
         self.names = names
         self.box = Metric()
         self.speed = {"preprocess": 0.0, "inference": 0.0, "loss": 0.0, "postprocess": 0.0}
         self.task = "detect"
         self.stats = dict(tp=[], conf=[], pred_cls=[], target_cls=[], target_img=[])
+        self.accumulator = APAccumulator(bins) if bins > 0 else None
         self.nt_per_class = None
         self.nt_per_image = None
 
@@ -1056,9 +1188,28 @@ class DetMetrics(SimpleClass, DataExportMixin):
             stat (dict[str, any]): Dictionary containing new statistical values to append. Keys should match existing
                 keys in self.stats.
         """
+        if self.accumulator is not None:
+            self.accumulator.update({k: stat[k] for k in self.stats.keys()})
+            return
         for k in self.stats.keys():
             self.stats[k].append(stat[k])
 
+    def merge_stats(self, gathered: list[dict[str, list] | APAccumulator]) -> None:
+        """Merge statistics gathered from several DDP ranks or validation shards into this instance.
+
+        Args:
+            gathered (list[dict[str, list] | APAccumulator]): `stats` dicts, or accumulators in streaming mode,
+                including this instance's own.
+        """
+        if self.accumulator is not None:
+            self.accumulator = APAccumulator(self.accumulator.bins).merge(*gathered)
+            return
+        merged = {key: [] for key in self.stats.keys()}
+        for stats in gathered:
+            for key in merged:
+                merged[key].extend(stats[key])
+        self.stats = merged
+
     def process(self, save_dir: Path = Path("."), plot: bool = False, on_plot=None) -> dict[str, np.ndarray]:
         """Process predicted results for object detection and update metrics.
 
@@ -1070,7 +1221,10 @@ class DetMetrics(SimpleClass, DataExportMixin):
         Returns:
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
         """
-        stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
+        if self.accumulator is not None:
+            stats = self.accumulator.arrays()
+        else:
+            stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
         if not stats:
             return stats
         results = ap_per_class(
@@ -1083,6 +1237,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
             names=self.names,
             on_plot=on_plot,
             prefix="Box",
+            n=stats.get("n"),
         )[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
@@ -1094,6 +1249,8 @@ class DetMetrics(SimpleClass, DataExportMixin):
         """Clear the stored statistics."""
         for v in self.stats.values():
             v.clear()
+        if self.accumulator is not None:
+            self.accumulator.clear()
 
     @property
     def keys(self) -> list[str]:
@@ -1201,13 +1358,14 @@ class SegmentMetrics(DetMetrics):
         summary: Generate a summarized representation of per-class segmentation metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize a SegmentMetrics instance with a save directory, plot flag, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Confidence bins for constant-memory streaming accumulation, 0 for exact metrics.
         """
-        DetMetrics.__init__(self, names)
+        DetMetrics.__init__(self, names, bins)
         self.seg = Metric()
         self.task = "segment"
         self.stats["tp_m"] = []  # add additional stats for masks
@@ -1234,6 +1392,7 @@ class SegmentMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Mask",
+            n=stats.get("n"),
         )[2:]
         self.seg.nc = len(self.names)
         self.seg.update(results_mask)
@@ -1339,13 +1498,14 @@ class PoseMetrics(DetMetrics):
         summary: Generate a summarized representation of per-class pose metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize the PoseMetrics class with directory path, class names, and plotting options.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Confidence bins for constant-memory streaming accumulation, 0 for exact metrics.
         """
-        super().__init__(names)
+        super().__init__(names, bins)
         self.pose = Metric()
         self.task = "pose"
         self.stats["tp_p"] = []  # add additional stats for pose
@@ -1372,6 +1532,7 @@ class PoseMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Pose",
+            n=stats.get("n"),
         )[2:]
         self.pose.nc = len(self.names)
         self.pose.update(results_pose)
@@ -1552,12 +1713,13 @@ class OBBMetrics(DetMetrics):
         https://arxiv.org/pdf/2106.06072.pdf
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize an OBBMetrics instance with directory, plotting, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Confidence bins for constant-memory streaming accumulation, 0 for exact metrics.
         """
-        DetMetrics.__init__(self, names)
+        DetMetrics.__init__(self, names, bins)
         # TODO: probably remove task as well
         self.task = "obb"
@@ -149,6 +149,26 @@ def make_divisible(x: int, divisor):
     return math.ceil(x / divisor) * divisor
 
 
+def tile_grid(shape: tuple[int, int], size: int, overlap: float = 0.0) -> np.ndarray:
+    """Return overlapping, equal-size tiles that cover an image.
+
+    The last row and column of tiles are shifted to end at the image border so every tile has the same size, and
+    image sides shorter than a tile form a single tile along that side.
+
+    Args:
+        shape (tuple[int, int]): Image shape (height, width).
+        size (int): Tile side length in pixels.
+        overlap (float): Fractional overlap between neighboring tiles.
+
+    Returns:
+        (np.ndarray): Tile boxes of shape (T, 4) as (x0, y0, x1, y1) pixel coordinates, in row-major order.
+    """
+    step = max(round(size * (1 - overlap)), 1)
+    y0, x0 = np.meshgrid(*([0] if n <= size else [*range(0, n - size, step), n - size] for n in shape), indexing="ij")
+    x0, y0 = x0.ravel(), y0.ravel()
+    return np.stack((x0, y0, np.minimum(x0 + size, shape[1]), np.minimum(y0 + size, shape[0])), 1)
+
+
 def clip_boxes(boxes, shape):
     """Clip bounding boxes to image boundaries.
 
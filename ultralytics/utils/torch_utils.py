@@ -616,13 +616,14 @@ class ModelEMA:
         updates (int): Number of EMA updates.
         decay (function): Decay function that determines the EMA weight.
         enabled (bool): Whether EMA is enabled.
+        interval (int): Number of updates between EMA steps, each applying the decay of all steps since the last one.
 
     References:
         - https://github.com/rwightman/pytorch-image-models
         - https://www.tensorflow.org/api_docs/python/tf/train/ExponentialMovingAverage
     """
 
-    def __init__(self, model, decay=0.9999, tau=2000, updates=0):
+    def __init__(self, model, decay=0.9999, tau=2000, updates=0, interval=1):
         """Initialize EMA for 'model' with given arguments.
 
         Args:
@@ -630,6 +631,7 @@ class ModelEMA:
             decay (float, optional): Maximum EMA decay rate.
             tau (int, optional): EMA decay time constant.
             updates (int, optional): Initial number of updates.
+            interval (int, optional): Apply the EMA every `interval` updates.
         """
         self.ema = deepcopy(unwrap_model(model)).eval()  # FP32 EMA
         self.updates = updates  # number of EMA updates
@@ -637,6 +639,23 @@ class ModelEMA:
         for p in self.ema.parameters():
             p.requires_grad_(False)
         self.enabled = True
+        self.interval = max(int(interval), 1)
+        self._pending = 1.0  # product of the decays of updates not yet applied
+        self._model, self._slots = None, []
+
+    def _build_slots(self, model):
+        """Pair the floating point state_dict entries of the EMA and `model` as (ema dict, model dict, key) slots.
+
+        The parameter and buffer dicts of each module are stable, so tensors are looked up by key on every step and
+        conversions replacing them, i.e. `half()` during validation, need no rebuild.
+        """
+        modules = dict(model.named_modules())
+        self._model, self._slots = model, []
+        for name, m in self.ema.named_modules():
+            for attr in ("_parameters", "_buffers"):
+                for k, v in getattr(m, attr).items():
+                    if v is not None and v.dtype.is_floating_point and k not in m._non_persistent_buffers_set:
+                        self._slots.append((getattr(m, attr), getattr(modules[name], attr), k))
 
     def update(self, model):
         """Update EMA parameters.
@@ -646,24 +665,34 @@ class ModelEMA:
         """
         if self.enabled:
             self.updates += 1
-            d = self.decay(self.updates)
-
-            msd = unwrap_model(model).state_dict()  # model state_dict
-            for k, v in self.ema.state_dict().items():
-                if v.dtype.is_floating_point:  # true for FP16 and FP32
-                    v *= d
-                    v += (1 - d) * msd[k].detach()
-                    # assert v.dtype == msd[k].dtype == torch.float32, f'{k}: EMA {v.dtype},  model {msd[k].dtype}'
+            self._pending *= self.decay(self.updates)
+            if self.updates % self.interval == 0:
+                self._apply(model)
+
+    @torch.no_grad()
+    def _apply(self, model):
+        """Blend `model` into the EMA with the decay accumulated since the last step, using foreach kernels."""
+        d, self._pending = self._pending, 1.0
+        model = unwrap_model(model)
+        if model is not self._model:
+            self._build_slots(model)
+        ema = [e[k] for e, _, k in self._slots]
+        torch._foreach_mul_(ema, d)
+        torch._foreach_add_(ema, [m[k] for _, m, k in self._slots], alpha=1 - d)
 
     def update_attr(self, model, include=(), exclude=("process_group", "reducer")):
         """Update attributes and save stripped model with optimizer removed.
 
+        Any updates pending with `interval > 1` are applied first, so the EMA is current when validated or saved.
+
         Args:
             model (nn.Module): Model to update attributes from.
             include (tuple, optional): Attributes to include.
             exclude (tuple, optional): Attributes to exclude.
         """
         if self.enabled:
+            if self._pending != 1.0:
+                self._apply(model)
             copy_attr(self.ema, model, include, exclude)
 
 